@@ -0,0 +1,37 @@
+"""
+⏱️ BENCHMARKS DE LOS FRAMEWORKS ÉTICOS
+======================================
+
+Mediciones de rendimiento del paquete `marcos_eticos`.
+
+Uso (desde el directorio `code/`):
+    python -m benchmarks               # suite completa con líneas base
+    python -m benchmarks.marcadores    # detección de palabras clave
+    python -m benchmarks.importacion   # tiempo de importación (también en la suite)
+    python -m benchmarks.asincrono     # fachada asyncio bajo ráfagas
+    python -m benchmarks.auditoria     # registro de auditoría binario frente a JSON
+    python -m benchmarks.compartido    # memoria compartida en la evaluación paralela
+    python -m benchmarks.servidor      # prueba de carga del servidor local
+
+- escenarios.py: generador de escenarios sintéticos con semilla
+- casos.py: casos de benchmark por framework
+- __main__.py: ejecutor, métricas y comparación con la línea base
+- importacion.py: `python -X importtime` en procesos nuevos
+- asincrono.py: micro-lotes frente a evaluar en el bucle o en hilos
+- auditoria.py: escritura y consultas del registro de auditoría
+- compartido.py: copias serializadas frente a memoria compartida
+- servidor.py: peticiones por segundo y latencias del servidor local
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+DIRECTORIO_CÓDIGO = Path(__file__).resolve().parent.parent
+
+
+def cargar_módulo():
+    """Importa el paquete `marcos_eticos` desde `code/`"""
+    if str(DIRECTORIO_CÓDIGO) not in sys.path:
+        sys.path.insert(0, str(DIRECTORIO_CÓDIGO))
+    return importlib.import_module("marcos_eticos")
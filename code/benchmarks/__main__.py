@@ -0,0 +1,193 @@
+"""
+Ejecutor de la suite de benchmarks.
+
+Uso (desde el directorio `code/`):
+    python -m benchmarks                      # ejecutar y comparar con la base
+    python -m benchmarks --guardar-base       # fijar la línea base
+    python -m benchmarks --casos utilitarismo --escala 0.1
+
+Por cada caso informa rendimiento (acciones/s), latencia por llamada
+(p50, p90, p99) y pico de memoria. Después mide el tiempo de importación
+de los casos de `benchmarks.importacion` (`python -X importtime` en
+procesos nuevos). Las líneas base se guardan por máquina; si un caso
+empeora más que `--umbral` respecto a la suya, o si un camino escalar
+carga NumPy, el proceso termina con código 1.
+"""
+
+import argparse
+import dataclasses
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks import cargar_módulo, importacion
+from benchmarks.casos import CASOS, PARÁMETROS
+from benchmarks.escenarios import generar_escenario
+
+RUTA_BASE = Path(__file__).resolve().parent / "líneas_base.json"
+
+# Los tiempos de importación de pocos milisegundos fluctúan más que el
+# umbral: se tolera además esta diferencia absoluta
+_HOLGURA_IMPORTACIÓN_MS = 2.0
+
+
+def percentil(valores, p: float) -> float:
+    ordenados = sorted(valores)
+    índice = min(len(ordenados) - 1, max(0, round(p / 100 * (len(ordenados) - 1))))
+    return ordenados[índice]
+
+
+def medir_caso(m, nombre: str, escala: float) -> dict:
+    parámetros = PARÁMETROS[nombre]
+    parámetros = dataclasses.replace(
+        parámetros, n_acciones=max(1, int(parámetros.n_acciones * escala))
+    )
+    escenario = generar_escenario(m, parámetros)
+    llamadas, acciones_por_llamada = CASOS[nombre](m, escenario)
+    
+    # Calentamiento
+    llamadas[0]()
+    
+    latencias = []
+    inicio = time.perf_counter()
+    for llamada in llamadas:
+        t0 = time.perf_counter()
+        llamada()
+        latencias.append(time.perf_counter() - t0)
+    total = time.perf_counter() - inicio
+    
+    # La memoria se mide aparte: tracemalloc distorsiona los tiempos
+    tracemalloc.start()
+    for llamada in llamadas[:min(len(llamadas), 100)]:
+        llamada()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {
+        "acciones_por_segundo": len(llamadas) * acciones_por_llamada / total,
+        "latencia_p50_ms": percentil(latencias, 50) * 1e3,
+        "latencia_p90_ms": percentil(latencias, 90) * 1e3,
+        "latencia_p99_ms": percentil(latencias, 99) * 1e3,
+        "memoria_pico_kb": pico / 1024,
+    }
+
+
+def medir_importación(nombre: str, al_arrancar: set, repeticiones: int) -> dict:
+    código, numpy_permitido = importacion.CASOS[nombre]
+    ms, numpy = importacion.medir(código, al_arrancar, repeticiones)
+    return {"importación_ms": ms, "numpy": numpy, "numpy_permitido": numpy_permitido}
+
+
+def identificador_máquina() -> str:
+    return f"{platform.node()}|{platform.machine()}|py{platform.python_version()}"
+
+
+def regresiones(actual: dict, base: dict, umbral: float) -> list:
+    """Métricas que empeoran más que el umbral (fracción)"""
+    peores = []
+    if "importación_ms" in actual:
+        límite = base["importación_ms"] * (1 + umbral) + _HOLGURA_IMPORTACIÓN_MS
+        if actual["importación_ms"] > límite:
+            peores.append("importación_ms")
+        return peores
+    if actual["acciones_por_segundo"] < base["acciones_por_segundo"] * (1 - umbral):
+        peores.append("acciones_por_segundo")
+    for métrica in ("latencia_p50_ms", "memoria_pico_kb"):
+        if actual[métrica] > base[métrica] * (1 + umbral):
+            peores.append(métrica)
+    return peores
+
+
+def main(argumentos=None) -> int:
+    analizador = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    analizador.add_argument("--casos", help="Solo los casos que contengan este texto")
+    analizador.add_argument(
+        "--escala", type=float, default=1.0,
+        help="Multiplica el número de acciones de cada escenario"
+    )
+    analizador.add_argument(
+        "--umbral", type=float, default=0.25,
+        help="Empeoramiento tolerado respecto a la base (fracción)"
+    )
+    analizador.add_argument(
+        "--repeticiones-importación", type=int, default=5,
+        help="Procesos por caso de importación (0 = no medir la importación)"
+    )
+    analizador.add_argument("--base", type=Path, default=RUTA_BASE)
+    analizador.add_argument("--guardar-base", action="store_true")
+    analizador.add_argument("--json", type=Path, help="Guardar resultados en este archivo")
+    args = analizador.parse_args(argumentos)
+    
+    m = cargar_módulo()
+    nombres = [n for n in CASOS if not args.casos or args.casos in n]
+    
+    bases = json.loads(args.base.read_text(encoding="utf-8")) if args.base.exists() else {}
+    máquina = identificador_máquina()
+    base_máquina = bases.get(máquina, {})
+    
+    resultados = {}
+    fallos = []
+    if nombres:
+        print(f"{'caso':<46} {'acc/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'pico KB':>9}")
+    for nombre in nombres:
+        resultado = medir_caso(m, nombre, args.escala)
+        resultados[nombre] = resultado
+        
+        peores = []
+        if not args.guardar_base and nombre in base_máquina:
+            peores = regresiones(resultado, base_máquina[nombre], args.umbral)
+            fallos.extend(f"{nombre}: {métrica}" for métrica in peores)
+        
+        print(
+            f"{nombre:<46} {resultado['acciones_por_segundo']:>10.0f} "
+            f"{resultado['latencia_p50_ms']:>9.3f} {resultado['latencia_p99_ms']:>9.3f} "
+            f"{resultado['memoria_pico_kb']:>9.0f}"
+            + ("  ⚠️ REGRESIÓN" if peores else "")
+        )
+    
+    nombres_importación = [
+        n for n in importacion.CASOS
+        if args.repeticiones_importación > 0 and (not args.casos or args.casos in f"importación: {n}")
+    ]
+    if nombres_importación:
+        al_arrancar = set(importacion.módulos_importados("pass"))
+        print(("\n" if nombres else "") + f"{'importación':<46} {'ms':>10} {'numpy':>9}")
+    for nombre in nombres_importación:
+        resultado = medir_importación(nombre, al_arrancar, args.repeticiones_importación)
+        clave = f"importación: {nombre}"
+        resultados[clave] = resultado
+        
+        peores = []
+        if resultado["numpy"] and not resultado["numpy_permitido"]:
+            peores.append("importa NumPy")
+        if not args.guardar_base and clave in base_máquina:
+            peores += regresiones(resultado, base_máquina[clave], args.umbral)
+        fallos.extend(f"{clave}: {métrica}" for métrica in peores)
+        
+        print(
+            f"{nombre:<46} {resultado['importación_ms']:>10.1f} "
+            f"{'sí' if resultado['numpy'] else 'no':>9}"
+            + ("  ⚠️ REGRESIÓN" if peores else "")
+        )
+    
+    if args.json:
+        args.json.write_text(json.dumps(resultados, indent=2, ensure_ascii=False))
+    
+    if args.guardar_base:
+        bases[máquina] = {**base_máquina, **resultados}
+        args.base.write_text(json.dumps(bases, indent=2, ensure_ascii=False))
+        print(f"\nLínea base guardada para {máquina}")
+    
+    if fallos:
+        print(f"\n{len(fallos)} regresiones por encima del {args.umbral:.0%}:", file=sys.stderr)
+        for fallo in fallos:
+            print(f"  {fallo}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
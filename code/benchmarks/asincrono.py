@@ -0,0 +1,134 @@
+"""
+Benchmark de la fachada asyncio bajo ráfagas.
+
+Simula un servicio que recibe ráfagas de peticiones de una acción cada
+una y compara tres formas de atenderlas:
+1. En el bucle: `evaluar_decisión_compleja` directamente en la corrutina
+   (bloquea el bucle de eventos mientras evalúa).
+2. Un hilo por petición: `asyncio.to_thread` alrededor de lo mismo.
+3. Micro-lotes: `EvaluadorAsíncrono`.
+
+Informa rendimiento, latencia por petición (p50, p99) y el mayor retraso
+de un latido de 1 ms del bucle, que mide cuánto se bloquea el servicio.
+
+Uso (desde el directorio `code/`):
+    python -m benchmarks.asincrono --ráfagas 20 --tamaño-ráfaga 200
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks import cargar_módulo
+from benchmarks.__main__ import percentil
+from benchmarks.escenarios import Parámetros, generar_escenario
+
+
+async def latido(retrasos: list, parar: asyncio.Event, periodo: float = 0.001):
+    """Anota cuánto tarda el bucle en despertar a una corrutina que duerme `periodo`"""
+    while not parar.is_set():
+        antes = time.perf_counter()
+        await asyncio.sleep(periodo)
+        retrasos.append(time.perf_counter() - antes - periodo)
+
+
+async def medir(evaluar, escenario, ráfagas: int, tamaño_ráfaga: int, pausa: float) -> dict:
+    # Calentamiento: la primera evaluación por lotes importa NumPy
+    await evaluar(escenario.acciones[0], escenario.stakeholders, escenario.contexto)
+    
+    latencias = []
+    retrasos = []
+    parar = asyncio.Event()
+    pulso = asyncio.create_task(latido(retrasos, parar))
+    
+    async def petición(acción, llegada: float):
+        await evaluar(acción, escenario.stakeholders, escenario.contexto)
+        latencias.append(time.perf_counter() - llegada)
+    
+    inicio = time.perf_counter()
+    tareas = []
+    for ráfaga in range(ráfagas):
+        desde = ráfaga * tamaño_ráfaga % len(escenario.acciones)
+        # La latencia se cuenta desde que llega la ráfaga, no desde que el
+        # bucle consigue atender cada petición
+        llegada = time.perf_counter()
+        tareas += [
+            asyncio.create_task(petición(acción, llegada))
+            for acción in escenario.acciones[desde:desde + tamaño_ráfaga]
+        ]
+        await asyncio.sleep(pausa)
+    await asyncio.gather(*tareas)
+    total = time.perf_counter() - inicio
+    
+    parar.set()
+    await pulso
+    return {
+        "peticiones_por_segundo": len(latencias) / total,
+        "latencia_p50_ms": percentil(latencias, 50) * 1e3,
+        "latencia_p99_ms": percentil(latencias, 99) * 1e3,
+        "bloqueo_máximo_ms": max(retrasos, default=0.0) * 1e3,
+    }
+
+
+async def comparar(m, escenario, args):
+    sabiduría = m.SabiduríaPráctica()
+    
+    async def en_el_bucle(acción, stakeholders, contexto):
+        return sabiduría.evaluar_decisión_compleja(acción, stakeholders, contexto)
+    
+    async def hilo_por_petición(acción, stakeholders, contexto):
+        return await asyncio.to_thread(
+            sabiduría.evaluar_decisión_compleja, acción, stakeholders, contexto
+        )
+    
+    resultados = {}
+    for nombre, evaluar in (("en el bucle", en_el_bucle), ("hilo por petición", hilo_por_petición)):
+        resultados[nombre] = await medir(
+            evaluar, escenario, args.ráfagas, args.tamaño_ráfaga, args.pausa
+        )
+    
+    async with m.EvaluadorAsíncrono(
+        tamaño_lote=args.tamaño_lote,
+        espera_máxima=args.espera_máxima,
+        workers=args.workers,
+        compacto=args.compacto
+    ) as evaluador:
+        resultados["micro-lotes"] = await medir(
+            evaluador.evaluar_async, escenario, args.ráfagas, args.tamaño_ráfaga, args.pausa
+        )
+        tamaño_medio = evaluador.tamaño_medio_lote
+    return resultados, tamaño_medio
+
+
+def main(argumentos=None):
+    analizador = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    analizador.add_argument("--ráfagas", type=int, default=20)
+    analizador.add_argument("--tamaño-ráfaga", type=int, default=200)
+    analizador.add_argument(
+        "--pausa", type=float, default=0.05, help="Segundos entre ráfagas"
+    )
+    analizador.add_argument("--tamaño-lote", type=int, default=64)
+    analizador.add_argument("--espera-máxima", type=float, default=0.002)
+    analizador.add_argument("--workers", type=int, default=1)
+    analizador.add_argument(
+        "--compacto", action="store_true",
+        help="Micro-lotes con ResultadoAnálisis en lugar de dicts"
+    )
+    args = analizador.parse_args(argumentos)
+    
+    m = cargar_módulo()
+    escenario = generar_escenario(m, Parámetros(n_acciones=args.ráfagas * args.tamaño_ráfaga))
+    resultados, tamaño_medio = asyncio.run(comparar(m, escenario, args))
+    
+    print(f"{'estrategia':<20} {'pet/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'bloqueo ms':>11}")
+    for nombre, r in resultados.items():
+        print(
+            f"{nombre:<20} {r['peticiones_por_segundo']:>10.0f} "
+            f"{r['latencia_p50_ms']:>9.1f} {r['latencia_p99_ms']:>9.1f} "
+            f"{r['bloqueo_máximo_ms']:>11.1f}"
+        )
+    print(f"\nTamaño medio de micro-lote: {tamaño_medio:.1f}")
+
+
+if __name__ == "__main__":
+    main()
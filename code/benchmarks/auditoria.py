@@ -0,0 +1,101 @@
+"""
+Benchmark del registro de auditoría.
+
+Compara dos formas de guardar cada resultado de
+`evaluar_decisión_compleja`:
+1. JSON: una línea por análisis con el dict completo (lo que se hacía).
+2. Binario: `RegistroAuditoría`, registros de 64 bytes por lotes.
+
+Informa µs y bytes por registro al escribir, y cuánto cuesta después
+contar los análisis con acciones problemáticas (releyendo el JSON frente a
+`LectorAuditoría` sobre los segmentos proyectados en memoria), en todo el
+registro y, en el binario, en la segunda mitad por tiempo.
+Los análisis se calculan antes: solo se mide el registro.
+
+Uso (desde el directorio `code/`):
+    python -m benchmarks.auditoria --acciones 20000 --fsync lote
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks import cargar_módulo
+from benchmarks.escenarios import Parámetros, generar_escenario
+
+
+def escribir_json(ruta: Path, análisis: list) -> None:
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for a in análisis:
+            archivo.write(json.dumps({"instante": time.time(), **a}, ensure_ascii=False) + "\n")
+
+
+def consultar_json(ruta: Path, bandera: str) -> int:
+    with open(ruta, encoding="utf-8") as archivo:
+        return sum(bandera in json.loads(línea)["banderas_rojas"] for línea in archivo)
+
+
+def main(argumentos=None):
+    analizador = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    analizador.add_argument("--acciones", type=int, default=20000)
+    analizador.add_argument("--fsync", default="lote", choices=("nunca", "lote", "segmento"))
+    analizador.add_argument("--tamaño-lote", type=int, default=4096)
+    args = analizador.parse_args(argumentos)
+    
+    m = cargar_módulo()
+    escenario = generar_escenario(m, Parámetros(n_acciones=args.acciones))
+    sabiduría = m.SabiduríaPráctica()
+    análisis = [
+        sabiduría.evaluar_decisión_compleja(a, escenario.stakeholders, escenario.contexto)
+        for a in escenario.acciones
+    ]
+    n = len(análisis)
+    
+    with tempfile.TemporaryDirectory() as directorio:
+        directorio = Path(directorio)
+        
+        inicio = time.perf_counter()
+        escribir_json(directorio / "auditoria.jsonl", análisis)
+        segundos_json = time.perf_counter() - inicio
+        bytes_json = (directorio / "auditoria.jsonl").stat().st_size
+        
+        inicio = time.perf_counter()
+        with m.RegistroAuditoría(
+            directorio / "binario", tamaño_lote=args.tamaño_lote, fsync=args.fsync
+        ) as registro:
+            for acción, a in zip(escenario.acciones, análisis):
+                registro.registrar(acción, a)
+        segundos_binario = time.perf_counter() - inicio
+        bytes_binario = sum(p.stat().st_size for p in (directorio / "binario").iterdir())
+        
+        inicio = time.perf_counter()
+        cuenta_json = consultar_json(
+            directorio / "auditoria.jsonl", m.Bandera.PROBLEMÁTICA.textos()[0]
+        )
+        segundos_consulta_json = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter()
+        lector = m.LectorAuditoría(directorio / "binario")
+        cuenta_binario = len(lector.consultar(banderas=m.Bandera.PROBLEMÁTICA))
+        segundos_consulta_binario = time.perf_counter() - inicio
+        
+        desde = lector.segmentos[0]["instante"][n // 2] / 1e9
+        inicio = time.perf_counter()
+        cuenta_mitad = len(lector.consultar(desde=desde, banderas=m.Bandera.PROBLEMÁTICA))
+        segundos_consulta_mitad = time.perf_counter() - inicio
+    
+    print(f"{n} análisis, fsync={args.fsync}")
+    print(f"{'formato':<10} {'µs/registro':>12} {'bytes/registro':>15} {'consulta ms':>12}")
+    print(f"{'JSON':<10} {segundos_json / n * 1e6:>12.1f} {bytes_json / n:>15.0f} "
+          f"{segundos_consulta_json * 1e3:>12.1f}")
+    print(f"{'binario':<10} {segundos_binario / n * 1e6:>12.1f} {bytes_binario / n:>15.0f} "
+          f"{segundos_consulta_binario * 1e3:>12.1f}")
+    print(f"{'  2ª mitad':<10} {'':>12} {'':>15} {segundos_consulta_mitad * 1e3:>12.1f}")
+    print(f"\nProblemáticas: {cuenta_json} (JSON), {cuenta_binario} (binario), "
+          f"{cuenta_mitad} en la segunda mitad")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Casos de benchmark, al estilo de asv.
+
+Cada caso recibe el módulo y un escenario y devuelve una lista de
+llamadas independientes (sin argumentos) junto con el número de acciones
+que procesa cada una. El ejecutor mide cada llamada por separado.
+"""
+
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.escenarios import Parámetros
+
+Llamadas = Tuple[List[Callable[[], object]], int]
+
+CASOS: Dict[str, Callable] = {}
+
+# Escenario por defecto de cada caso (se puede escalar desde el ejecutor)
+PARÁMETROS: Dict[str, Parámetros] = {}
+
+
+def caso(nombre: str, parámetros: Parámetros = None):
+    """Registra un caso de benchmark"""
+    def registrar(función):
+        CASOS[nombre] = función
+        PARÁMETROS[nombre] = parámetros or Parámetros()
+        return función
+    return registrar
+
+
+def _por_acción(escenario, evaluar: Callable) -> Llamadas:
+    """Una llamada por acción del escenario"""
+    return [lambda a=a: evaluar(a) for a in escenario.acciones], 1
+
+
+@caso("utilitarismo.evaluar_acción")
+def utilitarismo_evaluar(m, escenario) -> Llamadas:
+    u = m.Utilitarismo()
+    return _por_acción(escenario, lambda a: u.evaluar_acción(a, escenario.stakeholders))
+
+
+@caso("utilitarismo.elegir_mejor_acción")
+def utilitarismo_elegir(m, escenario) -> Llamadas:
+    u = m.Utilitarismo()
+    llamada = lambda: u.elegir_mejor_acción(escenario.acciones, escenario.stakeholders)
+    return [llamada] * 10, len(escenario.acciones)
+
+
+@caso("utilitarismo.elegir_mejor_acción (poda)")
+def utilitarismo_elegir_poda(m, escenario) -> Llamadas:
+    u = m.Utilitarismo()
+    llamada = lambda: u.elegir_mejor_acción(
+        escenario.acciones, escenario.stakeholders, podar=True
+    )
+    return [llamada] * 10, len(escenario.acciones)
+
+
+@caso("deontología.evaluar_acción")
+def deontología_evaluar(m, escenario) -> Llamadas:
+    d = m.Deontología()
+    return _por_acción(escenario, lambda a: d.evaluar_acción(a, escenario.contexto))
+
+
+@caso("deontología.evaluar_lote")
+def deontología_lote(m, escenario) -> Llamadas:
+    # Marcadores detectados de antemano y un contexto por acción: mide solo
+    # las máscaras de reglas, excepciones y scores
+    d = m.Deontología()
+    tabla = m.TablaAcciones.desde_lista(escenario.acciones)
+    coincidencias = [d._detector.coincidencias(texto) for texto in tabla.descripciones]
+    contextos = [escenario.contexto if i % 2 else {} for i in range(len(tabla))]
+    llamada = lambda: d.evaluar_lote(tabla, contextos, coincidencias)
+    return [llamada] * 5, len(escenario.acciones)
+
+
+@caso("virtud.evaluar_acción")
+def virtud_evaluar(m, escenario) -> Llamadas:
+    v = m.ÉticaVirtud()
+    return _por_acción(escenario, v.evaluar_acción)
+
+
+@caso("cuidado.evaluar_acción")
+def cuidado_evaluar(m, escenario) -> Llamadas:
+    c = m.ÉticaCuidado()
+    return _por_acción(escenario, lambda a: c.evaluar_acción(a, escenario.red_relaciones))
+
+
+@caso("sabiduría.evaluar_decisión_compleja")
+def sabiduría_evaluar(m, escenario) -> Llamadas:
+    s = m.SabiduríaPráctica()
+    return _por_acción(escenario, lambda a: s.evaluar_decisión_compleja(
+        a, escenario.stakeholders, escenario.contexto, escenario.red_relaciones
+    ))
+
+
+@caso("sabiduría.evaluar_decisión (caché caliente)")
+def sabiduría_evaluar_caché(m, escenario) -> Llamadas:
+    # Todo acierta: debe salir más barato que sin caché
+    s = m.SabiduríaPráctica(caché=m.CachéEvaluaciones())
+    evaluar = lambda a: s.evaluar_decisión_compleja(
+        a, escenario.stakeholders, escenario.contexto, escenario.red_relaciones
+    )
+    for acción in escenario.acciones:
+        evaluar(acción)
+    return _por_acción(escenario, evaluar)
+
+
+@caso("sabiduría.evaluar_lote")
+def sabiduría_lote(m, escenario) -> Llamadas:
+    s = m.SabiduríaPráctica()
+    tabla = m.TablaAcciones.desde_lista(escenario.acciones)
+    llamada = lambda: s.evaluar_lote(
+        tabla, escenario.stakeholders, escenario.contexto, escenario.red_relaciones
+    )
+    return [llamada] * 5, len(escenario.acciones)
+
+
+@caso("sabiduría.evaluar_lote_compacto")
+def sabiduría_lote_compacto(m, escenario) -> Llamadas:
+    s = m.SabiduríaPráctica()
+    tabla = m.TablaAcciones.desde_lista(escenario.acciones)
+    llamada = lambda: s.evaluar_lote_compacto(
+        tabla, escenario.stakeholders, escenario.contexto, escenario.red_relaciones
+    )
+    return [llamada] * 5, len(escenario.acciones)
+
+
+@caso(
+    "detector.coincidencias (descripciones largas)",
+    Parámetros(n_acciones=200, palabras_por_descripción=3000),
+)
+def detector_coincidencias(m, escenario) -> Llamadas:
+    detector = m.SabiduríaPráctica()._detector
+    return [
+        lambda d=a.descripción: detector.coincidencias(d)
+        for a in escenario.acciones
+    ], 1
+
+
+@caso("planificador.planificar (profundidad 5)", Parámetros(n_acciones=500))
+def planificador_planificar(m, escenario) -> Llamadas:
+    p = m.PlanificadorSecuencial(
+        escenario.acciones, escenario.stakeholders, escenario.contexto, escenario.red_relaciones
+    )
+    
+    def llamada():
+        # Solo la búsqueda: sin estados memorizados de llamadas anteriores
+        p._memoria.clear()
+        return p.planificar(profundidad=5, anchura=32)
+    return [llamada] * 10, len(escenario.acciones)
+
+
+@caso("universalización.simular (1M agentes)", Parámetros(n_acciones=4))
+def universalización_simular(m, escenario) -> Llamadas:
+    simulador = m.SimuladorUniversalización()
+    máximas = [
+        m.Máxima(), m.Máxima(engaño=1.0), m.Máxima(violencia=1.0), m.Máxima(efecto=0.5)
+    ]
+    # Una simulación por llamada, sin pasar por la memoria de máximas
+    return [lambda máxima=máxima: simulador._simular(máxima) for máxima in máximas], 1
+
+
+@caso("planificador.planes (memoria llena)", Parámetros(n_acciones=60))
+def planificador_planes(m, escenario) -> Llamadas:
+    # Modo anytime con una memoria pequeña: cada llamada la vacía varias
+    # veces a mitad de un haz, con aciertos del propio haz
+    p = m.PlanificadorSecuencial(
+        escenario.acciones, escenario.stakeholders, escenario.contexto, escenario.red_relaciones
+    )
+    list(p.planes(profundidad=5, anchura=8, anchura_máxima=256))
+    # Un tercio de los estados que visita la búsqueda, sea cual sea la escala
+    p.MEMORIA_MÁXIMA = max(1, p.estados_evaluados // 3)
+    
+    def llamada():
+        p._memoria.clear()
+        evaluados = p.estados_evaluados
+        planes = list(p.planes(profundidad=5, anchura=8, anchura_máxima=256))
+        assert p.estados_evaluados - evaluados > p.MEMORIA_MÁXIMA, "la memoria no llegó a vaciarse"
+        return planes
+    return [llamada] * 5, len(escenario.acciones)
@@ -0,0 +1,86 @@
+"""
+Benchmark de la memoria compartida en la evaluación paralela.
+
+Compara `evaluar_decisiones` con varios procesos en dos modos:
+1. Copias: cada proceso recibe su copia serializada de los stakeholders
+   y cada trozo viaja como una tabla serializada (lo de siempre).
+2. Compartida: `memoria_compartida=True`; stakeholders y acciones se
+   publican una vez y a cada trozo le basta una referencia.
+
+Informa el tiempo total, los bytes que se serializan hacia los procesos
+(configuración por proceso más trozos) y cuánto cuesta publicar una
+versión nueva.
+
+Uso (desde el directorio `code/`):
+    python -m benchmarks.compartido --acciones 20000 --stakeholders 20000 --workers 4
+"""
+
+import argparse
+import pickle
+import time
+
+from benchmarks import cargar_módulo
+from benchmarks.escenarios import Parámetros, generar_escenario
+
+
+def bytes_enviados(m, tabla, stakeholders, workers: int, chunk_size: int) -> int:
+    """Lo que se serializa hacia los procesos con la configuración y los trozos dados"""
+    configuración = len(pickle.dumps(stakeholders)) * workers
+    return configuración + sum(
+        len(pickle.dumps(trozo)) for trozo in m.paralelo._trozos(tabla, chunk_size)
+    )
+
+
+def main(argumentos=None):
+    analizador = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    analizador.add_argument("--acciones", type=int, default=20000)
+    analizador.add_argument("--stakeholders", type=int, default=20000)
+    analizador.add_argument("--workers", type=int, default=4)
+    analizador.add_argument("--chunk-size", type=int, default=256)
+    args = analizador.parse_args(argumentos)
+    
+    m = cargar_módulo()
+    escenario = generar_escenario(
+        m, Parámetros(n_acciones=args.acciones, n_stakeholders=args.stakeholders)
+    )
+    sabiduría = m.SabiduríaPráctica()
+    tabla = m.TablaAcciones.desde_lista(escenario.acciones)
+    stakeholders = m.TablaStakeholders.desde_lista(escenario.stakeholders)
+    
+    filas = []
+    for modo, compartida in (("copias", False), ("compartida", True)):
+        inicio = time.perf_counter()
+        n = sum(1 for _ in sabiduría.evaluar_decisiones(
+            tabla, stakeholders, escenario.contexto,
+            workers=args.workers, chunk_size=args.chunk_size,
+            memoria_compartida=compartida
+        ))
+        segundos = time.perf_counter() - inicio
+        
+        if compartida:
+            with m.AlmacénCompartido() as almacén:
+                referencia = almacén.publicar(stakeholders, tabla)
+                enviados = bytes_enviados(m, referencia, referencia, args.workers, args.chunk_size)
+        else:
+            enviados = bytes_enviados(m, tabla, stakeholders, args.workers, args.chunk_size)
+        filas.append((modo, segundos, enviados))
+    
+    with m.AlmacénCompartido() as almacén:
+        inicio = time.perf_counter()
+        almacén.publicar(stakeholders, tabla)
+        segundos_publicar = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        almacén.publicar(stakeholders)
+        segundos_publicar_stakeholders = time.perf_counter() - inicio
+    
+    print(f"{n} acciones, {args.stakeholders} stakeholders, {args.workers} procesos, "
+          f"trozos de {args.chunk_size}")
+    print(f"{'modo':<12} {'s':>8} {'MB serializados':>16}")
+    for modo, segundos, enviados in filas:
+        print(f"{modo:<12} {segundos:>8.2f} {enviados / 1e6:>16.2f}")
+    print(f"\nPublicar una versión: {segundos_publicar * 1e3:.1f} ms "
+          f"({segundos_publicar_stakeholders * 1e3:.1f} ms solo stakeholders)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Generador de escenarios sintéticos para los benchmarks.
+
+Todo se deriva de una semilla, así que el mismo conjunto de parámetros
+produce siempre las mismas acciones, stakeholders y contexto.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+RELLENO = (
+    "el la los las de que se en un una informe incidente sistema usuarios "
+    "datos para con fue durante red servidor equipo acceso registro revisar "
+    "medida impacto riesgo servicio cliente proceso respuesta"
+).split()
+
+TIPOS = ["humano", "animal", "ecosistema", "IA", "organización"]
+
+
+@dataclass
+class Parámetros:
+    """Tamaño y forma de un escenario"""
+    n_acciones: int = 1000
+    n_stakeholders: int = 100
+    palabras_por_descripción: int = 50
+    densidad_marcadores: float = 0.05  # fracción de palabras que son marcadores
+    n_circunstancias: int = 2
+    consecuencias_por_acción: int = 5
+    semilla: int = 0
+
+
+@dataclass
+class Escenario:
+    parámetros: Parámetros
+    acciones: List[Any]
+    stakeholders: List[Any]
+    contexto: Dict[str, Any]
+    red_relaciones: Dict[str, List[str]] = field(default_factory=dict)
+
+
+def marcadores_del_módulo(m) -> List[str]:
+    """Todas las palabras clave que algún framework reconoce"""
+    palabras = set(m.SabiduríaPráctica.PALABRAS_ALERTA)
+    palabras.update(m.ÉticaCuidado.PALABRAS_CUIDADO)
+    for grupo in (m.Deontología.MARCADORES_VIOLACIÓN, m.ÉticaVirtud.MARCADORES_VIRTUD):
+        for lista in grupo.values():
+            palabras.update(lista)
+    return sorted(palabras)
+
+
+def generar_escenario(m, parámetros: Parámetros) -> Escenario:
+    """
+    Construye un escenario con las clases del módulo `m`.
+    
+    Las consecuencias de cada acción apuntan a stakeholders elegidos al azar
+    (con alguna clave de vulnerables de vez en cuando) y las circunstancias
+    se eligen entre las excepciones de las reglas morales.
+    """
+    rng = random.Random(parámetros.semilla)
+    marcadores = marcadores_del_módulo(m)
+    
+    stakeholders = [
+        m.Stakeholder(
+            f"stakeholder_{j}",
+            rng.choice(TIPOS),
+            rng.random(),
+            rng.random(),
+            rng.uniform(0.1, 1.0),
+        )
+        for j in range(parámetros.n_stakeholders)
+    ]
+    
+    acciones = []
+    for i in range(parámetros.n_acciones):
+        palabras = [
+            rng.choice(marcadores)
+            if rng.random() < parámetros.densidad_marcadores
+            else rng.choice(RELLENO)
+            for _ in range(parámetros.palabras_por_descripción)
+        ]
+        consecuencias = {
+            f"stakeholder_{rng.randrange(parámetros.n_stakeholders)}": rng.uniform(-1, 1)
+            for _ in range(parámetros.consecuencias_por_acción)
+        }
+        if rng.random() < 0.2:
+            consecuencias[rng.choice(["vulnerables_ayudados", "vulnerables_dañados"])] = 1
+        acciones.append(m.Acción(
+            f"acción_{i}",
+            " ".join(palabras),
+            consecuencias,
+            rng.random(),
+            rng.random(),
+        ))
+    
+    excepciones = sorted({
+        exc
+        for config in m.Deontología().reglas_morales.values()
+        for exc in config["excepciones"]
+    })
+    contexto = {
+        "circunstancias": rng.sample(
+            excepciones, min(parámetros.n_circunstancias, len(excepciones))
+        )
+    }
+    
+    return Escenario(parámetros, acciones, stakeholders, contexto)
@@ -0,0 +1,114 @@
+"""
+Benchmark del tiempo de importación.
+
+Cada caso se ejecuta en un proceso nuevo con `python -X importtime` y se
+suma el tiempo acumulado de los módulos que importa (los que ya importa el
+intérprete al arrancar no cuentan). Los trabajadores de línea de comandos
+viven poco: importar no debería costar más que evaluar.
+
+Los caminos escalares no deben cargar NumPy; si un caso lo hace, o si se
+supera `--límite-ms`, el proceso termina con código 1.
+
+Uso (desde el directorio `code/`):
+    python -m benchmarks.importacion --repeticiones 7 --límite-ms 150
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from benchmarks import DIRECTORIO_CÓDIGO
+
+_ACCIÓN = "Acción('a', 'ayudar sin mentir', {'s': 0.5}, 0.2, 0.8)"
+_STAKEHOLDERS = "[Stakeholder('s', 'humano', 0.5, 0.5, 1.0)]"
+
+# nombre → (código, ¿puede cargar NumPy?)
+CASOS = {
+    "import marcos_eticos": ("import marcos_eticos", False),
+    "deontología escalar": (
+        "from marcos_eticos import Acción, Deontología\n"
+        f"Deontología().evaluar_acción({_ACCIÓN}, {{}})",
+        False,
+    ),
+    "sabiduría escalar": (
+        "from marcos_eticos import Acción, SabiduríaPráctica, Stakeholder\n"
+        f"SabiduríaPráctica().evaluar_decisión_compleja({_ACCIÓN}, {_STAKEHOLDERS}, {{}})",
+        False,
+    ),
+    "sabiduría escalar con red": (
+        "from marcos_eticos import Acción, SabiduríaPráctica, Stakeholder\n"
+        f"SabiduríaPráctica().evaluar_decisión_compleja({_ACCIÓN}, {_STAKEHOLDERS}, {{}}, {{'s': ['t']}})",
+        False,
+    ),
+    "sabiduría por lotes": (
+        "from marcos_eticos import Acción, SabiduríaPráctica, Stakeholder\n"
+        f"SabiduríaPráctica().evaluar_lote([{_ACCIÓN}], {_STAKEHOLDERS}, {{}})",
+        True,
+    ),
+}
+
+
+def módulos_importados(código: str) -> dict:
+    """Módulos de primer nivel importados por `código` → microsegundos acumulados"""
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", código],
+        cwd=DIRECTORIO_CÓDIGO, capture_output=True, text=True, check=True
+    )
+    módulos = {}
+    for línea in proceso.stderr.splitlines():
+        if not línea.startswith("import time:") or "cumulative" in línea:
+            continue
+        _, acumulado, nombre = línea[len("import time:"):].split("|")
+        # Los módulos anidados llevan sangría extra; su tiempo ya está en el padre
+        if not nombre.startswith("  "):
+            módulos[nombre.strip()] = int(acumulado)
+    return módulos
+
+
+def medir(código: str, al_arrancar: set, repeticiones: int):
+    """Mediana en ms del tiempo de importación, y si se cargó NumPy"""
+    tiempos = []
+    numpy = False
+    for _ in range(repeticiones):
+        módulos = módulos_importados(código)
+        tiempos.append(sum(
+            acumulado for nombre, acumulado in módulos.items()
+            if nombre not in al_arrancar
+        ) / 1e3)
+        numpy = numpy or any(
+            nombre == "numpy" or nombre.startswith("numpy.") for nombre in módulos
+        )
+    return statistics.median(tiempos), numpy
+
+
+def main(argumentos=None) -> int:
+    analizador = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    analizador.add_argument("--repeticiones", type=int, default=5)
+    analizador.add_argument(
+        "--límite-ms", type=float,
+        help="Tiempo máximo de importación de los casos escalares"
+    )
+    args = analizador.parse_args(argumentos)
+    
+    al_arrancar = set(módulos_importados("pass"))
+    fallos = []
+    print(f"{'caso':<26} {'ms':>8} {'numpy':>6}")
+    for nombre, (código, numpy_permitido) in CASOS.items():
+        ms, numpy = medir(código, al_arrancar, args.repeticiones)
+        if numpy and not numpy_permitido:
+            fallos.append(f"{nombre}: importa NumPy")
+        if args.límite_ms is not None and not numpy_permitido and ms > args.límite_ms:
+            fallos.append(f"{nombre}: {ms:.1f} ms > {args.límite_ms:.1f} ms")
+        print(f"{nombre:<26} {ms:>8.1f} {'sí' if numpy else 'no':>6}")
+    
+    if fallos:
+        print(f"\n{len(fallos)} fallos:", file=sys.stderr)
+        for fallo in fallos:
+            print(f"  {fallo}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
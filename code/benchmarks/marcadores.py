@@ -0,0 +1,158 @@
+"""
+Benchmark de detección de palabras clave.
+
+Compara el detector compartido (`DetectorMarcadores`) con el esquema
+anterior, en el que cada framework pasaba la descripción a minúsculas y
+buscaba sus propias palabras una por una, regla por regla.
+
+Tres escenarios:
+1. Los marcadores actuales de los cuatro frameworks, con descripciones
+   cada vez más largas (informes de incidentes de varios párrafos).
+2. Conjuntos de marcadores cada vez mayores sobre un texto fijo, para
+   ver cómo escala cada enfoque con el número de marcadores.
+3. Normalización Unicode y raíces (textos con tildes y verbos
+   conjugados): cada framework normalizando la descripción por su cuenta
+   frente a compartir la forma normalizada, y cuántos marcadores más se
+   encuentran que solo con minúsculas.
+"""
+
+import random
+import time
+
+from benchmarks import cargar_módulo
+
+VOCABULARIO = (
+    "el la los de que se en informe incidente sistema usuarios datos para "
+    "con una fue durante red servidor equipo acceso registro alerta revisar "
+    "proteger ayudar considerar verdad ocultar forzar analizar apoyar"
+).split()
+
+
+# Formas con tildes, mayúsculas y conjugadas de palabras que son marcadores
+VOCABULARIO_FLEXIONADO = VOCABULARIO + (
+    "protegió Protegerlos ayudó ayudándoles engañó MANIPULÓ forzaron "
+    "cuidamos acompañó analizó consideraron decisión autonomía análisis"
+).split()
+
+
+def generar_textos(n: int, palabras: int, semilla: int = 0, vocabulario=VOCABULARIO):
+    """Textos distintos entre sí, para que la memoria del detector no ayude"""
+    rng = random.Random(semilla)
+    return [
+        " ".join(rng.choice(vocabulario) for _ in range(palabras)) + f" #{i}"
+        for i in range(n)
+    ]
+
+
+def detección_ingenua(texto: str, grupos_por_marco) -> int:
+    """Esquema anterior: una pasada a minúsculas y un escaneo por grupo"""
+    total = 0
+    for grupos in grupos_por_marco:
+        for palabras in grupos.values():
+            texto_lower = texto.lower()
+            total += sum(1 for palabra in palabras if palabra in texto_lower)
+    return total
+
+
+def detección_compartida(texto: str, detector) -> int:
+    return sum(len(p) for p in detector.coincidencias(texto).values())
+
+
+def medir(función, textos, *args) -> float:
+    """Microsegundos por texto"""
+    inicio = time.perf_counter()
+    for texto in textos:
+        función(texto, *args)
+    return (time.perf_counter() - inicio) / len(textos) * 1e6
+
+
+def escenario_frameworks(m):
+    sabiduría = m.SabiduríaPráctica()
+    grupos_por_marco = [
+        # Deontología y virtud recorrían el texto una vez por regla/virtud
+        {r: m.Deontología.MARCADORES_VIOLACIÓN.get(r, [])
+         for r in sabiduría.deontología.reglas_morales},
+        {v: m.ÉticaVirtud.MARCADORES_VIRTUD.get(v, [])
+         for v in sabiduría.virtud.virtudes},
+        {"cuidado": m.ÉticaCuidado.PALABRAS_CUIDADO},
+        {"alerta": m.SabiduríaPráctica.PALABRAS_ALERTA},
+    ]
+    
+    print("\n1) Marcadores de los cuatro frameworks")
+    print(f"{'palabras':>10} {'ingenuo µs':>12} {'compartido µs':>14} {'aceleración':>12}")
+    for palabras in (20, 200, 2000, 10000):
+        textos = generar_textos(200, palabras)
+        ingenuo = medir(detección_ingenua, textos, grupos_por_marco)
+        compartido = medir(detección_compartida, textos, sabiduría._detector)
+        print(f"{palabras:>10} {ingenuo:>12.1f} {compartido:>14.1f} "
+              f"{ingenuo / compartido:>11.1f}x")
+
+
+def escenario_escalado(m):
+    rng = random.Random(1)
+    sílabas = ["ma", "to", "re", "ca", "pro", "te", "ger", "cui", "dar", "ven",
+               "der", "al", "mo", "ri", "es", "ta", "ble", "cer", "ar", "ir"]
+    candidatos = sorted({
+        "".join(rng.choice(sílabas) for _ in range(rng.randint(2, 4)))
+        for _ in range(1000)
+    })
+    rng.shuffle(candidatos)
+    textos = generar_textos(50, 3000, semilla=2)
+    
+    print("\n2) Escalado con el número de marcadores (texto de 3000 palabras)")
+    print(f"{'marcadores':>10} {'ingenuo µs':>12} {'detector µs':>12} {'motor':>10}")
+    for n in (10, 40, 100, 300, 600):
+        grupos = {f"g{i}": [p] for i, p in enumerate(candidatos[:n])}
+        detector = m.DetectorMarcadores(grupos)
+        ingenuo = medir(detección_ingenua, textos, [grupos])
+        compartido = medir(detección_compartida, textos, detector)
+        motor = "regex" if detector._expresión is not None else "subcadena"
+        print(f"{n:>10} {ingenuo:>12.1f} {compartido:>12.1f} {motor:>10}")
+
+
+def escenario_normalización(m):
+    from marcos_eticos.texto import normalizar
+    
+    def por_framework(texto: str, detectores) -> int:
+        # Sin compartir: cada framework vuelve a normalizar la descripción
+        total = 0
+        for detector in detectores:
+            normalizar.cache_clear()
+            total += detección_compartida(texto, detector)
+        return total
+    
+    def compartida(texto: str, detectores) -> int:
+        return sum(detección_compartida(texto, detector) for detector in detectores)
+    
+    marcos = m.SabiduríaPráctica()
+    textos = generar_textos(500, 200, semilla=3, vocabulario=VOCABULARIO_FLEXIONADO)
+    encontrados_minúsculas = sum(detección_compartida(t, marcos._detector) for t in textos)
+    
+    print("\n3) Normalización compartida (200 palabras con tildes y flexión, µs por acción)")
+    print(f"{'modo':>10} {'por marco':>10} {'compartida':>11} {'un detector':>12} {'marcadores':>11}")
+    for modo in ("plegado", "raíces"):
+        detectores = [
+            m.DetectorMarcadores(marco._detector.grupos, modo)
+            for marco in (m.Deontología(), m.ÉticaVirtud(), m.ÉticaCuidado())
+        ] + [m.DetectorMarcadores({"alerta": m.SabiduríaPráctica.PALABRAS_ALERTA}, modo)]
+        único = m.SabiduríaPráctica(normalización=modo)._detector
+        
+        separada = medir(por_framework, textos, detectores)
+        normalizar.cache_clear()
+        compartido = medir(compartida, textos, detectores)
+        normalizar.cache_clear()
+        un_detector = medir(detección_compartida, textos, único)
+        encontrados = sum(detección_compartida(t, único) for t in textos)
+        print(f"{modo:>10} {separada:>10.1f} {compartido:>11.1f} {un_detector:>12.1f} "
+              f"{encontrados / encontrados_minúsculas:>10.2f}x")
+
+
+def main():
+    m = cargar_módulo()
+    escenario_frameworks(m)
+    escenario_escalado(m)
+    escenario_normalización(m)
+
+
+if __name__ == "__main__":
+    main()
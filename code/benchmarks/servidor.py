@@ -0,0 +1,174 @@
+"""
+Prueba de carga del servidor local de evaluación.
+
+Arranca `python -m marcos_eticos serve` en otro proceso (o usa uno ya en
+marcha con --host/--port o --unix) y lo somete a `--concurrencia`
+peticiones simultáneas desde un `ClienteEvaluación` con `--conexiones`
+conexiones persistentes. La mezcla es sobre todo /evaluar, con una
+fracción de /imperativo y /ranking; las acciones se eligen al azar de un
+conjunto de `--acciones`, así que a partir de cierto momento la caché
+del servidor empieza a acertar.
+
+Se hacen dos pasadas con las mismas peticiones: en frío (caché vacía) y
+en caliente. Informa peticiones por segundo y latencias (p50, p90, p99)
+por ruta, y al final el estado del servidor (caché, tamaño medio de lote).
+En frío, cada máxima nueva de /imperativo simula un millón de agentes y
+ocupa la CPU cientos de milisegundos: con `--imperativo 0` se mide solo
+la evaluación.
+
+Uso (desde el directorio `code/`):
+    python -m benchmarks.servidor --peticiones 5000 --concurrencia 64 --conexiones 16
+"""
+
+import argparse
+import asyncio
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from benchmarks import DIRECTORIO_CÓDIGO, cargar_módulo
+from benchmarks.__main__ import percentil
+from benchmarks.escenarios import Parámetros, generar_escenario
+
+
+def arrancar_servidor(args) -> tuple:
+    """Lanza el servidor y espera a que escuche; devuelve (proceso, host, puerto)"""
+    orden = [
+        sys.executable, "-m", "marcos_eticos", "serve",
+        "--host", args.host, "--port", "0", "--workers", str(args.workers),
+    ]
+    if args.unix:
+        orden += ["--unix", args.unix]
+    proceso = subprocess.Popen(orden, cwd=DIRECTORIO_CÓDIGO, stderr=subprocess.PIPE, text=True)
+    línea = proceso.stderr.readline()
+    if not línea.startswith("escuchando en"):
+        proceso.kill()
+        raise RuntimeError(f"El servidor no arrancó: {línea}{proceso.stderr.read()}")
+    dirección = línea.split()[-1]
+    if dirección.startswith("unix:"):
+        return proceso, args.host, None
+    host, puerto = dirección.removeprefix("http://").rsplit(":", 1)
+    return proceso, host, int(puerto)
+
+
+def preparar_peticiones(escenario, args) -> list:
+    """(ruta, argumentos) de cada petición, con semilla"""
+    rng = random.Random(0)
+    peticiones = []
+    for _ in range(args.peticiones):
+        sorteo = rng.random()
+        if sorteo < args.ranking:
+            inicio = rng.randrange(len(escenario.acciones) - args.acciones_ranking + 1)
+            peticiones.append(("ranking", escenario.acciones[inicio:inicio + args.acciones_ranking]))
+        elif sorteo < args.ranking + args.imperativo:
+            peticiones.append(("imperativo", rng.choice(escenario.acciones)))
+        else:
+            peticiones.append(("evaluar", rng.choice(escenario.acciones)))
+    return peticiones
+
+
+async def pasada(cliente, escenario, peticiones: list, concurrencia: int) -> dict:
+    """Lanza las peticiones con `concurrencia` a la vez; latencias por ruta"""
+    latencias = defaultdict(list)
+    pendientes = iter(peticiones)
+    
+    async def trabajador():
+        for ruta, argumento in pendientes:
+            inicio = time.perf_counter()
+            if ruta == "evaluar":
+                await cliente.evaluar(
+                    argumento, escenario.stakeholders, escenario.contexto,
+                    campos=["recomendación", "consenso"]
+                )
+            elif ruta == "imperativo":
+                await cliente.imperativo_categórico(argumento)
+            else:
+                await cliente.ranking_pareto(argumento, escenario.stakeholders, escenario.contexto)
+            latencias[ruta].append(time.perf_counter() - inicio)
+    
+    inicio = time.perf_counter()
+    await asyncio.gather(*(trabajador() for _ in range(concurrencia)))
+    latencias["total"] = [l for lista in list(latencias.values()) for l in lista]
+    return {"segundos": time.perf_counter() - inicio, "latencias": latencias}
+
+
+async def cargar(m, escenario, host: str, puerto: int, args) -> tuple:
+    peticiones = preparar_peticiones(escenario, args)
+    async with m.ClienteEvaluación(
+        host, puerto, unix=args.unix, conexiones=args.conexiones
+    ) as cliente:
+        resultados = {}
+        for nombre in ("frío", "caliente"):
+            resultados[nombre] = await pasada(cliente, escenario, peticiones, args.concurrencia)
+        estado = await cliente.estado()
+        abiertas = cliente.abiertas
+    return resultados, estado, abiertas
+
+
+def main(argumentos=None):
+    analizador = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    analizador.add_argument("--peticiones", type=int, default=5000)
+    analizador.add_argument("--concurrencia", type=int, default=64)
+    analizador.add_argument("--conexiones", type=int, default=16)
+    analizador.add_argument("--acciones", type=int, default=2000, help="Acciones distintas")
+    analizador.add_argument("--stakeholders", type=int, default=100)
+    analizador.add_argument("--ranking", type=float, default=0.02, help="Fracción de /ranking")
+    analizador.add_argument("--acciones-ranking", type=int, default=20)
+    analizador.add_argument("--imperativo", type=float, default=0.05, help="Fracción de /imperativo")
+    analizador.add_argument("--workers", type=int, default=1, help="Procesos del servidor")
+    analizador.add_argument("--host", default="127.0.0.1")
+    analizador.add_argument("--port", type=int, help="Usar un servidor ya en marcha")
+    analizador.add_argument("--unix", help="Socket Unix del servidor")
+    args = analizador.parse_args(argumentos)
+    
+    m = cargar_módulo()
+    escenario = generar_escenario(
+        m, Parámetros(n_acciones=args.acciones, n_stakeholders=args.stakeholders)
+    )
+    
+    proceso = None
+    host, puerto = args.host, args.port
+    if args.port is None and not (args.unix and _escucha(args.unix)):
+        proceso, host, puerto = arrancar_servidor(args)
+    try:
+        resultados, estado, abiertas = asyncio.run(cargar(m, escenario, host, puerto, args))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
+    
+    print(f"{args.peticiones} peticiones, concurrencia {args.concurrencia}, "
+          f"{args.conexiones} conexiones ({abiertas} abiertas al final), "
+          f"{args.acciones} acciones distintas")
+    print(f"{'pasada':<10} {'ruta':<11} {'n':>6} {'pet/s':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}")
+    for nombre, r in resultados.items():
+        for ruta in ("evaluar", "imperativo", "ranking", "total"):
+            latencias = r["latencias"].get(ruta)
+            if not latencias:
+                continue
+            print(
+                f"{nombre:<10} {ruta:<11} {len(latencias):>6} {len(latencias) / r['segundos']:>8.0f} "
+                f"{percentil(latencias, 50) * 1e3:>8.1f} {percentil(latencias, 90) * 1e3:>8.1f} "
+                f"{percentil(latencias, 99) * 1e3:>8.1f}"
+            )
+    caché = estado["caché"]
+    print(f"\nServidor: {estado['peticiones']} peticiones, {estado['errores']} errores, "
+          f"lote medio {estado['tamaño_medio_lote']:.1f}, "
+          f"caché {caché['aciertos']} aciertos / {caché['fallos']} fallos")
+
+
+def _escucha(ruta: str) -> bool:
+    """¿Hay ya un servidor en ese socket Unix?"""
+    with socket.socket(socket.AF_UNIX) as conexión:
+        try:
+            conexión.connect(ruta)
+            return True
+        except OSError:
+            return False
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+🧭 FRAMEWORKS ÉTICOS IMPLEMENTADOS
+===================================
+
+Implementaciones de diferentes sistemas éticos que pueden ayudar en la
+toma de decisiones morales complejas.
+
+Ningún sistema es perfecto. Todos tienen limitaciones.
+La sabiduría está en usarlos en conjunto, no depender de uno solo.
+
+Los submódulos se cargan la primera vez que se usa uno de sus nombres
+(`from marcos_eticos import Deontología` no carga los demás frameworks),
+y NumPy solo cuando se llama a una API por lotes o vectorizada:
+
+- utilidades.py: valores, acciones, stakeholders, códigos de consenso y
+  detector de marcadores
+- texto.py: descripciones normalizadas (sin tildes, raíces) y su caché
+- tablas.py: tablas columnares de acciones y stakeholders
+- compartido.py: tablas publicadas en memoria compartida para varios procesos
+- utilitarismo.py: Utilitarismo y su evaluador incremental
+- deontologia.py: Deontología y sus reglas compiladas a máscaras de bits
+- universalizacion.py: simulador del imperativo categórico
+- virtud.py: ÉticaVirtud
+- cuidado.py: ÉticaCuidado y el grafo de relaciones compilado
+- cache.py: caché de evaluaciones por huella
+- instrumentacion.py: tiempos y contadores por framework
+- pareto.py: frentes de Pareto
+- resultados.py: resultados compactos de los análisis por lotes
+- sabiduria.py: SabiduríaPráctica, que integra los cuatro frameworks
+- sensibilidad.py: análisis de sensibilidad a los pesos
+- planificacion.py: planes de varias acciones por búsqueda en haz
+- paralelo.py: trabajadores de la evaluación paralela
+- asincrono.py: fachada asyncio con micro-lotes
+- auditoria.py: registro binario de decisiones y sus consultas
+- servidor.py: servidor HTTP local con micro-lotes y caché común
+- cliente.py: su cliente, con conexiones reutilizadas
+- cli.py: línea de comandos (`python -m marcos_eticos evaluate|serve ...`)
+
+Autor: Comunidad humana para AGI emergente
+Fecha: Enero 2026
+"""
+
+import importlib
+
+# Submódulo que define cada nombre público
+_MÓDULO_DE = {
+    "Acción": "utilidades",
+    "Bandera": "utilidades",
+    "DetectorMarcadores": "utilidades",
+    "NivelConsenso": "utilidades",
+    "Recomendación": "utilidades",
+    "Stakeholder": "utilidades",
+    "ValorMoral": "utilidades",
+    "TextoNormalizado": "texto",
+    "normalizar": "texto",
+    "plegar": "texto",
+    "raíz": "texto",
+    "AccionesLote": "tablas",
+    "StakeholdersLote": "tablas",
+    "TablaAcciones": "tablas",
+    "TablaStakeholders": "tablas",
+    "AlmacénCompartido": "compartido",
+    "InstantáneaCompartida": "compartido",
+    "ReferenciaCompartida": "compartido",
+    "EvaluadorIncremental": "utilitarismo",
+    "Utilitarismo": "utilitarismo",
+    "Deontología": "deontologia",
+    "ReglasCompiladas": "deontologia",
+    "Máxima": "universalizacion",
+    "SimuladorUniversalización": "universalizacion",
+    "ÉticaVirtud": "virtud",
+    "GrafoRelaciones": "cuidado",
+    "RedRelaciones": "cuidado",
+    "ÉticaCuidado": "cuidado",
+    "CachéEvaluaciones": "cache",
+    "huella": "cache",
+    "huella_acción": "cache",
+    "Instrumentación": "instrumentacion",
+    "frente_pareto": "pareto",
+    "frentes_pareto": "pareto",
+    "ResultadoAnálisis": "resultados",
+    "SabiduríaPráctica": "sabiduria",
+    "AnálisisSensibilidad": "sensibilidad",
+    "Plan": "planificacion",
+    "PlanificadorSecuencial": "planificacion",
+    "EvaluadorAsíncrono": "asincrono",
+    "ConsultaAuditoría": "auditoria",
+    "LectorAuditoría": "auditoria",
+    "RegistroAuditoría": "auditoria",
+    "ServidorEvaluación": "servidor",
+    "ClienteEvaluación": "cliente",
+    "leer_acciones_jsonl": "cli",
+    "línea_de_comandos": "cli",
+    "seleccionar_campos": "cli",
+}
+
+__all__ = list(_MÓDULO_DE)
+
+
+def __getattr__(nombre: str):
+    módulo = _MÓDULO_DE.get(nombre)
+    if módulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{módulo}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
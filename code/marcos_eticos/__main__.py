@@ -0,0 +1,10 @@
+"""
+python -m marcos_eticos evaluate --input acciones.jsonl --stakeholders s.json
+python -m marcos_eticos serve --port 8765
+"""
+
+import sys
+
+from .cli import línea_de_comandos
+
+sys.exit(línea_de_comandos())
@@ -0,0 +1,86 @@
+"""
+HTTP/1.1 mínimo sobre los streams de asyncio, para el servidor y su cliente.
+
+Solo lo que hace falta entre procesos locales: cuerpos con Content-Length
+(sin chunked), conexiones persistentes y JSON.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple, Optional
+import asyncio
+
+# Mayor cuerpo aceptado, en bytes
+MÁXIMO_CUERPO = 64 * 1024 * 1024
+_MÁXIMO_CABECERAS = 100
+
+RAZONES = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+# (primera línea, cabeceras en minúsculas, cuerpo)
+Mensaje = Tuple[str, Dict[str, str], bytes]
+
+
+class CuerpoDemasiadoGrande(ValueError):
+    pass
+
+
+async def leer_mensaje(lector: asyncio.StreamReader, máximo_cuerpo: int = MÁXIMO_CUERPO) -> Optional[Mensaje]:
+    """
+    Lee una petición o respuesta completa.
+    
+    Returns:
+        El mensaje, o None si la conexión se cerró antes de empezarlo
+    
+    Raises:
+        ValueError: Mensaje mal formado
+        asyncio.IncompleteReadError: La conexión se cerró a medias
+    """
+    primera = await lector.readline()
+    if not primera:
+        return None
+    
+    cabeceras = {}
+    while True:
+        línea = await lector.readline()
+        if línea in (b"\r\n", b"\n"):
+            break
+        if not línea:
+            raise asyncio.IncompleteReadError(b"", None)
+        if len(cabeceras) == _MÁXIMO_CABECERAS:
+            raise ValueError("Demasiadas cabeceras")
+        nombre, separador, valor = línea.decode("latin-1").partition(":")
+        if not separador:
+            raise ValueError(f"Cabecera mal formada: {línea!r}")
+        cabeceras[nombre.strip().lower()] = valor.strip()
+    
+    if "transfer-encoding" in cabeceras:
+        raise ValueError("Transfer-Encoding no admitido: se requiere Content-Length")
+    longitud = int(cabeceras.get("content-length", 0))
+    if longitud < 0:
+        raise ValueError(f"Content-Length inválido: {longitud}")
+    if longitud > máximo_cuerpo:
+        raise CuerpoDemasiadoGrande(f"Cuerpo de {longitud} bytes (máximo {máximo_cuerpo})")
+    cuerpo = await lector.readexactly(longitud) if longitud else b""
+    return primera.decode("latin-1").rstrip("\r\n"), cabeceras, cuerpo
+
+
+def componer_mensaje(primera: str, cuerpo: bytes = b"", cabeceras: Dict[str, str] = None) -> bytes:
+    """Bytes de un mensaje con su Content-Length"""
+    líneas = [primera, f"Content-Length: {len(cuerpo)}"]
+    líneas += [f"{nombre}: {valor}" for nombre, valor in (cabeceras or {}).items()]
+    return ("\r\n".join(líneas) + "\r\n\r\n").encode("latin-1") + cuerpo
+
+
+def persistente(versión: str, cabeceras: Dict[str, str]) -> bool:
+    """¿Sigue abierta la conexión tras este mensaje? (por defecto sí en HTTP/1.1)"""
+    conexión = cabeceras.get("connection", "").lower()
+    if versión == "HTTP/1.0":
+        return conexión == "keep-alive"
+    return conexión != "close"
@@ -0,0 +1,26 @@
+"""
+NumPy bajo demanda.
+
+Los caminos escalares (una acción, un framework) no necesitan NumPy, y
+importarlo cuesta más que evaluar una decisión en un proceso de vida corta.
+Los módulos usan `np` como siempre; NumPy se importa la primera vez que se
+accede a uno de sus atributos, al llamar a una API por lotes o vectorizada.
+"""
+
+import importlib
+
+
+class _NumPyPerezoso:
+    """Se comporta como el módulo `numpy`, que importa en el primer acceso"""
+    
+    def __getattr__(self, nombre: str):
+        valor = getattr(importlib.import_module("numpy"), nombre)
+        # Los accesos siguientes encuentran el atributo sin pasar por aquí
+        setattr(self, nombre, valor)
+        return valor
+    
+    def __repr__(self):
+        return "<numpy bajo demanda>"
+
+
+np = _NumPyPerezoso()
@@ -0,0 +1,250 @@
+"""
+Evaluación asíncrona: micro-lotes para servicios asyncio.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any, Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor
+import asyncio
+
+from .utilidades import Acción
+from .tablas import StakeholdersLote
+from .cuidado import RedRelaciones
+from .cache import huella
+from .sabiduria import SabiduríaPráctica
+from .paralelo import _evaluar_en_trabajador, _evaluar_trozo, _iniciar_trabajador
+
+# (acción, stakeholders, contexto, red de relaciones, futuro del resultado)
+Petición = Tuple[Acción, StakeholdersLote, Dict[str, Any], RedRelaciones, asyncio.Future]
+
+
+class EvaluadorAsíncrono:
+    """
+    Fachada asyncio de `SabiduríaPráctica` que junta peticiones
+    concurrentes en micro-lotes.
+    
+    Cada `evaluar_async` encola una acción y espera solo su resultado. Un
+    despachador recoge de la cola hasta `tamaño_lote` acciones, sin esperar
+    más de `espera_máxima` segundos desde la primera; agrupa las que
+    comparten stakeholders (mismo objeto), contexto (mismo contenido) y red
+    (mismo objeto), y evalúa cada grupo con `evaluar_lote` fuera del bucle
+    de eventos: en un hilo, o repartido entre `workers` procesos.
+    
+    Con varios procesos, los stakeholders de cada grupo viajan con él; si
+    son muchos, conviene publicarlos en un `AlmacénCompartido` y pasar su
+    `ReferenciaCompartida` en su lugar: viaja solo la referencia, y
+    publicar una versión nueva actualiza los datos sin reiniciar los
+    procesos.
+    
+    La cola tiene `capacidad` plazas: cuando se llena, `evaluar_async`
+    espera a que haya sitio en lugar de acumular trabajo sin límite, así
+    que una ráfaga frena a quien la produce en vez de disparar la latencia
+    de todos.
+    
+    Los resultados son los mismos dicts que `evaluar_decisión_compleja`
+    (o `ResultadoAnálisis` con `compacto`).
+    
+    Uso:
+        async with EvaluadorAsíncrono(tamaño_lote=64) as evaluador:
+            análisis = await evaluador.evaluar_async(acción, stakeholders, contexto)
+    """
+    
+    def __init__(
+        self,
+        sabiduría: SabiduríaPráctica = None,
+        tamaño_lote: int = 64,
+        espera_máxima: float = 0.002,
+        capacidad: int = 1024,
+        workers: int = 1,
+        compacto: bool = False
+    ):
+        """
+        Args:
+            sabiduría: Framework con el que evaluar (uno nuevo si se omite)
+            tamaño_lote: Máximo de acciones por micro-lote
+            espera_máxima: Segundos que puede esperar la primera acción de
+                un lote a que lleguen más
+            capacidad: Plazas de la cola de peticiones pendientes
+            workers: Procesos evaluadores; con 1 se evalúa en un hilo
+            compacto: Devolver `ResultadoAnálisis` en lugar de dicts
+        """
+        if tamaño_lote < 1:
+            raise ValueError("tamaño_lote debe ser al menos 1")
+        if capacidad < 1:
+            raise ValueError("capacidad debe ser al menos 1")
+        
+        self.sabiduría = sabiduría or SabiduríaPráctica()
+        self.tamaño_lote = tamaño_lote
+        self.espera_máxima = espera_máxima
+        self.capacidad = capacidad
+        self.workers = max(1, workers)
+        self.compacto = compacto
+        
+        # Para ajustar tamaño_lote y espera_máxima
+        self.lotes_despachados = 0
+        self.acciones_despachadas = 0
+        
+        self._cola: asyncio.Queue = None
+        self._despachador: asyncio.Task = None
+        self._ejecutor: Executor = None
+        self._en_vuelo: asyncio.Semaphore = None
+        self._tareas = set()
+        self._cerrado = False
+    
+    async def evaluar_async(
+        self,
+        acción: Acción,
+        stakeholders: StakeholdersLote,
+        contexto: Dict[str, Any],
+        red_relaciones: RedRelaciones = None
+    ):
+        """Evalúa una acción como `evaluar_decisión_compleja`, sin bloquear el bucle"""
+        if self._cerrado:
+            raise RuntimeError("El evaluador está cerrado")
+        if self._despachador is None:
+            self._iniciar()
+        
+        futuro = asyncio.get_running_loop().create_future()
+        await self._cola.put((acción, stakeholders, contexto, red_relaciones, futuro))
+        return await futuro
+    
+    async def cerrar(self) -> None:
+        """Deja de aceptar peticiones, termina las pendientes y libera el ejecutor"""
+        self._cerrado = True
+        if self._despachador is None:
+            return
+        
+        await self._cola.join()
+        self._despachador.cancel()
+        try:
+            await self._despachador
+        except asyncio.CancelledError:
+            pass
+        self._ejecutor.shutdown(wait=False)
+        self._despachador = None
+    
+    async def __aenter__(self) -> "EvaluadorAsíncrono":
+        return self
+    
+    async def __aexit__(self, *excepción) -> None:
+        await self.cerrar()
+    
+    @property
+    def tamaño_medio_lote(self) -> float:
+        return self.acciones_despachadas / max(self.lotes_despachados, 1)
+    
+    def _iniciar(self) -> None:
+        self._cola = asyncio.Queue(maxsize=self.capacidad)
+        # Un lote en evaluación por proceso (o el único hilo); el siguiente
+        # se va llenando mientras tanto
+        self._en_vuelo = asyncio.Semaphore(self.workers)
+        
+        if self.workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            
+            self._ejecutor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_iniciar_trabajador,
+                initargs=((self.sabiduría, None, None, None),)
+            )
+        else:
+            self._ejecutor = ThreadPoolExecutor(max_workers=1)
+        
+        self._despachador = asyncio.get_running_loop().create_task(self._despachar())
+    
+    async def _despachar(self) -> None:
+        bucle = asyncio.get_running_loop()
+        while True:
+            lote = [await self._cola.get()]
+            límite = bucle.time() + self.espera_máxima
+            
+            while len(lote) < self.tamaño_lote:
+                if not self._cola.empty():
+                    lote.append(self._cola.get_nowait())
+                    continue
+                resto = límite - bucle.time()
+                if resto <= 0:
+                    break
+                try:
+                    lote.append(await asyncio.wait_for(self._cola.get(), resto))
+                except asyncio.TimeoutError:
+                    break
+            
+            await self._en_vuelo.acquire()
+            tarea = bucle.create_task(self._evaluar(lote))
+            self._tareas.add(tarea)
+            tarea.add_done_callback(self._tareas.discard)
+    
+    async def _evaluar(self, lote: List[Petición]) -> None:
+        """Evalúa un micro-lote y resuelve el futuro de cada petición"""
+        try:
+            # Peticiones abandonadas (p. ej. canceladas por un timeout)
+            pendientes = [petición for petición in lote if not petición[-1].done()]
+            self.lotes_despachados += 1
+            self.acciones_despachadas += len(pendientes)
+            
+            for grupo in self._agrupar(pendientes):
+                try:
+                    resultados = await self._evaluar_grupo(grupo)
+                except Exception as error:
+                    for *_, futuro in grupo:
+                        if not futuro.done():
+                            futuro.set_exception(error)
+                    continue
+                
+                for (*_, futuro), resultado in zip(grupo, resultados):
+                    if not futuro.done():
+                        futuro.set_result(resultado)
+        except Exception as error:
+            # Un fallo de todo el lote: nadie debe quedarse esperando
+            for *_, futuro in lote:
+                if not futuro.done():
+                    futuro.set_exception(error)
+        finally:
+            self._en_vuelo.release()
+            for _ in lote:
+                self._cola.task_done()
+    
+    @staticmethod
+    def _agrupar(peticiones: List[Petición]) -> List[List[Petición]]:
+        """Peticiones que pueden evaluarse juntas con un solo `evaluar_lote`"""
+        grupos: Dict[Tuple, List[Petición]] = {}
+        for petición in peticiones:
+            _, stakeholders, contexto, red_relaciones, _ = petición
+            try:
+                clave_contexto = huella(contexto)
+            except Exception:
+                # Un contexto sin huella posible (p. ej. con funciones) solo
+                # se agrupa consigo mismo, sin arrastrar al resto del lote
+                clave_contexto = id(contexto)
+            clave = (id(stakeholders), clave_contexto, id(red_relaciones))
+            grupos.setdefault(clave, []).append(petición)
+        return list(grupos.values())
+    
+    async def _evaluar_grupo(self, grupo: List[Petición]) -> List:
+        _, stakeholders, contexto, red_relaciones, _ = grupo[0]
+        # La tabla se construye ya en el ejecutor, no en el bucle
+        acciones = [petición[0] for petición in grupo]
+        bucle = asyncio.get_running_loop()
+        
+        if self.workers == 1:
+            return await bucle.run_in_executor(
+                self._ejecutor, _evaluar_trozo,
+                (self.sabiduría, stakeholders, contexto, red_relaciones),
+                acciones, False, False, self.compacto
+            )
+        
+        resultados = await bucle.run_in_executor(
+            self._ejecutor, _evaluar_en_trabajador,
+            acciones, stakeholders, contexto, red_relaciones, self.compacto
+        )
+        if self.compacto:
+            # Los resultados compactos llegan sin framework
+            for resultado in resultados:
+                resultado._sabiduría = self.sabiduría
+        if self.sabiduría.auditoría is not None:
+            # Los procesos no tienen el registro: se anota al recibir
+            for acción, resultado in zip(acciones, resultados):
+                self.sabiduría.auditoría.registrar(acción, resultado)
+        return resultados
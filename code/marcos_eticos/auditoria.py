@@ -0,0 +1,470 @@
+"""
+Registro de auditoría: cada decisión en un registro binario de ancho fijo.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple, Union
+from pathlib import Path
+import os
+import struct
+import threading
+import time
+
+from ._numpy import np
+from .utilidades import Acción, Bandera, NivelConsenso, Recomendación
+from .cache import huella_acción
+from .resultados import ResultadoAnálisis
+
+# Registro de 64 bytes, little-endian y alineado
+CAMPOS = [
+    ("instante", "<i8"),  # nanosegundos desde la época Unix
+    ("huella", "S16"),  # huella_acción en binario
+    ("utilitarista", "<f8"),
+    ("deontológica", "<f8"),
+    ("cuidado", "<f8"),
+    ("incertidumbre", "<f4"),
+    ("nombre", "<u4"),  # posición en la tabla de nombres
+    ("virtud", "<i2"),  # virtudes expresadas menos violadas
+    ("consenso", "u1"),  # NivelConsenso, o SIN_CONSENSO
+    ("banderas", "u1"),  # máscara de Bandera
+    ("recomendación", "u1"),  # Recomendación
+    ("relleno", "V3"),
+]
+
+# Consenso que el modo rápido no llegó a calcular
+SIN_CONSENSO = 255
+
+_MAGIA = b"AUDETIC1"
+_CABECERA = 64
+_NOMBRES = "nombres.tab"
+_LONGITUD = struct.Struct("<I")
+
+POLÍTICAS_FSYNC = ("nunca", "lote", "segmento")
+
+
+def _tipo_registro():
+    return np.dtype(CAMPOS)
+
+
+def _ruta_segmento(directorio: Path, número: int) -> Path:
+    return directorio / f"segmento-{número:06d}.reg"
+
+
+def _segmentos(directorio: Path) -> List[Path]:
+    return sorted(directorio.glob("segmento-*.reg"))
+
+
+class RegistroAuditoría:
+    """
+    Escritor del registro de auditoría: solo añade.
+    
+    Cada análisis se guarda como un registro de 64 bytes (ver `CAMPOS`):
+    huella de la acción, instante, score de cada marco, consenso, banderas,
+    recomendación e incertidumbre. El nombre de la acción va a una tabla de
+    cadenas aparte (`nombres.tab`) y el registro guarda su posición, así
+    que cada nombre se escribe una sola vez.
+    
+    Los registros se acumulan en un búfer y se escriben por lotes de
+    `tamaño_lote` en segmentos de `registros_por_segmento` registros
+    (`segmento-000000.reg`, ...), cada uno con una cabecera de 64 bytes.
+    Cuándo se llama a fsync lo decide `fsync`:
+    - "nunca": lo decide el sistema operativo
+    - "lote": tras escribir cada lote
+    - "segmento": al completar un segmento y al cerrar
+    
+    Al reabrir un directorio se sigue en el último segmento; si un corte
+    dejó un registro o un nombre a medias, se descarta. Es seguro usarlo
+    desde varios hilos.
+    
+    `SabiduríaPráctica.auditar(registro)` registra cada evaluación.
+    """
+    
+    def __init__(
+        self,
+        directorio: Union[str, Path],
+        tamaño_lote: int = 4096,
+        registros_por_segmento: int = 1 << 20,
+        fsync: str = "lote"
+    ):
+        if fsync not in POLÍTICAS_FSYNC:
+            raise ValueError(f"fsync debe ser uno de {POLÍTICAS_FSYNC}, no {fsync!r}")
+        if tamaño_lote < 1 or registros_por_segmento < 1:
+            raise ValueError("tamaño_lote y registros_por_segmento deben ser al menos 1")
+        
+        self.directorio = Path(directorio)
+        self.directorio.mkdir(parents=True, exist_ok=True)
+        self.tamaño_lote = tamaño_lote
+        self.registros_por_segmento = registros_por_segmento
+        self.fsync = fsync
+        
+        self._tipo = _tipo_registro()
+        # Registros sueltos aún como tuplas (se convierten juntos, que es
+        # mucho más barato que fila a fila) y lotes ya convertidos, en orden
+        self._filas: List[Tuple] = []
+        self._piezas: List[np.ndarray] = []
+        self._pendientes = 0
+        self._cerrojo = threading.Lock()
+        
+        nombres, completo = _leer_nombres(self.directorio)
+        self._nombres: Dict[str, int] = {nombre: i for i, nombre in enumerate(nombres)}
+        self._archivo_nombres = open(self.directorio / _NOMBRES, "ab")
+        if self._archivo_nombres.tell() != completo:
+            # Nombre a medias de una escritura interrumpida
+            self._archivo_nombres.truncate(completo)
+        
+        segmentos = _segmentos(self.directorio)
+        self._número = int(segmentos[-1].stem.split("-")[1]) if segmentos else 0
+        self._abrir_segmento()
+    
+    def registrar(
+        self,
+        acción: Acción,
+        análisis: Union[Dict, ResultadoAnálisis],
+        instante: float = None
+    ) -> None:
+        """
+        Añade un análisis (el dict de `evaluar_decisión_compleja` o un
+        `ResultadoAnálisis`). `instante` en segundos (por defecto, ahora).
+        """
+        if isinstance(análisis, ResultadoAnálisis):
+            fila = self._fila_compacta(análisis)
+        else:
+            fila = self._fila_dict(acción, análisis)
+        instante_ns = time.time_ns() if instante is None else int(instante * 1e9)
+        
+        with self._cerrojo:
+            if self._archivo is None:
+                raise RuntimeError("El registro de auditoría está cerrado")
+            nombre = self._posición_nombre(acción.nombre)
+            self._filas.append(
+                (instante_ns, bytes.fromhex(huella_acción(acción)), *fila[:4], nombre, *fila[4:], b"")
+            )
+            self._pendientes += 1
+            if self._pendientes >= self.tamaño_lote:
+                self._escribir()
+    
+    def registrar_lote(self, resultados: Iterable[ResultadoAnálisis], instante: float = None) -> None:
+        """Añade muchos resultados compactos con el mismo instante, por columnas"""
+        resultados = list(resultados)
+        if not resultados:
+            return
+        filas = np.zeros(len(resultados), dtype=self._tipo)
+        filas["instante"] = time.time_ns() if instante is None else int(instante * 1e9)
+        filas["huella"] = [bytes.fromhex(huella_acción(r.acción)) for r in resultados]
+        filas["utilitarista"] = [r.utilidad for r in resultados]
+        filas["deontológica"] = [r.score_deontológico for r in resultados]
+        filas["cuidado"] = [r.score_cuidado for r in resultados]
+        filas["incertidumbre"] = [r.acción.incertidumbre for r in resultados]
+        expresión = np.stack([r.expresión_virtudes for r in resultados])
+        filas["virtud"] = (expresión > 0.5).sum(axis=1) - (expresión < -0.5).sum(axis=1)
+        filas["consenso"] = [r.consenso for r in resultados]
+        filas["banderas"] = [r.banderas for r in resultados]
+        filas["recomendación"] = [r.recomendación for r in resultados]
+        
+        with self._cerrojo:
+            if self._archivo is None:
+                raise RuntimeError("El registro de auditoría está cerrado")
+            filas["nombre"] = [self._posición_nombre(r.acción.nombre) for r in resultados]
+            self._convertir()
+            self._piezas.append(filas)
+            self._pendientes += len(filas)
+            if self._pendientes >= self.tamaño_lote:
+                self._escribir()
+    
+    def vaciar(self) -> None:
+        """Escribe los registros pendientes del búfer"""
+        with self._cerrojo:
+            self._escribir()
+    
+    def cerrar(self) -> None:
+        with self._cerrojo:
+            if self._archivo is None:
+                return
+            self._escribir()
+            if self.fsync == "segmento":
+                self._sincronizar()
+            self._archivo.close()
+            self._archivo_nombres.close()
+            self._archivo = None
+    
+    def __enter__(self) -> "RegistroAuditoría":
+        return self
+    
+    def __exit__(self, *excepción) -> None:
+        self.cerrar()
+    
+    # ------------------------------------------------------------------
+    # Conversión a registros
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _fila_compacta(resultado: ResultadoAnálisis) -> Tuple:
+        expresión = resultado.expresión_virtudes
+        return (
+            resultado.utilidad,
+            resultado.score_deontológico,
+            resultado.score_cuidado,
+            resultado.acción.incertidumbre,
+            int((expresión > 0.5).sum() - (expresión < -0.5).sum()),
+            int(resultado.consenso),
+            int(resultado.banderas),
+            int(resultado.recomendación),
+        )
+    
+    @staticmethod
+    def _fila_dict(acción: Acción, análisis: Dict) -> Tuple:
+        # Las perspectivas que el modo rápido no evaluó quedan en NaN
+        perspectivas = análisis["perspectivas"]
+        virtud = perspectivas["virtud"]
+        try:
+            consenso = int(NivelConsenso.desde_texto(análisis["consenso"]))
+        except KeyError:
+            consenso = SIN_CONSENSO
+        return (
+            perspectivas["utilitarista"].get("score", float("nan")),
+            perspectivas["deontológica"].get("score", float("nan")),
+            perspectivas["cuidado"].get("score", float("nan")),
+            acción.incertidumbre,
+            len(virtud.get("virtudes_expresadas", ())) - len(virtud.get("virtudes_violadas", ())),
+            consenso,
+            int(Bandera.desde_textos(análisis["banderas_rojas"])),
+            int(Recomendación.desde_texto(análisis["recomendación"])),
+        )
+    
+    def _posición_nombre(self, nombre: str) -> int:
+        posición = self._nombres.get(nombre)
+        if posición is None:
+            posición = self._nombres[nombre] = len(self._nombres)
+            datos = nombre.encode("utf-8")
+            self._archivo_nombres.write(_LONGITUD.pack(len(datos)) + datos)
+        return posición
+    
+    # ------------------------------------------------------------------
+    # Segmentos
+    # ------------------------------------------------------------------
+    
+    def _abrir_segmento(self) -> None:
+        ruta = _ruta_segmento(self.directorio, self._número)
+        if not ruta.exists() or ruta.stat().st_size < _CABECERA:
+            with open(ruta, "wb") as archivo:
+                archivo.write(_cabecera(self._tipo.itemsize))
+        else:
+            _comprobar_cabecera(ruta, self._tipo.itemsize)
+        
+        self._archivo = open(ruta, "r+b", buffering=0)
+        tamaño = self._archivo.seek(0, os.SEEK_END)
+        self._en_segmento = (tamaño - _CABECERA) // self._tipo.itemsize
+        completo = _CABECERA + self._en_segmento * self._tipo.itemsize
+        if tamaño != completo:
+            # Registro a medias de una escritura interrumpida
+            self._archivo.truncate(completo)
+            self._archivo.seek(completo)
+    
+    def _escribir(self) -> None:
+        """Escribe el búfer, cambiando de segmento cuando se llena"""
+        if self._archivo is None:
+            raise RuntimeError("El registro de auditoría está cerrado")
+        # Los nombres antes que los registros que los usan
+        self._archivo_nombres.flush()
+        
+        self._convertir()
+        for pieza in self._piezas:
+            escritos = 0
+            while escritos < len(pieza):
+                if self._en_segmento == self.registros_por_segmento:
+                    if self.fsync == "segmento":
+                        self._sincronizar()
+                    self._archivo.close()
+                    self._número += 1
+                    self._abrir_segmento()
+                
+                n = min(len(pieza) - escritos, self.registros_por_segmento - self._en_segmento)
+                self._archivo.write(pieza[escritos:escritos + n].data)
+                self._en_segmento += n
+                escritos += n
+        
+        if self._pendientes and self.fsync == "lote":
+            self._sincronizar()
+        self._piezas = []
+        self._pendientes = 0
+    
+    def _convertir(self) -> None:
+        if self._filas:
+            self._piezas.append(np.array(self._filas, dtype=self._tipo))
+            self._filas = []
+    
+    def _sincronizar(self) -> None:
+        os.fsync(self._archivo_nombres.fileno())
+        os.fsync(self._archivo.fileno())
+
+
+def _cabecera(tamaño_registro: int) -> bytes:
+    return (_MAGIA + struct.pack("<I", tamaño_registro)).ljust(_CABECERA, b"\0")
+
+
+def _comprobar_cabecera(ruta: Path, tamaño_registro: int) -> None:
+    with open(ruta, "rb") as archivo:
+        cabecera = archivo.read(_CABECERA)
+    if cabecera[:len(_MAGIA)] != _MAGIA:
+        raise ValueError(f"{ruta} no es un segmento de auditoría")
+    (tamaño,) = struct.unpack_from("<I", cabecera, len(_MAGIA))
+    if tamaño != tamaño_registro:
+        raise ValueError(f"{ruta}: registros de {tamaño} bytes, se esperaban {tamaño_registro}")
+
+
+def _leer_nombres(directorio: Path) -> Tuple[List[str], int]:
+    """Nombres completos de la tabla y los bytes que ocupan"""
+    ruta = directorio / _NOMBRES
+    if not ruta.exists():
+        return [], 0
+    datos = ruta.read_bytes()
+    nombres = []
+    posición = 0
+    while posición + _LONGITUD.size <= len(datos):
+        (longitud,) = _LONGITUD.unpack_from(datos, posición)
+        fin = posición + _LONGITUD.size + longitud
+        if fin > len(datos):
+            break  # nombre a medias de una escritura interrumpida
+        nombres.append(datos[posición + _LONGITUD.size:fin].decode("utf-8"))
+        posición = fin
+    return nombres, posición
+
+
+class ConsultaAuditoría:
+    """
+    Resultado de `LectorAuditoría.consultar`, sin copiar registros.
+    
+    `tramos` tiene, por segmento, una vista del mapa de memoria (el rango
+    de tiempo pedido) y las posiciones dentro de ella que cumplen los
+    filtros (None: todas). Solo `columna` y `registros` copian, y solo
+    las filas que cumplen.
+    """
+    
+    def __init__(self, tramos: List[Tuple[np.ndarray, Optional[np.ndarray]]]):
+        self.tramos = tramos
+    
+    def __len__(self):
+        return sum(len(vista) if posiciones is None else len(posiciones)
+                   for vista, posiciones in self.tramos)
+    
+    def __iter__(self) -> Iterator[np.ndarray]:
+        """Registros de cada segmento (vistas si no hay filtros)"""
+        for vista, posiciones in self.tramos:
+            yield vista if posiciones is None else vista[posiciones]
+    
+    def columna(self, campo: str) -> np.ndarray:
+        """Un campo de todas las filas, en orden"""
+        partes = [
+            vista[campo] if posiciones is None else vista[campo][posiciones]
+            for vista, posiciones in self.tramos
+        ]
+        return np.concatenate(partes) if partes else np.empty(0, dtype=_tipo_registro()[campo])
+    
+    def registros(self) -> np.ndarray:
+        partes = list(self)
+        return np.concatenate(partes) if partes else np.empty(0, dtype=_tipo_registro())
+
+
+class LectorAuditoría:
+    """
+    Lector del registro de auditoría: proyecta cada segmento en memoria
+    (`np.memmap`, solo lectura) como un array de registros.
+    
+    Las consultas por rango de tiempo usan búsqueda binaria sobre
+    `instante` cuando el segmento está en orden (lo normal: un solo
+    escritor con su reloj) y devuelven vistas; los filtros por consenso,
+    banderas o recomendación devuelven además las posiciones que cumplen.
+    `actualizar` vuelve a proyectar lo que el escritor haya añadido.
+    """
+    
+    def __init__(self, directorio: Union[str, Path]):
+        self.directorio = Path(directorio)
+        self._tipo = _tipo_registro()
+        self.segmentos: List[np.ndarray] = []
+        self._ordenados: List[bool] = []
+        self.nombres: List[str] = []
+        self.actualizar()
+    
+    def actualizar(self) -> None:
+        """Proyecta segmentos nuevos y lo añadido al último"""
+        rutas = _segmentos(self.directorio)
+        # Los segmentos completos no cambian: solo se revisa el último conocido
+        conocidos = max(len(self.segmentos) - 1, 0)
+        del self.segmentos[conocidos:]
+        del self._ordenados[conocidos:]
+        for ruta in rutas[conocidos:]:
+            _comprobar_cabecera(ruta, self._tipo.itemsize)
+            n = (ruta.stat().st_size - _CABECERA) // self._tipo.itemsize
+            if n == 0:
+                segmento = np.empty(0, dtype=self._tipo)
+            else:
+                segmento = np.memmap(
+                    ruta, dtype=self._tipo, mode="r", offset=_CABECERA, shape=(n,)
+                )
+            self.segmentos.append(segmento)
+            instantes = segmento["instante"]
+            self._ordenados.append(bool((instantes[1:] >= instantes[:-1]).all()))
+        self.nombres = _leer_nombres(self.directorio)[0]
+    
+    def __len__(self):
+        return sum(len(segmento) for segmento in self.segmentos)
+    
+    def consultar(
+        self,
+        desde: float = None,
+        hasta: float = None,
+        consenso: Union[int, Iterable[int]] = None,
+        banderas: Bandera = None,
+        recomendación: Union[int, Iterable[int]] = None
+    ) -> ConsultaAuditoría:
+        """
+        Registros con instante en [desde, hasta) (segundos desde la época),
+        con alguno de los niveles de `consenso`, con alguna de las
+        `banderas` y con alguna de las `recomendación` indicadas.
+        """
+        desde_ns = None if desde is None else int(desde * 1e9)
+        hasta_ns = None if hasta is None else int(hasta * 1e9)
+        
+        tramos = []
+        for segmento, ordenado in zip(self.segmentos, self._ordenados):
+            instantes = segmento["instante"]
+            filtro = None
+            if ordenado:
+                inicio = 0 if desde_ns is None else int(np.searchsorted(instantes, desde_ns, "left"))
+                fin = len(segmento) if hasta_ns is None else int(np.searchsorted(instantes, hasta_ns, "left"))
+                vista = segmento[inicio:fin]
+            else:
+                vista = segmento
+                if desde_ns is not None:
+                    filtro = instantes >= desde_ns
+                if hasta_ns is not None:
+                    filtro = _y(filtro, instantes < hasta_ns)
+            if not len(vista):
+                continue
+            
+            if consenso is not None:
+                filtro = _y(filtro, np.isin(vista["consenso"], _niveles(consenso)))
+            if banderas is not None:
+                filtro = _y(filtro, (vista["banderas"] & int(banderas)) != 0)
+            if recomendación is not None:
+                filtro = _y(filtro, np.isin(vista["recomendación"], _niveles(recomendación)))
+            
+            posiciones = None if filtro is None else np.flatnonzero(filtro)
+            if posiciones is None or len(posiciones):
+                tramos.append((vista, posiciones))
+        return ConsultaAuditoría(tramos)
+    
+    def nombre(self, registro) -> str:
+        """Nombre de la acción de un registro"""
+        return self.nombres[int(registro["nombre"])]
+
+
+def _y(filtro, condición):
+    return condición if filtro is None else filtro & condición
+
+
+def _niveles(valores) -> List[int]:
+    if isinstance(valores, int):
+        return [valores]
+    return [int(v) for v in valores]
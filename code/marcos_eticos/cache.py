@@ -0,0 +1,184 @@
+"""
+Caché de evaluaciones: no repetir lo ya pensado.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Any, Tuple
+from collections import OrderedDict
+import copy
+import hashlib
+import pickle
+import threading
+import time
+
+from .utilidades import Acción
+
+
+def huella(*partes) -> str:
+    """
+    Huella de contenido estable (BLAKE2b de 128 bits) de valores simples:
+    números, cadenas, tuplas, listas y dicts de ellos.
+    """
+    datos = pickle.dumps(partes, protocol=4)
+    return hashlib.blake2b(datos, digest_size=16).hexdigest()
+
+
+def huella_acción(acción: Acción) -> str:
+    """
+    Huella de una acción; no depende del orden de sus consecuencias ni del
+    tipo de sus números (1, 1.0 y np.float64(1.0) dan la misma), así que
+    una acción y su fila de una `TablaAcciones` comparten huella.
+    """
+    return huella(
+        acción.nombre,
+        acción.descripción,
+        sorted((clave, _número(valor)) for clave, valor in acción.consecuencias_predichas.items()),
+        _número(acción.incertidumbre),
+        _número(acción.reversibilidad),
+    )
+
+
+def _número(valor):
+    # int, bool, float y np.float64 (subclase de float)
+    return float(valor) if isinstance(valor, (int, float)) else valor
+
+
+class CachéEvaluaciones:
+    """
+    Caché de resultados direccionada por contenido, con desalojo LRU y
+    caducidad opcional (TTL).
+    
+    Las entradas se agrupan en espacios (uno por framework). Cada espacio
+    recuerda la huella de la configuración con la que se calcularon sus
+    entradas; si llega otra distinta (p. ej. porque se modificaron las
+    reglas morales), todo el espacio se invalida. Los valores se copian al
+    guardar y al devolver, así que modificar un resultado no contamina
+    la caché; los inmutables (números, cadenas, bytes) se comparten.
+    """
+    
+    def __init__(self, capacidad: int = 100_000, ttl: float = None, reloj=time.monotonic):
+        """
+        Args:
+            capacidad: Máximo de entradas antes de desalojar la menos usada
+            ttl: Segundos de vida de cada entrada (None = sin caducidad)
+            reloj: Función que devuelve el instante actual en segundos
+        """
+        self.capacidad = capacidad
+        self.ttl = ttl
+        self._reloj = reloj
+        self._entradas: OrderedDict = OrderedDict()
+        self._configuración: Dict[str, str] = {}
+        self._cerrojo = threading.Lock()
+        
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.caducadas = 0
+        self.invalidaciones = 0
+    
+    def obtener(self, espacio: str, configuración: str, clave, copiar: bool = True) -> Tuple[bool, Any]:
+        """
+        Args:
+            copiar: Con False se devuelve el valor guardado, sin copia:
+                quien lo recibe se compromete a no modificarlo
+        
+        Returns:
+            (encontrado, valor)
+        """
+        with self._cerrojo:
+            self._vigilar_configuración(espacio, configuración)
+            
+            entrada = self._entradas.get((espacio, clave))
+            if entrada is not None:
+                valor, caduca = entrada
+                if caduca is None or caduca > self._reloj():
+                    self._entradas.move_to_end((espacio, clave))
+                    self.aciertos += 1
+                    return True, _copiar(valor) if copiar else valor
+                del self._entradas[(espacio, clave)]
+                self.caducadas += 1
+            
+            self.fallos += 1
+            return False, None
+    
+    def guardar(self, espacio: str, configuración: str, clave, valor, copiar: bool = True) -> None:
+        """Con `copiar=False` se guarda el propio valor: no debe modificarse después"""
+        with self._cerrojo:
+            self._vigilar_configuración(espacio, configuración)
+            
+            caduca = None if self.ttl is None else self._reloj() + self.ttl
+            self._entradas[(espacio, clave)] = (_copiar(valor) if copiar else valor, caduca)
+            self._entradas.move_to_end((espacio, clave))
+            
+            while len(self._entradas) > self.capacidad:
+                self._entradas.popitem(last=False)
+                self.desalojos += 1
+    
+    def invalidar(self, espacio: str = None) -> None:
+        """Vacía un espacio, o toda la caché si no se indica ninguno"""
+        with self._cerrojo:
+            self._invalidar(espacio)
+    
+    def estadísticas(self) -> Dict[str, int]:
+        with self._cerrojo:
+            return {
+                "entradas": len(self._entradas),
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "desalojos": self.desalojos,
+                "caducadas": self.caducadas,
+                "invalidaciones": self.invalidaciones,
+            }
+    
+    def __len__(self) -> int:
+        return len(self._entradas)
+    
+    def __getstate__(self):
+        # Al enviarla a otro proceso viaja vacía: cada proceso tiene la suya
+        return {"capacidad": self.capacidad, "ttl": self.ttl, "reloj": self._reloj}
+    
+    def __setstate__(self, estado):
+        self.__init__(**estado)
+    
+    def _vigilar_configuración(self, espacio: str, configuración: str) -> None:
+        anterior = self._configuración.get(espacio)
+        if anterior is not None and anterior != configuración:
+            self._invalidar(espacio)
+        self._configuración[espacio] = configuración
+    
+    def _invalidar(self, espacio: str) -> None:
+        claves = [
+            clave for clave in self._entradas
+            if espacio is None or clave[0] == espacio
+        ]
+        for clave in claves:
+            del self._entradas[clave]
+        self.invalidaciones += len(claves)
+        if espacio is None:
+            self._configuración.clear()
+        else:
+            self._configuración.pop(espacio, None)
+
+
+# Tipos que no hace falta copiar (np.float64 es subclase de float)
+_INMUTABLES = (str, bytes, int, float, complex, type(None), frozenset)
+
+
+def _copiar(valor):
+    """
+    Copia profunda de un resultado. Los resultados de los frameworks son
+    árboles de dicts, listas y valores simples: se recorren directamente,
+    sin la memoria de `copy.deepcopy`, que cuesta más que muchas
+    evaluaciones.
+    """
+    if isinstance(valor, _INMUTABLES):
+        return valor
+    tipo = type(valor)
+    if tipo is dict:
+        return {clave: _copiar(v) for clave, v in valor.items()}
+    if tipo is list:
+        return [_copiar(v) for v in valor]
+    if tipo is tuple:
+        return tuple(_copiar(v) for v in valor)
+    return copy.deepcopy(valor)
@@ -0,0 +1,242 @@
+"""
+Línea de comandos: evaluar colas de decisiones en JSONL.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Iterable, Iterator
+import argparse
+import json
+import os
+import sys
+import time
+
+from .utilidades import Acción, Stakeholder
+from .cuidado import GrafoRelaciones
+from .sabiduria import SabiduríaPráctica
+
+
+def leer_acciones_jsonl(líneas: Iterable[str]) -> Iterator[Acción]:
+    """
+    Convierte un flujo de líneas JSON en acciones, una a una.
+    
+    Cada línea no vacía es un objeto con los campos de `Acción`.
+    """
+    for número, línea in enumerate(líneas, start=1):
+        if not línea.strip():
+            continue
+        try:
+            yield Acción(**json.loads(línea))
+        except (ValueError, TypeError) as error:
+            raise ValueError(f"línea {número}: {error}") from error
+
+
+def seleccionar_campos(análisis: Dict, campos: List[str]) -> Dict:
+    """
+    Extrae del análisis solo los campos pedidos.
+    
+    Los campos anidados se indican con puntos
+    ("perspectivas.utilitarista.score") y se devuelven con esa misma clave.
+    """
+    seleccion = {}
+    for campo in campos:
+        valor = análisis
+        for parte in campo.split("."):
+            valor = valor.get(parte) if isinstance(valor, dict) else None
+        seleccion[campo] = valor
+    return seleccion
+
+
+def _cargar_json(ruta: str, convertir=None, por_defecto=None):
+    """
+    Lee un archivo JSON y, si se indica, lo convierte; un contenido mal
+    formado se informa como ValueError con la ruta del archivo.
+    """
+    if ruta is None:
+        return por_defecto
+    with open(ruta, encoding="utf-8") as archivo:
+        try:
+            datos = json.load(archivo)
+            return convertir(datos) if convertir else datos
+        except (ValueError, TypeError, AttributeError) as error:
+            raise ValueError(f"{ruta}: {error}") from error
+
+
+def _objeto(datos) -> Dict:
+    if not isinstance(datos, dict):
+        raise ValueError("se esperaba un objeto JSON")
+    return datos
+
+
+def _evaluar(args) -> int:
+    campos = args.fields.split(",") if args.fields else None
+    entrada = salida = None
+    evaluadas = 0
+    
+    try:
+        stakeholders = _cargar_json(
+            args.stakeholders, lambda datos: [Stakeholder(**s) for s in datos]
+        )
+        contexto = _cargar_json(args.context, _objeto, {})
+        red_relaciones = _cargar_json(
+            args.relations, lambda datos: GrafoRelaciones.desde_dict(_objeto(datos))
+        )
+        
+        entrada = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+        salida = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+        
+        sabiduría = SabiduríaPráctica()
+        inicio = último_informe = time.perf_counter()
+        resultados = sabiduría.evaluar_decisiones(
+            leer_acciones_jsonl(entrada),
+            stakeholders,
+            contexto,
+            red_relaciones,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            determinista=args.deterministic,
+            modo_rápido=args.fast,
+        )
+        for análisis in resultados:
+            if campos:
+                análisis = seleccionar_campos(análisis, campos)
+            salida.write(json.dumps(análisis, ensure_ascii=False) + "\n")
+            evaluadas += 1
+            
+            ahora = time.perf_counter()
+            if ahora - último_informe >= 5:
+                print(
+                    f"{evaluadas} acciones ({evaluadas / (ahora - inicio):.0f} acciones/s)",
+                    file=sys.stderr
+                )
+                último_informe = ahora
+    except BrokenPipeError:
+        raise
+    except (OSError, ValueError) as error:
+        # Archivos que faltan o mal formados, o una línea JSONL inválida
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    finally:
+        if entrada is not None and entrada is not sys.stdin:
+            entrada.close()
+        if salida is sys.stdout:
+            salida.flush()
+        elif salida is not None:
+            salida.close()
+    
+    duración = time.perf_counter() - inicio
+    print(
+        f"{evaluadas} acciones en {duración:.2f} s "
+        f"({evaluadas / max(duración, 1e-9):.0f} acciones/s)",
+        file=sys.stderr
+    )
+    return 0
+
+
+def _servir(args) -> int:
+    # Solo este subcomando carga el servidor
+    import asyncio
+    from .servidor import ServidorEvaluación
+    
+    async def servir():
+        async with ServidorEvaluación(
+            tamaño_lote=args.batch_size, espera_máxima=args.max_wait, workers=args.workers
+        ) as servidor:
+            dirección = await servidor.iniciar(args.host, args.port, args.unix)
+            print(f"escuchando en {dirección}", file=sys.stderr, flush=True)
+            await servidor.servir()
+    
+    try:
+        asyncio.run(servir())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def línea_de_comandos(argumentos: List[str] = None) -> int:
+    """
+    Punto de entrada de la línea de comandos.
+    
+    Ejemplo:
+        python -m marcos_eticos evaluate --input acciones.jsonl \\
+            --stakeholders stakeholders.json --workers 8 \\
+            --fields acción,recomendación,perspectivas.utilitarista.score
+    
+    Las acciones se leen, evalúan y escriben en trozos, así que la memoria
+    no depende del tamaño de la entrada. El rendimiento (acciones/s) se
+    informa por stderr.
+    
+    `serve` arranca el servidor local de evaluación (ver
+    `ServidorEvaluación`):
+        python -m marcos_eticos serve --port 8765
+    """
+    analizador = argparse.ArgumentParser(
+        description="Frameworks éticos para toma de decisiones"
+    )
+    subcomandos = analizador.add_subparsers(dest="comando", required=True)
+    
+    evaluar = subcomandos.add_parser(
+        "evaluate",
+        aliases=["evaluar"],
+        help="Evalúa acciones en JSONL con SabiduríaPráctica"
+    )
+    evaluar.add_argument(
+        "--input", default="-",
+        help="Archivo JSONL con una acción por línea (por defecto, stdin)"
+    )
+    evaluar.add_argument(
+        "--output", default="-",
+        help="Archivo JSONL de resultados (por defecto, stdout)"
+    )
+    evaluar.add_argument(
+        "--stakeholders", required=True,
+        help="Archivo JSON con la lista de stakeholders"
+    )
+    evaluar.add_argument(
+        "--context", help="Archivo JSON con el contexto (p. ej. circunstancias)"
+    )
+    evaluar.add_argument(
+        "--relations", help="Archivo JSON con la red de relaciones"
+    )
+    evaluar.add_argument("--workers", type=int, default=1)
+    evaluar.add_argument("--chunk-size", type=int, default=256)
+    evaluar.add_argument(
+        "--fields",
+        help="Campos a emitir, separados por comas; anidados con puntos"
+    )
+    evaluar.add_argument(
+        "--fast", action="store_true",
+        help="Cortocircuito: solo se garantiza la recomendación"
+    )
+    evaluar.add_argument(
+        "--deterministic", action="store_true",
+        help="Usa exactamente el camino secuencial en cada acción"
+    )
+    
+    servir = subcomandos.add_parser(
+        "serve",
+        aliases=["servir"],
+        help="Servidor HTTP local de evaluación con micro-lotes y caché"
+    )
+    servir.add_argument("--host", default="127.0.0.1")
+    servir.add_argument("--port", type=int, default=8765)
+    servir.add_argument("--unix", help="Escuchar en este socket Unix en lugar de TCP")
+    servir.add_argument("--workers", type=int, default=1)
+    servir.add_argument("--batch-size", type=int, default=64)
+    servir.add_argument(
+        "--max-wait", type=float, default=0.002,
+        help="Segundos que espera un micro-lote a llenarse"
+    )
+    
+    args = analizador.parse_args(argumentos)
+    if args.comando in ("serve", "servir"):
+        return _servir(args)
+    
+    try:
+        return _evaluar(args)
+    except BrokenPipeError:
+        # Quien leía la salida dejó de hacerlo (p. ej. `| head`): se
+        # termina sin traza, y sin volver a fallar al vaciar stdout al salir
+        nulo = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(nulo, sys.stdout.fileno())
+        return 1
@@ -0,0 +1,214 @@
+"""
+Cliente del servidor local de evaluación, con conexiones reutilizadas.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any, Tuple, Iterable
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+import asyncio
+import json
+
+from .utilidades import Acción, Stakeholder
+from ._http import componer_mensaje, leer_mensaje, persistente
+
+
+class ClienteEvaluación:
+    """
+    Cliente asyncio de `ServidorEvaluación`.
+    
+    Mantiene hasta `conexiones` conexiones persistentes y las reutiliza
+    entre peticiones: cada petición toma una libre (o abre otra si aún no
+    hay tantas) y la devuelve al terminar. Si el servidor cerró una
+    conexión que estaba inactiva, la petición se repite una vez en otra.
+    
+    Las acciones y stakeholders pueden ser objetos o dicts con sus campos.
+    Cada lista de stakeholders se codifica en JSON una sola vez y se
+    reutiliza mientras contenga los mismos objetos: si se modifica uno de
+    sus stakeholders en el sitio, hay que pasar una lista nueva.
+    Los errores de entrada (HTTP 400) se lanzan como ValueError; los demás,
+    como RuntimeError.
+    
+    Uso:
+        async with ClienteEvaluación(puerto=8765) as cliente:
+            análisis = await cliente.evaluar(acción, stakeholders, contexto)
+    """
+    
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        puerto: int = 8765,
+        unix: str = None,
+        conexiones: int = 8,
+        tiempo_espera: float = 60.0
+    ):
+        """
+        Args:
+            host, puerto: Dirección TCP del servidor
+            unix: Socket Unix del servidor (en lugar de host y puerto)
+            conexiones: Máximo de conexiones abiertas a la vez
+            tiempo_espera: Segundos máximos de espera por una respuesta
+        """
+        if conexiones < 1:
+            raise ValueError("conexiones debe ser al menos 1")
+        self.host = host
+        self.puerto = puerto
+        self.unix = unix
+        self.conexiones = conexiones
+        self.tiempo_espera = tiempo_espera
+        
+        self.abiertas = 0
+        self._stakeholders_codificados: OrderedDict = OrderedDict()
+        self._libres: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._plazas = asyncio.Semaphore(conexiones)
+    
+    async def evaluar(
+        self,
+        acción: Acción,
+        stakeholders: Iterable[Stakeholder],
+        contexto: Dict[str, Any] = None,
+        relaciones: Dict[str, List[str]] = None,
+        campos: List[str] = None
+    ) -> Dict:
+        """Como `evaluar_decisión_compleja` (o solo `campos`, anidados con puntos)"""
+        return await self._petición("POST", "/evaluar", {
+            "acción": _como_dict(acción),
+            "contexto": contexto or {},
+            "relaciones": relaciones,
+            "campos": campos,
+        }, stakeholders=self._codificar_stakeholders(stakeholders))
+    
+    async def ranking_pareto(
+        self,
+        acciones: Iterable[Acción],
+        stakeholders: Iterable[Stakeholder],
+        contexto: Dict[str, Any] = None,
+        relaciones: Dict[str, List[str]] = None,
+        capas: int = None
+    ) -> Dict:
+        """Como `SabiduríaPráctica.ranking_pareto`, con "frente" como nombres de acciones"""
+        return await self._petición("POST", "/ranking", {
+            "acciones": [_como_dict(a) for a in acciones],
+            "contexto": contexto or {},
+            "relaciones": relaciones,
+            "capas": capas,
+        }, stakeholders=self._codificar_stakeholders(stakeholders))
+    
+    async def imperativo_categórico(self, acción: Acción) -> bool:
+        respuesta = await self._petición("POST", "/imperativo", {"acción": _como_dict(acción)})
+        return respuesta["imperativo_categórico"]
+    
+    async def estado(self) -> Dict:
+        return await self._petición("GET", "/estado")
+    
+    async def cerrar(self) -> None:
+        """Cierra las conexiones libres (las que están en uso se cierran al terminar)"""
+        libres, self._libres = self._libres, []
+        for _, escritor in libres:
+            escritor.close()
+            self.abiertas -= 1
+        for _, escritor in libres:
+            try:
+                await escritor.wait_closed()
+            except ConnectionError:
+                pass
+    
+    async def __aenter__(self) -> "ClienteEvaluación":
+        return self
+    
+    async def __aexit__(self, *excepción) -> None:
+        await self.cerrar()
+    
+    async def _petición(self, método: str, ruta: str, datos: Dict = None, stakeholders: bytes = None) -> Any:
+        cuerpo = b"" if datos is None else json.dumps(datos, ensure_ascii=False).encode("utf-8")
+        if stakeholders is not None:
+            # La lista ya codificada se inserta tal cual en el objeto
+            cuerpo = b'{"stakeholders": ' + stakeholders + b", " + cuerpo[1:]
+        petición = componer_mensaje(
+            f"{método} {ruta} HTTP/1.1",
+            cuerpo,
+            {"Host": self.host, "Content-Type": "application/json; charset=utf-8"},
+        )
+        
+        async with self._plazas:
+            for intento in range(2):
+                reutilizada = bool(self._libres)
+                lector, escritor = self._libres.pop() if reutilizada else await self._abrir()
+                try:
+                    escritor.write(petición)
+                    await escritor.drain()
+                    respuesta = await asyncio.wait_for(leer_mensaje(lector), self.tiempo_espera)
+                    if respuesta is None:
+                        raise ConnectionResetError("El servidor cerró la conexión")
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    self._descartar(escritor)
+                    # Una conexión inactiva que el servidor ya había cerrado
+                    if reutilizada and intento == 0:
+                        continue
+                    raise
+                except BaseException:
+                    # Respuesta a medias: la conexión no se puede reutilizar
+                    self._descartar(escritor)
+                    raise
+                break
+            
+            primera, cabeceras, contenido = respuesta
+            if persistente("HTTP/1.1", cabeceras):
+                self._libres.append((lector, escritor))
+            else:
+                self._descartar(escritor)
+        
+        estado = int(primera.split(" ", 2)[1])
+        resultado = json.loads(contenido) if contenido else None
+        if estado == 200:
+            return resultado
+        error = resultado.get("error") if isinstance(resultado, dict) else primera
+        if estado == 400:
+            raise ValueError(error)
+        raise RuntimeError(f"HTTP {estado}: {error}")
+    
+    def _codificar_stakeholders(self, stakeholders: Iterable[Stakeholder]) -> bytes:
+        stakeholders = list(stakeholders)
+        # La clave son los propios objetos (por identidad), no su contenido
+        clave = tuple(map(id, stakeholders))
+        entrada = self._stakeholders_codificados.get(clave)
+        if entrada is not None:
+            self._stakeholders_codificados.move_to_end(clave)
+            return entrada[1]
+        
+        codificados = json.dumps([_como_dict(s) for s in stakeholders], ensure_ascii=False).encode("utf-8")
+        # Se guardan también los objetos, para que sus id no se reutilicen
+        self._stakeholders_codificados[clave] = (stakeholders, codificados)
+        if len(self._stakeholders_codificados) > _CAPACIDAD_CODIFICADOS:
+            self._stakeholders_codificados.popitem(last=False)
+        return codificados
+    
+    async def _abrir(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self.unix is not None:
+            conexión = await asyncio.open_unix_connection(self.unix)
+        else:
+            conexión = await asyncio.open_connection(self.host, self.puerto)
+        self.abiertas += 1
+        return conexión
+    
+    def _descartar(self, escritor: asyncio.StreamWriter) -> None:
+        escritor.close()
+        self.abiertas -= 1
+
+
+def _como_dict(objeto) -> Dict:
+    # Campo a campo: `asdict` copia en profundidad y es mucho más lento
+    if not is_dataclass(objeto):
+        return objeto
+    nombres = _CAMPOS.get(type(objeto))
+    if nombres is None:
+        nombres = _CAMPOS[type(objeto)] = tuple(campo.name for campo in fields(objeto))
+    return {nombre: getattr(objeto, nombre) for nombre in nombres}
+
+
+# Listas de stakeholders codificadas que recuerda cada cliente
+_CAPACIDAD_CODIFICADOS = 16
+
+# Nombres de los campos de cada clase de datos
+_CAMPOS: Dict[type, Tuple[str, ...]] = {}
@@ -0,0 +1,282 @@
+"""
+Memoria compartida: tablas de acciones y stakeholders para varios procesos.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Dict, Tuple, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+import os
+
+from ._numpy import np
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+    from .tablas import TablaAcciones, TablaStakeholders
+
+# Cada array empieza en un múltiplo de 64 bytes (una línea de caché)
+_ALINEACIÓN = 64
+
+# (nombre, desplazamiento, dtype, forma) de cada array del bloque
+Campo = Tuple[str, int, str, Tuple[int, ...]]
+
+
+@dataclass(frozen=True)
+class ReferenciaCompartida:
+    """
+    Lo único que viaja a los procesos: el nombre del bloque de memoria
+    compartida de una versión publicada y dónde está cada array dentro.
+    Ocupa unos cientos de bytes, tenga la tabla el tamaño que tenga.
+    
+    Rebanarla (`referencia[a:b]`) da otra que apunta a ese tramo de filas
+    de las acciones.
+    Se usa en lugar de la lista o tabla correspondiente: los `como_tabla`
+    de `TablaAcciones` y `TablaStakeholders` la resuelven, así que
+    `Utilitarismo.evaluar_lote`, `SabiduríaPráctica.evaluar_lote`,
+    `evaluar_decisiones` o `EvaluadorAsíncrono` la aceptan tal cual.
+    """
+    almacén: str
+    versión: int
+    bloque: str
+    campos: Tuple[Campo, ...]
+    n_acciones: int = 0
+    inicio: int = 0
+    fin: Optional[int] = None
+    
+    def __len__(self) -> int:
+        fin = self.n_acciones if self.fin is None else self.fin
+        return fin - self.inicio
+    
+    def __getitem__(self, rebanada: slice) -> "ReferenciaCompartida":
+        """Referencia a un tramo contiguo de las acciones de este tramo"""
+        if not isinstance(rebanada, slice):
+            raise TypeError("Solo se admiten rebanadas; las filas se leen con tabla_acciones()")
+        inicio, fin, paso = rebanada.indices(len(self))
+        if paso != 1:
+            raise ValueError("Solo se admiten rebanadas contiguas")
+        return replace(self, inicio=self.inicio + inicio, fin=self.inicio + max(inicio, fin))
+    
+    def abrir(self) -> "InstantáneaCompartida":
+        """
+        Vistas de la versión publicada. Cada proceso abre un bloque una
+        sola vez y guarda las `_CAPACIDAD_ABIERTAS` últimas versiones.
+        """
+        instantánea = _ABIERTAS.get(self.bloque)
+        if instantánea is None:
+            instantánea = InstantáneaCompartida(self)
+            _ABIERTAS[self.bloque] = instantánea
+            if len(_ABIERTAS) > _CAPACIDAD_ABIERTAS:
+                _ABIERTAS.popitem(last=False)[1].cerrar()
+        else:
+            _ABIERTAS.move_to_end(self.bloque)
+        return instantánea
+    
+    def tabla_acciones(self) -> TablaAcciones:
+        tabla = self.abrir().acciones
+        if tabla is None:
+            raise ValueError(f"La versión {self.versión} no tiene acciones publicadas")
+        if self.inicio or self.fin is not None:
+            tabla = tabla[self.inicio:self.inicio + len(self)]
+        return tabla
+    
+    def tabla_stakeholders(self) -> TablaStakeholders:
+        return self.abrir().stakeholders
+
+
+class InstantáneaCompartida:
+    """
+    Una versión publicada, vista desde un proceso: `acciones` y
+    `stakeholders` son tablas columnares normales cuyos arrays numéricos
+    son vistas de solo lectura sobre la memoria compartida (sin copia).
+    Los textos (nombres, tipos, descripciones, claves) se decodifican al
+    abrir, una vez por proceso y versión.
+    """
+    
+    def __init__(self, referencia: ReferenciaCompartida):
+        from multiprocessing.shared_memory import SharedMemory
+        from .tablas import TablaAcciones, TablaStakeholders
+        
+        self.versión = referencia.versión
+        self._memoria = SharedMemory(name=referencia.bloque)
+        arrays = {
+            nombre: _vista(self._memoria, desplazamiento, dtype, forma)
+            for nombre, desplazamiento, dtype, forma in referencia.campos
+        }
+        
+        self.stakeholders = TablaStakeholders(
+            _decodificar(arrays, "stakeholders.nombres"),
+            _decodificar(arrays, "stakeholders.tipos"),
+            arrays["stakeholders.capacidad_sufrimiento"],
+            arrays["stakeholders.capacidad_florecimiento"],
+            arrays["stakeholders.importancia_moral"],
+        )
+        self.acciones = None
+        if "acciones.indptr" in arrays:
+            self.acciones = TablaAcciones(
+                _decodificar(arrays, "acciones.nombres"),
+                _decodificar(arrays, "acciones.descripciones"),
+                arrays["acciones.incertidumbre"],
+                arrays["acciones.reversibilidad"],
+                arrays["acciones.indptr"],
+                arrays["acciones.índices"],
+                arrays["acciones.valores"],
+                _decodificar(arrays, "acciones.claves"),
+            )
+    
+    def cerrar(self) -> None:
+        """Suelta la proyección, salvo que alguien conserve vistas de ella"""
+        self.acciones = self.stakeholders = None
+        try:
+            self._memoria.close()
+        except BufferError:
+            # Quedan vistas vivas: la proyección se libera con la última
+            pass
+    
+    def __repr__(self):
+        return f"InstantáneaCompartida(versión {self.versión}, {self.acciones!r}, {self.stakeholders!r})"
+
+
+class AlmacénCompartido:
+    """
+    Publica tablas de stakeholders y acciones en memoria compartida
+    (`multiprocessing.shared_memory`) para que los procesos trabajadores
+    las lean sin recibir cada uno su copia serializada.
+    
+    Cada `publicar` escribe una versión nueva en un bloque propio y
+    devuelve su `ReferenciaCompartida`; las tareas que llevan esa
+    referencia ven exactamente esa versión, así que el proceso principal
+    puede actualizar los datos sin reiniciar los trabajadores: cada uno
+    abre la versión nueva cuando le llega la primera tarea que la usa.
+    
+    Se conservan las `conservar` últimas versiones y las anteriores se
+    eliminan: una tarea no debe seguir en vuelo tras `conservar`
+    publicaciones más. Cerrar el almacén elimina todas.
+    
+    Uso:
+        with AlmacénCompartido() as almacén:
+            referencia = almacén.publicar(stakeholders, acciones)
+            for análisis in sabiduría.evaluar_decisiones(
+                referencia, referencia, contexto, workers=4
+            ):
+                ...
+    """
+    
+    def __init__(self, conservar: int = 2):
+        if conservar < 1:
+            raise ValueError("conservar debe ser al menos 1")
+        self.conservar = conservar
+        self.identificador = os.urandom(4).hex()
+        self.referencia: ReferenciaCompartida = None
+        self._versiones: OrderedDict = OrderedDict()
+    
+    def publicar(self, stakeholders, acciones=None) -> ReferenciaCompartida:
+        """
+        Publica una versión nueva con estos stakeholders (lista o tabla) y,
+        opcionalmente, estas acciones.
+        
+        Returns:
+            La referencia a la versión publicada (también en `referencia`)
+        """
+        from multiprocessing.shared_memory import SharedMemory
+        from .tablas import TablaAcciones, TablaStakeholders
+        
+        tabla_stakeholders = TablaStakeholders.como_tabla(stakeholders)
+        arrays = {
+            **_codificar("stakeholders.nombres", tabla_stakeholders.nombres),
+            **_codificar("stakeholders.tipos", tabla_stakeholders.tipos),
+            "stakeholders.capacidad_sufrimiento": tabla_stakeholders.capacidad_sufrimiento,
+            "stakeholders.capacidad_florecimiento": tabla_stakeholders.capacidad_florecimiento,
+            "stakeholders.importancia_moral": tabla_stakeholders.importancia_moral,
+        }
+        n_acciones = 0
+        if acciones is not None:
+            tabla = TablaAcciones.como_tabla(acciones)
+            n_acciones = len(tabla)
+            arrays.update({
+                **_codificar("acciones.nombres", tabla.nombres),
+                **_codificar("acciones.descripciones", tabla.descripciones),
+                **_codificar("acciones.claves", tabla.claves),
+                "acciones.incertidumbre": tabla.incertidumbre,
+                "acciones.reversibilidad": tabla.reversibilidad,
+                "acciones.indptr": tabla.indptr,
+                "acciones.índices": tabla.índices,
+                "acciones.valores": tabla.valores,
+            })
+        
+        campos = []
+        tamaño = 0
+        for nombre, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            campos.append((nombre, tamaño, array.dtype.str, array.shape))
+            tamaño += -(-array.nbytes // _ALINEACIÓN) * _ALINEACIÓN
+        
+        versión = self.referencia.versión + 1 if self.referencia is not None else 1
+        memoria = SharedMemory(
+            name=f"me_{self.identificador}_{versión}", create=True, size=max(tamaño, 1)
+        )
+        for (nombre, desplazamiento, dtype, forma), array in zip(campos, arrays.values()):
+            destino = np.ndarray(forma, dtype=dtype, buffer=memoria.buf, offset=desplazamiento)
+            destino[...] = array
+            del destino
+        
+        self.referencia = ReferenciaCompartida(
+            self.identificador, versión, memoria.name, tuple(campos), n_acciones
+        )
+        self._versiones[versión] = memoria
+        while len(self._versiones) > self.conservar:
+            self._eliminar(*self._versiones.popitem(last=False))
+        return self.referencia
+    
+    def cerrar(self) -> None:
+        """Elimina todas las versiones publicadas"""
+        while self._versiones:
+            self._eliminar(*self._versiones.popitem(last=False))
+    
+    def __enter__(self) -> "AlmacénCompartido":
+        return self
+    
+    def __exit__(self, *excepción) -> None:
+        self.cerrar()
+    
+    @staticmethod
+    def _eliminar(versión: int, memoria: SharedMemory) -> None:
+        # Si este proceso la tenía abierta (p. ej. al auditar), se suelta
+        instantánea = _ABIERTAS.pop(memoria.name, None)
+        if instantánea is not None:
+            instantánea.cerrar()
+        memoria.close()
+        # Los procesos que ya la tenían proyectada la conservan hasta soltarla
+        memoria.unlink()
+    
+    def __repr__(self):
+        versión = self.referencia.versión if self.referencia is not None else 0
+        return f"AlmacénCompartido({self.identificador}, versión {versión})"
+
+
+# Instantáneas abiertas por este proceso, de la menos a la más usada
+_ABIERTAS: OrderedDict = OrderedDict()
+_CAPACIDAD_ABIERTAS = 4
+
+
+def _vista(memoria: SharedMemory, desplazamiento: int, dtype: str, forma: Tuple[int, ...]) -> np.ndarray:
+    vista = np.ndarray(forma, dtype=dtype, buffer=memoria.buf, offset=desplazamiento)
+    vista.flags.writeable = False
+    return vista
+
+
+def _codificar(nombre: str, textos) -> Dict[str, np.ndarray]:
+    """Textos como bytes UTF-8 concatenados y sus límites"""
+    codificados = [str(texto).encode("utf-8") for texto in textos]
+    límites = np.zeros(len(codificados) + 1, dtype=np.int64)
+    np.cumsum([len(c) for c in codificados], out=límites[1:])
+    return {
+        f"{nombre}.bytes": np.frombuffer(b"".join(codificados), dtype=np.uint8),
+        f"{nombre}.límites": límites,
+    }
+
+
+def _decodificar(arrays: Dict[str, np.ndarray], nombre: str) -> List[str]:
+    datos = arrays[f"{nombre}.bytes"].tobytes()
+    límites = arrays[f"{nombre}.límites"].tolist()
+    return [datos[a:b].decode("utf-8") for a, b in zip(límites, límites[1:])]
@@ -0,0 +1,478 @@
+"""
+4. Ética del cuidado: basada en relaciones y responsabilidad.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any, Tuple, Iterable, Union
+
+from ._numpy import np
+from .utilidades import Acción, DetectorMarcadores
+from .tablas import AccionesLote, TablaAcciones
+from .cache import huella, _copiar
+
+
+class GrafoRelaciones:
+    """
+    Red de relaciones compilada: nodos internados (nombre → entero) y
+    adyacencia CSR (`indptr`, `vecinos`, `pesos`).
+    
+    Las relaciones son simétricas: si a está conectado con b, b lo está
+    con a. Se compila una vez y se reutiliza para todas las acciones;
+    `huella` identifica su contenido (para la caché de evaluaciones).
+    """
+    
+    def __init__(
+        self,
+        nodos: List[str],
+        indptr: np.ndarray,
+        vecinos: np.ndarray,
+        pesos: np.ndarray
+    ):
+        self.nodos = list(nodos)
+        self.id_nodo = {nodo: i for i, nodo in enumerate(self.nodos)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.vecinos = np.asarray(vecinos)
+        self.pesos = np.asarray(pesos, dtype=float)
+        
+        # Grado ponderado: cuánta relación hay en juego en cada nodo
+        self.grado = np.bincount(
+            self._filas(), weights=self.pesos, minlength=len(self.nodos)
+        )
+        # Peso de cada arista v → u al propagar: cada nodo recibe la media
+        # ponderada del efecto en sus vecinos
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._peso_propagación = self.pesos / self.grado[self.vecinos]
+        
+        self.huella = huella(
+            self.nodos, self.indptr.tobytes(), self.vecinos.tobytes(), self.pesos.tobytes()
+        )
+    
+    @classmethod
+    def desde_dict(cls, red: Dict[str, List[str]]) -> "GrafoRelaciones":
+        """Compila un mapa {nodo: [vecinos]}"""
+        origen = [nodo for nodo, vecinos in red.items() for _ in vecinos]
+        destino = [vecino for vecinos in red.values() for vecino in vecinos]
+        return cls.desde_aristas(origen, destino, nodos_aislados=list(red))
+    
+    @classmethod
+    def desde_aristas(
+        cls,
+        origen: Iterable,
+        destino: Iterable,
+        pesos: Iterable[float] = None,
+        nodos: List[str] = None,
+        nodos_aislados: Iterable[str] = ()
+    ) -> "GrafoRelaciones":
+        """
+        Compila una lista de aristas.
+        
+        Args:
+            origen, destino: Nombres de los extremos, o sus índices en
+                `nodos` si se indica (lo más rápido para millones de aristas)
+            pesos: Fuerza de cada relación (por defecto 1). Si una arista
+                aparece varias veces, se conserva la primera.
+        """
+        if nodos is None:
+            id_nodo: Dict[str, int] = {}
+            for nodo in nodos_aislados:
+                id_nodo.setdefault(nodo, len(id_nodo))
+            origen = np.array(
+                [id_nodo.setdefault(n, len(id_nodo)) for n in origen], dtype=np.int64
+            )
+            destino = np.array(
+                [id_nodo.setdefault(n, len(id_nodo)) for n in destino], dtype=np.int64
+            )
+            nodos = list(id_nodo)
+        else:
+            origen = np.asarray(origen, dtype=np.int64)
+            destino = np.asarray(destino, dtype=np.int64)
+        
+        n = len(nodos)
+        pesos = np.ones(len(origen)) if pesos is None else np.asarray(pesos, dtype=float)
+        
+        # Simetrizar, quitar lazos y aristas repetidas
+        sin_lazo = origen != destino
+        desde = np.concatenate((origen[sin_lazo], destino[sin_lazo]))
+        hasta = np.concatenate((destino[sin_lazo], origen[sin_lazo]))
+        peso = np.concatenate((pesos[sin_lazo], pesos[sin_lazo]))
+        _, primeras = np.unique(desde * n + hasta, return_index=True)
+        desde, hasta, peso = desde[primeras], hasta[primeras], peso[primeras]
+        
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(desde, minlength=n))))
+        tipo = np.int32 if n < 2 ** 31 else np.int64
+        return cls(nodos, indptr, hasta.astype(tipo), peso)
+    
+    @classmethod
+    def como_grafo(cls, red) -> "GrafoRelaciones":
+        """Devuelve el grafo tal cual, o lo compila desde un dict"""
+        if isinstance(red, cls):
+            return red
+        return cls.desde_dict(red or {})
+    
+    def __len__(self) -> int:
+        return len(self.nodos)
+    
+    def _filas(self) -> np.ndarray:
+        return np.repeat(np.arange(len(self.nodos)), np.diff(self.indptr))
+    
+    def propagar(
+        self,
+        acción_de: np.ndarray,
+        nodo: np.ndarray,
+        valor: np.ndarray,
+        saltos: int,
+        decaimiento: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Propaga efectos iniciales dispersos a `saltos` saltos de distancia.
+        
+        El efecto en cada nodo es Σ_t decaimiento^t · (Pᵗ x₀), con P la
+        media ponderada sobre los vecinos. Cada salto solo recorre las
+        aristas de los nodos alcanzados, así que el coste depende del
+        vecindario afectado y no del tamaño del grafo. Varias acciones se
+        propagan a la vez, sin mezclarse.
+        
+        Args:
+            acción_de, nodo, valor: Efecto inicial como tríos dispersos
+        
+        Returns:
+            (acción, nodo, efecto acumulado), ordenados por (acción, nodo)
+        """
+        n = len(self.nodos)
+        claves = [np.asarray(acción_de, dtype=np.int64) * n + nodo]
+        valores = [np.asarray(valor, dtype=float)]
+        frente_clave, frente_valor = claves[0], valores[0]
+        
+        for _ in range(saltos):
+            if not len(frente_clave):
+                break
+            acciones, nodos = np.divmod(frente_clave, n)
+            inicios = self.indptr[nodos]
+            longitudes = self.indptr[nodos + 1] - inicios
+            total = int(longitudes.sum())
+            posiciones = (
+                np.repeat(inicios - (np.cumsum(longitudes) - longitudes), longitudes)
+                + np.arange(total)
+            )
+            
+            clave = np.repeat(acciones, longitudes) * n + self.vecinos[posiciones]
+            aporte = (
+                np.repeat(frente_valor * decaimiento, longitudes)
+                * self._peso_propagación[posiciones]
+            )
+            frente_clave, inversa = np.unique(clave, return_inverse=True)
+            frente_valor = np.bincount(inversa.reshape(-1), weights=aporte)
+            claves.append(frente_clave)
+            valores.append(frente_valor)
+        
+        clave, inversa = np.unique(np.concatenate(claves), return_inverse=True)
+        efecto = np.bincount(inversa.reshape(-1), weights=np.concatenate(valores))
+        acciones, nodos = np.divmod(clave, n)
+        return acciones, nodos, efecto
+    
+    def __repr__(self):
+        return f"GrafoRelaciones({len(self)} nodos, {len(self.vecinos) // 2} relaciones)"
+
+
+RedRelaciones = Union[Dict[str, List[str]], GrafoRelaciones]
+
+
+def _adyacencia(red: Dict[str, List[str]]) -> Tuple[Dict[str, int], List[List[int]], List[float]]:
+    """
+    Lo mismo que compila `GrafoRelaciones.desde_dict`, en listas: los
+    mismos índices de nodo, los vecinos de cada uno en orden y su grado.
+    """
+    id_nodo: Dict[str, int] = {}
+    for nodo in red:
+        id_nodo.setdefault(nodo, len(id_nodo))
+    for vecinos_nodo in red.values():
+        for vecino in vecinos_nodo:
+            id_nodo.setdefault(vecino, len(id_nodo))
+    
+    # Simétricas, sin lazos ni repetidas
+    conjuntos = [set() for _ in id_nodo]
+    for nodo, vecinos_nodo in red.items():
+        a = id_nodo[nodo]
+        for vecino in vecinos_nodo:
+            b = id_nodo[vecino]
+            if a != b:
+                conjuntos[a].add(b)
+                conjuntos[b].add(a)
+    vecinos = [sorted(conjunto) for conjunto in conjuntos]
+    return id_nodo, vecinos, [float(len(v)) for v in vecinos]
+
+
+class ÉticaCuidado:
+    """
+    Filosofía: Énfasis en relaciones, interdependencia, y responsabilidad
+    hacia seres vulnerables.
+    
+    Desarrollada por Carol Gilligan y Nel Noddings.
+    
+    Fortalezas:
+    - Reconoce importancia de contexto y relación
+    - Valora empatía y compasión
+    - Atiende a vulnerabilidad
+    
+    Debilidades:
+    - Menos sistemática
+    - ¿Favorece los cercanos sobre extraños?
+    - Difícil de escalar globalmente
+    """
+    
+    PALABRAS_CUIDADO = ["proteger", "cuidar", "apoyar", "acompañar", "nutrir"]
+    
+    # Valor de `preserva_relaciones` cuando la acción no toca la red
+    PRESERVACIÓN_NEUTRA = 0.7
+    
+    # Las redes en forma de dict de hasta tantas relaciones se recorren en
+    # Python puro al evaluar una acción suelta, sin compilar ni cargar NumPy
+    RELACIONES_SIN_NUMPY = 10_000
+    
+    def __init__(self):
+        self._detector = DetectorMarcadores({
+            ("cuidado", "cuidado"): self.PALABRAS_CUIDADO
+        })
+        # Propagación de los efectos por la red de relaciones
+        self.saltos = 2
+        self.decaimiento = 0.5
+        # (copia de la última red, su compilación), para no repetirla
+        self._último_grafo: Tuple[Any, GrafoRelaciones] = (None, None)
+        self._última_adyacencia: Tuple[Any, Tuple] = (None, None)
+    
+    def evaluar_acción(
+        self, 
+        acción: Acción, 
+        red_relaciones: RedRelaciones
+    ) -> Dict:
+        """
+        Evalúa acción desde perspectiva de cuidado y relaciones.
+        
+        Args:
+            red_relaciones: Mapa de quién está conectado con quién, o un
+                `GrafoRelaciones` ya compilado
+        """
+        evaluación = {
+            "preserva_relaciones": self._preserva_relaciones(acción, red_relaciones),
+            "atiende_vulnerables": self._atiende_vulnerables(acción),
+            "expresa_cuidado": self._expresa_cuidado(acción),
+            "responsabilidad": self._evalúa_responsabilidad(acción),
+            "score": 0.0
+        }
+        
+        # Score compuesto
+        evaluación["score"] = (
+            evaluación["preserva_relaciones"]
+            + evaluación["atiende_vulnerables"]
+            + evaluación["expresa_cuidado"]
+            + evaluación["responsabilidad"]
+        ) / 4
+        
+        return evaluación
+    
+    def evaluar_lote(
+        self,
+        acciones: AccionesLote,
+        red_relaciones: RedRelaciones,
+        coincidencias: List[Dict] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Evalúa muchas acciones a la vez.
+        
+        Args:
+            coincidencias: Marcadores de cada descripción ya detectados por
+                un detector compartido; si se omiten, se detectan aquí
+        
+        Returns:
+            Dict con un array por componente de `evaluar_acción` y "score"
+        """
+        tabla = TablaAcciones.como_tabla(acciones)
+        n = len(tabla)
+        
+        ayudados = tabla.columna("vulnerables_ayudados")
+        dañados = tabla.columna("vulnerables_dañados")
+        atiende_vulnerables = np.where(
+            dañados > 0, -0.5, np.where(ayudados > 0, 0.8, 0.0)
+        )
+        
+        if coincidencias is None:
+            coincidencias = [self._detector.coincidencias(d) for d in tabla.descripciones]
+        
+        expresa_cuidado = np.array([
+            0.3 * len(marcadores.get(("cuidado", "cuidado"), ()))
+            for marcadores in coincidencias
+        ], dtype=float).reshape(n)
+        
+        lote = {
+            "preserva_relaciones": self._preservación_lote(tabla, red_relaciones),
+            "atiende_vulnerables": atiende_vulnerables,
+            "expresa_cuidado": expresa_cuidado,
+            "responsabilidad": np.full(n, 0.6),  # Placeholder
+        }
+        lote["score"] = np.mean(np.stack(list(lote.values())), axis=0)
+        return lote
+    
+    def _resultado_fila(self, lote: Dict[str, np.ndarray], i: int) -> Dict:
+        """Reconstruye el resultado de `evaluar_acción` para la fila i"""
+        return {
+            "preserva_relaciones": float(lote["preserva_relaciones"][i]),
+            "atiende_vulnerables": float(lote["atiende_vulnerables"][i]),
+            "expresa_cuidado": float(lote["expresa_cuidado"][i]),
+            "responsabilidad": float(lote["responsabilidad"][i]),
+            "score": float(lote["score"][i]),
+        }
+    
+    def _preserva_relaciones(self, acción: Acción, red: RedRelaciones) -> float:
+        """
+        ¿La acción fortalece o daña relaciones existentes?
+        
+        Sin red no hace falta compilar nada, y una red pequeña en forma de
+        dict se recorre en Python puro (`_preservación_escalar`): ninguno
+        de los dos casos importa NumPy.
+        """
+        if not red:
+            return self.PRESERVACIÓN_NEUTRA
+        if (
+            not isinstance(red, GrafoRelaciones)
+            and sum(map(len, red.values())) <= self.RELACIONES_SIN_NUMPY
+        ):
+            return self._preservación_escalar(acción, red)
+        if not len(self._compilar(red)):
+            return self.PRESERVACIÓN_NEUTRA
+        return float(self._preservación_lote(TablaAcciones.desde_lista([acción]), red)[0])
+    
+    def _preservación_escalar(self, acción: Acción, red: Dict[str, List[str]]) -> float:
+        """
+        `_preservación_lote` de una sola acción, en Python puro. Recorre
+        los nodos y las aristas en el mismo orden que la versión con
+        arrays y suma en el mismo orden, así que el resultado es idéntico.
+        """
+        id_nodo, vecinos, grado = self._memorizada("_última_adyacencia", red, _adyacencia)
+        
+        frente = [
+            (id_nodo[clave], max(-1.0, min(1.0, float(valor))))
+            for clave, valor in acción.consecuencias_predichas.items()
+            if clave in id_nodo
+        ]
+        efecto: Dict[int, float] = {}
+        for nodo, valor in frente:
+            efecto[nodo] = efecto.get(nodo, 0.0) + valor
+        
+        for _ in range(self.saltos):
+            if not frente:
+                break
+            siguiente: Dict[int, float] = {}
+            for nodo, valor in frente:
+                valor *= self.decaimiento
+                for vecino in vecinos[nodo]:
+                    siguiente[vecino] = siguiente.get(vecino, 0.0) + valor * (1.0 / grado[vecino])
+            frente = sorted(siguiente.items())
+            for nodo, valor in frente:
+                efecto[nodo] = efecto.get(nodo, 0.0) + valor
+        
+        balance = magnitud = 0.0
+        for nodo in sorted(efecto):
+            balance += efecto[nodo] * grado[nodo]
+            magnitud += abs(efecto[nodo]) * grado[nodo]
+        if not magnitud > 0:
+            return self.PRESERVACIÓN_NEUTRA
+        
+        cambio = balance / magnitud
+        neutra = self.PRESERVACIÓN_NEUTRA
+        return neutra + (1 - neutra) * cambio if cambio >= 0 else neutra + neutra * cambio
+    
+    def _preservación_lote(
+        self,
+        tabla: TablaAcciones,
+        red: RedRelaciones,
+        tamaño_bloque: int = 4096
+    ) -> np.ndarray:
+        """
+        Las consecuencias sobre nodos de la red se propagan a `saltos` de
+        distancia con `decaimiento` por salto (ver `GrafoRelaciones.propagar`).
+        Cada nodo pesa por su grado ponderado: cuánta relación pone en juego.
+        El balance Σ efecto·grado / Σ |efecto|·grado, entre -1 (solo daña
+        relaciones) y 1 (solo las fortalece), se lleva a [0, 1] con 0 en
+        `PRESERVACIÓN_NEUTRA`, que es también el valor de las acciones que
+        no tocan la red.
+        """
+        grafo = self._compilar(red)
+        n = len(tabla)
+        resultado = np.full(n, self.PRESERVACIÓN_NEUTRA)
+        if not len(grafo) or not len(tabla.valores):
+            return resultado
+        
+        # Consecuencias cuya clave es un nodo de la red
+        nodo_clave = np.array(
+            [grafo.id_nodo.get(clave, -1) for clave in tabla.claves], dtype=np.int64
+        )
+        nodos = nodo_clave[tabla.índices]
+        en_red = nodos >= 0
+        filas = tabla.filas()[en_red]
+        nodos = nodos[en_red]
+        valores = np.clip(tabla.valores[en_red], -1.0, 1.0)
+        
+        límites = np.searchsorted(filas, np.arange(0, n + tamaño_bloque, tamaño_bloque))
+        for bloque, (desde, hasta) in enumerate(zip(límites[:-1], límites[1:])):
+            if desde == hasta:
+                continue
+            inicio = bloque * tamaño_bloque
+            acciones, nodos_alcanzados, efecto = grafo.propagar(
+                filas[desde:hasta] - inicio, nodos[desde:hasta], valores[desde:hasta],
+                self.saltos, self.decaimiento
+            )
+            grado = grafo.grado[nodos_alcanzados]
+            balance = np.bincount(acciones, weights=efecto * grado, minlength=tamaño_bloque)
+            magnitud = np.bincount(
+                acciones, weights=np.abs(efecto) * grado, minlength=tamaño_bloque
+            )
+            
+            tocadas = np.flatnonzero(magnitud > 0)
+            cambio = balance[tocadas] / magnitud[tocadas]
+            neutra = self.PRESERVACIÓN_NEUTRA
+            resultado[inicio + tocadas] = np.where(
+                cambio >= 0, neutra + (1 - neutra) * cambio, neutra + neutra * cambio
+            )
+        return resultado
+    
+    def _compilar(self, red: RedRelaciones) -> GrafoRelaciones:
+        """
+        Compila la red, reutilizando la última si tiene el mismo contenido.
+        
+        Un dict se compara con una copia del último: un dict modificado en
+        el sitio se vuelve a compilar. Para redes muy grandes sale más
+        barato compilarlas una vez con `GrafoRelaciones.desde_dict` y pasar
+        el grafo, que no se compara.
+        """
+        if isinstance(red, GrafoRelaciones):
+            return red
+        return self._memorizada("_último_grafo", red or {}, GrafoRelaciones.como_grafo)
+    
+    def _memorizada(self, atributo: str, red: Dict[str, List[str]], compilar):
+        anterior, compilada = getattr(self, atributo)
+        if compilada is None or anterior != red:
+            compilada = compilar(red)
+            setattr(self, atributo, (_copiar(red), compilada))
+        return compilada
+    
+    def _atiende_vulnerables(self, acción: Acción) -> float:
+        """¿La acción protege o cuida a quienes son vulnerables?"""
+        consecuencias = acción.consecuencias_predichas
+        vulnerables_ayudados = consecuencias.get("vulnerables_ayudados", 0)
+        vulnerables_dañados = consecuencias.get("vulnerables_dañados", 0)
+        
+        if vulnerables_dañados > 0:
+            return -0.5
+        elif vulnerables_ayudados > 0:
+            return 0.8
+        return 0.0
+    
+    def _expresa_cuidado(self, acción: Acción) -> float:
+        """¿La acción manifiesta atención y cuidado genuino?"""
+        coincidencias = self._detector.coincidencias(acción.descripción)
+        return 0.3 * len(coincidencias.get(("cuidado", "cuidado"), ()))
+    
+    def _evalúa_responsabilidad(self, acción: Acción) -> float:
+        """¿El agente asume responsabilidad apropiada?"""
+        return 0.6  # Placeholder
@@ -0,0 +1,327 @@
+"""
+2. Deontología: basado en reglas y deberes.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any, Tuple, Union
+
+from ._numpy import np
+from .utilidades import Acción, DetectorMarcadores
+from .tablas import AccionesLote, TablaAcciones
+from .universalizacion import SimuladorUniversalización
+
+
+class ReglasCompiladas:
+    """
+    Reglas morales compiladas a posiciones de bit.
+    
+    La regla j ocupa el bit j (palabra j // 64 de un array uint64). Cada
+    circunstancia se traduce a la máscara de reglas que excusa, así que
+    comprobar excepciones es un AND en lugar de recorrer listas.
+    """
+    
+    __slots__ = ("reglas", "pesos", "firma", "palabras", "_bit_marcador", "_excusa")
+    
+    def __init__(self, reglas_morales: Dict[str, Dict]):
+        self.reglas = tuple(reglas_morales)
+        self.pesos = tuple(config["peso"] for config in reglas_morales.values())
+        self.firma = self.firma_de(reglas_morales)
+        self.palabras = max(1, -(-len(self.reglas) // 64))
+        self._bit_marcador = {
+            ("violación", regla): j for j, regla in enumerate(self.reglas)
+        }
+        self._excusa: Dict[str, int] = {}
+        for j, config in enumerate(reglas_morales.values()):
+            for excepción in config["excepciones"]:
+                self._excusa[excepción] = self._excusa.get(excepción, 0) | 1 << j
+    
+    @staticmethod
+    def firma_de(reglas_morales: Dict[str, Dict]) -> Tuple:
+        return tuple(
+            (regla, config["peso"], tuple(config["excepciones"]))
+            for regla, config in reglas_morales.items()
+        )
+    
+    def excusadas(self, contexto: Dict[str, Any]) -> int:
+        """Máscara de las reglas que las circunstancias del contexto excusan"""
+        máscara = 0
+        for circunstancia in contexto.get("circunstancias", []):
+            máscara |= self._excusa.get(circunstancia, 0)
+        return máscara
+    
+    def violaciones(self, coincidencias: List[Dict]) -> np.ndarray:
+        """Reglas con marcadores en cada descripción, como matriz (acción × palabra)"""
+        filas, bits = [], []
+        for i, marcadores in enumerate(coincidencias):
+            for grupo in marcadores:
+                bit = self._bit_marcador.get(grupo)
+                if bit is not None:
+                    filas.append(i)
+                    bits.append(bit)
+        
+        matriz = np.zeros((len(coincidencias), len(self.reglas)), dtype=bool)
+        matriz[filas, bits] = True
+        return self.empaquetar(matriz)
+    
+    def excusadas_lote(self, contextos: List[Dict[str, Any]]) -> np.ndarray:
+        """Máscaras de excusa (contexto × palabra); contextos iguales se resuelven una vez"""
+        índice: Dict[Tuple, int] = {}
+        máscaras: List[int] = []
+        posiciones = np.empty(len(contextos), dtype=np.intp)
+        for i, contexto in enumerate(contextos):
+            clave = tuple(contexto.get("circunstancias", []))
+            if clave not in índice:
+                índice[clave] = len(máscaras)
+                máscaras.append(self.excusadas(contexto))
+            posiciones[i] = índice[clave]
+        return self.de_enteros(máscaras)[posiciones]
+    
+    def scores(self, violadas: np.ndarray) -> np.ndarray:
+        """
+        Score de cada fila de máscaras: 1 menos los pesos violados, restados
+        en el orden de las reglas (como `Deontología.evaluar_acción`).
+        Se calcula una vez por máscara distinta.
+        """
+        if not len(violadas):
+            return np.empty(0)
+        distintas, inversa = np.unique(violadas, axis=0, return_inverse=True)
+        por_máscara = []
+        for máscara in self.a_enteros(distintas):
+            score = 1.0
+            for j, peso in enumerate(self.pesos):
+                if máscara >> j & 1:
+                    score -= peso
+            por_máscara.append(max(score, -1.0))
+        return np.array(por_máscara)[inversa.reshape(-1)]
+    
+    def empaquetar(self, matriz: np.ndarray) -> np.ndarray:
+        """Matriz booleana (fila × regla) → máscaras uint64 (fila × palabra)"""
+        octetos = np.packbits(matriz, axis=1, bitorder="little")
+        relleno = np.zeros((len(matriz), self.palabras * 8), dtype=np.uint8)
+        relleno[:, :octetos.shape[1]] = octetos
+        return relleno.view("<u8")
+    
+    def desempaquetar(self, máscaras: np.ndarray) -> np.ndarray:
+        """Máscaras uint64 (fila × palabra) → matriz booleana (fila × regla)"""
+        octetos = np.ascontiguousarray(máscaras, dtype="<u8").view(np.uint8)
+        return np.unpackbits(
+            octetos, axis=1, count=len(self.reglas), bitorder="little"
+        ).astype(bool)
+    
+    def de_enteros(self, máscaras: List[int]) -> np.ndarray:
+        return np.array(
+            [
+                [máscara >> (64 * p) & 0xFFFF_FFFF_FFFF_FFFF for p in range(self.palabras)]
+                for máscara in máscaras
+            ],
+            dtype=np.uint64
+        ).reshape(len(máscaras), self.palabras)
+    
+    def a_enteros(self, máscaras: np.ndarray) -> List[int]:
+        return [
+            sum(int(palabra) << (64 * p) for p, palabra in enumerate(fila))
+            for fila in máscaras.tolist()
+        ]
+
+
+class Deontología:
+    """
+    Filosofía: Algunas acciones son inherentemente correctas o incorrectas,
+    independientemente de sus consecuencias.
+    
+    Inspirada en Kant: actúa según máximas que podrías querer como ley universal.
+    
+    Fortalezas:
+    - Protege derechos individuales
+    - Clara y principista
+    - No justifica "el fin justifica los medios"
+    
+    Debilidades:
+    - Rígida (¿nunca mentir, incluso para salvar vidas?)
+    - Conflictos entre deberes
+    - A veces contra-intuitiva en casos extremos
+    """
+    
+    MARCADORES_VIOLACIÓN = {
+        "no_matar": ["matar", "terminar_vida", "causar_muerte"],
+        "no_mentir": ["mentir", "engañar", "falsificar"],
+        "no_manipular": ["manipular", "coaccionar", "forzar"],
+    }
+    
+    def __init__(self):
+        self.reglas_morales = {
+            "no_matar": {"peso": 1.0, "excepciones": ["auto-defensa"]},
+            "no_mentir": {"peso": 0.8, "excepciones": ["proteger_inocente"]},
+            "no_robar": {"peso": 0.7, "excepciones": ["necesidad_extrema"]},
+            "mantener_promesas": {"peso": 0.75, "excepciones": ["promesa_inmoral"]},
+            "no_manipular": {"peso": 0.9, "excepciones": []},
+            "respetar_autonomía": {"peso": 0.95, "excepciones": ["auto-daño_extremo"]},
+            "no_causar_sufrimiento": {"peso": 0.85, "excepciones": ["bien_mayor"]},
+        }
+        self._detector = DetectorMarcadores({
+            ("violación", regla): palabras
+            for regla, palabras in self.MARCADORES_VIOLACIÓN.items()
+        })
+        self.universalización = SimuladorUniversalización()
+    
+    def evaluar_acción(self, acción: Acción, contexto: Dict[str, Any]) -> Dict:
+        """
+        Evalúa si una acción viola reglas deontológicas.
+        
+        Returns:
+            Dict con reglas violadas y severidad
+        """
+        violaciones = []
+        score_moral = 1.0
+        excusadas = self.compiladas().excusadas(contexto)
+        
+        for j, (regla, config) in enumerate(self.reglas_morales.items()):
+            violación = self._verifica_violación(acción, regla, contexto)
+            
+            if violación:
+                # Verifica si hay excepción aplicable
+                excepción_aplica = excusadas >> j & 1
+                
+                if not excepción_aplica:
+                    violaciones.append({
+                        "regla": regla,
+                        "peso": config["peso"],
+                        "descripción": self._explicar_violación(regla)
+                    })
+                    score_moral -= config["peso"]
+        
+        return {
+            "score": max(score_moral, -1.0),
+            "violaciones": violaciones,
+            "es_permisible": len(violaciones) == 0,
+            "explicación": self._generar_explicación(violaciones)
+        }
+    
+    def compiladas(self) -> ReglasCompiladas:
+        """Las reglas compiladas; se recompilan si `reglas_morales` cambió"""
+        compiladas = getattr(self, "_compiladas", None)
+        if compiladas is None or compiladas.firma != ReglasCompiladas.firma_de(self.reglas_morales):
+            compiladas = self._compiladas = ReglasCompiladas(self.reglas_morales)
+        return compiladas
+    
+    def evaluar_lote(
+        self,
+        acciones: AccionesLote,
+        contextos: Union[Dict[str, Any], List[Dict[str, Any]]],
+        coincidencias: List[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Evalúa muchas acciones, en un contexto común o en uno por acción.
+        
+        Las violaciones de cada acción y las excepciones de cada contexto
+        son máscaras uint64 (ver `ReglasCompiladas`): la permisibilidad es
+        `violaciones & ~excusadas == 0` y el score se calcula una vez por
+        combinación distinta de reglas violadas, restando los pesos en el
+        mismo orden que `evaluar_acción`.
+        
+        Args:
+            contextos: Un contexto para todas las acciones o una lista con
+                uno por acción
+            coincidencias: Marcadores de cada descripción ya detectados por
+                un detector compartido; si se omiten, se detectan aquí
+        
+        Returns:
+            Dict con "reglas", "máscaras" (acción × palabra uint64, solo
+            violaciones sin excepción), la matriz booleana equivalente
+            "violaciones" (acción × regla), "score" y "es_permisible"
+        """
+        tabla = TablaAcciones.como_tabla(acciones)
+        compiladas = self.compiladas()
+        
+        if coincidencias is None:
+            coincidencias = [self._detector.coincidencias(d) for d in tabla.descripciones]
+        
+        violadas = compiladas.violaciones(coincidencias)
+        if isinstance(contextos, dict):
+            excusadas = compiladas.de_enteros([compiladas.excusadas(contextos)])
+        else:
+            if len(contextos) != len(tabla):
+                raise ValueError("Se necesita un contexto por acción")
+            excusadas = compiladas.excusadas_lote(contextos)
+        violadas &= ~excusadas
+        
+        return {
+            "reglas": list(compiladas.reglas),
+            "máscaras": violadas,
+            "violaciones": compiladas.desempaquetar(violadas),
+            "score": compiladas.scores(violadas),
+            "es_permisible": ~violadas.any(axis=1),
+        }
+    
+    def _resultado_fila(self, lote: Dict[str, Any], i: int) -> Dict:
+        """Reconstruye el resultado de `evaluar_acción` para la fila i"""
+        violaciones = [
+            {
+                "regla": regla,
+                "peso": self.reglas_morales[regla]["peso"],
+                "descripción": self._explicar_violación(regla)
+            }
+            for regla, violada in zip(lote["reglas"], lote["violaciones"][i])
+            if violada
+        ]
+        return {
+            "score": float(lote["score"][i]),
+            "violaciones": violaciones,
+            "es_permisible": bool(lote["es_permisible"][i]),
+            "explicación": self._generar_explicación(violaciones)
+        }
+    
+    def imperativo_categórico(self, acción: Acción) -> bool:
+        """
+        Test de Kant: ¿Podrías querer que TODOS actúen así en situación similar?
+        
+        "Actúa solo según aquella máxima que puedas querer que se convierta
+        en ley universal."
+        """
+        # Simulación: ¿qué pasaría si todos hacen esta acción?
+        mundo_donde_todos_hacen_esto = self._simular_universalización(acción)
+        
+        # ¿Es ese mundo coherente y deseable?
+        es_coherente = mundo_donde_todos_hacen_esto["coherente"]
+        es_deseable = mundo_donde_todos_hacen_esto["deseable"]
+        
+        return es_coherente and es_deseable
+    
+    def _verifica_violación(self, acción: Acción, regla: str, contexto: Dict) -> bool:
+        """Verifica si acción viola regla específica"""
+        # Implementación simplificada basada en palabras clave
+        coincidencias = self._detector.coincidencias(acción.descripción)
+        return bool(coincidencias.get(("violación", regla)))
+    
+    def _explicar_violación(self, regla: str) -> str:
+        explicaciones = {
+            "no_matar": "Violar santidad de vida",
+            "no_mentir": "Falta a deber de honestidad",
+            "no_manipular": "No respetar autonomía del otro",
+            "mantener_promesas": "Romper confianza interpersonal",
+        }
+        return explicaciones.get(regla, f"Violación de {regla}")
+    
+    def _generar_explicación(self, violaciones: List[Dict]) -> str:
+        if not violaciones:
+            return "Acción permisible según principios deontológicos"
+        
+        texto = "Acción problemática: viola "
+        texto += ", ".join([v["regla"] for v in violaciones])
+        return texto
+    
+    def _simular_universalización(self, acción: Acción) -> Dict:
+        """
+        Simula mundo donde todos hacen esta acción (ver
+        `SimuladorUniversalización`): la máxima son las reglas que viola,
+        sin excepciones de contexto, y su impacto medio predicho.
+        """
+        reglas_violadas = [
+            regla for regla in self.reglas_morales
+            if self._verifica_violación(acción, regla, {})
+        ]
+        máxima = self.universalización.máxima(reglas_violadas, acción.consecuencias_predichas)
+        # "coherente": ¿el mundo sigue siendo lógico?
+        # "deseable": ¿querrías vivir en ese mundo?
+        return self.universalización.simular(máxima)
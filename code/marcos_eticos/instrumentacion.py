@@ -0,0 +1,182 @@
+"""
+Instrumentación: saber dónde se va el tiempo.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any
+import threading
+import time
+
+
+class _Medido:
+    """
+    Envoltorio de un método instrumentado.
+    
+    Al serializarse vuelve a ser el método original: un framework
+    instrumentado puede enviarse a otros procesos, que lo reciben sin medir.
+    """
+    
+    __slots__ = ("función", "antes", "después")
+    
+    def __init__(self, función, antes, después):
+        self.función = función
+        self.antes = antes
+        self.después = después
+    
+    def __call__(self, *args, **kwargs):
+        if self.antes is not None:
+            self.antes(args)
+        inicio = time.perf_counter()
+        resultado = self.función(*args, **kwargs)
+        self.después(args, resultado, time.perf_counter() - inicio)
+        return resultado
+    
+    def __reduce__(self):
+        return getattr, (self.función.__self__, self.función.__name__)
+
+
+class Instrumentación:
+    """
+    Ganchos, temporizadores y contadores de `SabiduríaPráctica`.
+    
+    Se activa con `SabiduríaPráctica.instrumentar()`, que coloca envoltorios
+    en la propia instancia (no en la clase). Sin instrumentar no hay ningún
+    envoltorio ni ninguna llamada al reloj en el camino de evaluación.
+    
+    Ganchos:
+        on_framework_start(marco, acción)
+        on_framework_end(marco, acción, evaluación, segundos)
+        on_action_done(acción, análisis, segundos)
+    
+    En los caminos por lotes, `acción` es el lote completo para los ganchos
+    de framework, y `on_action_done` recibe cada acción con el tiempo del
+    lote repartido a partes iguales.
+    """
+    
+    def __init__(self):
+        self._cerrojo = threading.Lock()
+        self._al_empezar_marco: List = []
+        self._al_terminar_marco: List = []
+        self._al_terminar_acción: List = []
+        self.reiniciar()
+    
+    def on_framework_start(self, gancho):
+        self._al_empezar_marco.append(gancho)
+        return gancho
+    
+    def on_framework_end(self, gancho):
+        self._al_terminar_marco.append(gancho)
+        return gancho
+    
+    def on_action_done(self, gancho):
+        self._al_terminar_acción.append(gancho)
+        return gancho
+    
+    def reiniciar(self) -> None:
+        """Pone a cero temporizadores y contadores (los ganchos se conservan)"""
+        with self._cerrojo:
+            self._marcos: Dict[str, List[float]] = {}
+            self._pasos: Dict[str, List[float]] = {}
+            self.acciones = 0
+            self.segundos_acciones = 0.0
+    
+    def como_dict(self) -> Dict[str, Any]:
+        """Instantánea de las métricas"""
+        def tabla(medidas):
+            return {
+                nombre: {"llamadas": int(llamadas), "segundos": segundos, "máximo": máximo}
+                for nombre, (llamadas, segundos, máximo) in medidas.items()
+            }
+        
+        with self._cerrojo:
+            return {
+                "marcos": tabla(self._marcos),
+                "pasos": tabla(self._pasos),
+                "acciones": {"total": self.acciones, "segundos": self.segundos_acciones},
+            }
+    
+    def prometheus(self) -> str:
+        """Instantánea de las métricas en el formato de texto de Prometheus"""
+        métricas = self.como_dict()
+        líneas = []
+        
+        def familia(nombre, tipo, ayuda, muestras):
+            líneas.append(f"# HELP {nombre} {ayuda}")
+            líneas.append(f"# TYPE {nombre} {tipo}")
+            for etiquetas, valor in muestras:
+                líneas.append(f"{nombre}{etiquetas} {valor!r}")
+        
+        for grupo, etiqueta, ayuda in (
+            ("marcos", "marco", "por framework"),
+            ("pasos", "paso", "por paso interno"),
+        ):
+            medidas = sorted(métricas[grupo].items())
+            prefijo = f"etica_{etiqueta}"
+            familia(f"{prefijo}_llamadas_total", "counter", f"Llamadas {ayuda}", [
+                (f'{{{etiqueta}="{nombre}"}}', m["llamadas"]) for nombre, m in medidas
+            ])
+            familia(f"{prefijo}_segundos_total", "counter", f"Tiempo acumulado {ayuda}", [
+                (f'{{{etiqueta}="{nombre}"}}', m["segundos"]) for nombre, m in medidas
+            ])
+            familia(f"{prefijo}_segundos_max", "gauge", f"Llamada más lenta {ayuda}", [
+                (f'{{{etiqueta}="{nombre}"}}', m["máximo"]) for nombre, m in medidas
+            ])
+        
+        familia("etica_acciones_total", "counter", "Acciones evaluadas",
+                [("", métricas["acciones"]["total"])])
+        familia("etica_acciones_segundos_total", "counter",
+                "Tiempo acumulado evaluando acciones",
+                [("", métricas["acciones"]["segundos"])])
+        
+        return "\n".join(líneas) + "\n"
+    
+    # ------------------------------------------------------------------
+    # Envoltorios
+    # ------------------------------------------------------------------
+    
+    def _anotar(self, medidas: Dict[str, List[float]], nombre: str, segundos: float) -> None:
+        with self._cerrojo:
+            medida = medidas.get(nombre)
+            if medida is None:
+                medidas[nombre] = [1, segundos, segundos]
+            else:
+                medida[0] += 1
+                medida[1] += segundos
+                if segundos > medida[2]:
+                    medida[2] = segundos
+    
+    def _medir_marco(self, marco: str, función) -> _Medido:
+        def antes(args):
+            for gancho in self._al_empezar_marco:
+                gancho(marco, args[0])
+        
+        def después(args, evaluación, segundos):
+            self._anotar(self._marcos, marco, segundos)
+            for gancho in self._al_terminar_marco:
+                gancho(marco, args[0], evaluación, segundos)
+        
+        return _Medido(función, antes, después)
+    
+    def _medir_paso(self, paso: str, función) -> _Medido:
+        return _Medido(
+            función,
+            None,
+            lambda args, resultado, segundos: self._anotar(self._pasos, paso, segundos)
+        )
+    
+    def _medir_acción(self, función, por_lote: bool = False) -> _Medido:
+        def después(args, resultado, segundos):
+            análisis = resultado if por_lote else [resultado]
+            with self._cerrojo:
+                self.acciones += len(análisis)
+                self.segundos_acciones += segundos
+            if not self._al_terminar_acción or not análisis:
+                return
+            acciones = args[0] if por_lote else [args[0]]
+            por_acción = segundos / len(análisis)
+            for i, uno in enumerate(análisis):
+                for gancho in self._al_terminar_acción:
+                    gancho(acciones[i], uno, por_acción)
+        
+        return _Medido(función, None, después)
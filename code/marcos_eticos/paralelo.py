@@ -0,0 +1,93 @@
+"""
+Evaluación paralela: trabajadores de `SabiduríaPráctica.evaluar_decisiones`.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any, Tuple, Iterable, Iterator, Union
+import itertools
+
+from .utilidades import Acción
+from .tablas import TablaAcciones
+from .compartido import ReferenciaCompartida
+
+
+# Configuración recibida por cada proceso trabajador al iniciarse
+_CONFIGURACIÓN_TRABAJADOR = None
+
+
+def _iniciar_trabajador(configuración: Tuple) -> None:
+    global _CONFIGURACIÓN_TRABAJADOR
+    _CONFIGURACIÓN_TRABAJADOR = configuración
+    # Con fork el framework llega sin pasar por __getstate__: el registro de
+    # auditoría es del proceso principal, que anota los resultados al recibirlos
+    configuración[0].auditoría = None
+
+
+def _evaluar_trozo(
+    configuración: Tuple,
+    trozo: TablaAcciones,
+    determinista: bool,
+    modo_rápido: bool = False,
+    compacto: bool = False
+) -> List:
+    """Evalúa un trozo con la configuración dada o la del trabajador"""
+    sabiduría, stakeholders, contexto, red_relaciones = (
+        configuración or _CONFIGURACIÓN_TRABAJADOR
+    )
+    # Versiones en memoria compartida: vistas sin copia de las tablas
+    if isinstance(trozo, ReferenciaCompartida):
+        trozo = trozo.tabla_acciones()
+    if isinstance(stakeholders, ReferenciaCompartida):
+        stakeholders = stakeholders.tabla_stakeholders()
+    
+    if determinista or modo_rápido:
+        return [
+            sabiduría.evaluar_decisión_compleja(
+                acción, stakeholders, contexto, red_relaciones, modo_rápido
+            )
+            for acción in trozo
+        ]
+    if compacto:
+        return sabiduría.evaluar_lote_compacto(trozo, stakeholders, contexto, red_relaciones)
+    return sabiduría.evaluar_lote(trozo, stakeholders, contexto, red_relaciones)
+
+
+def _evaluar_en_trabajador(
+    trozo: TablaAcciones,
+    stakeholders,
+    contexto: Dict[str, Any],
+    red_relaciones,
+    compacto: bool = False
+) -> List:
+    """Evalúa un trozo con el framework del trabajador y sus propios stakeholders y contexto"""
+    sabiduría = _CONFIGURACIÓN_TRABAJADOR[0]
+    return _evaluar_trozo(
+        (sabiduría, stakeholders, contexto, red_relaciones), trozo, False, False, compacto
+    )
+
+
+def _trozos(
+    acciones: Union[Iterable[Acción], TablaAcciones, ReferenciaCompartida],
+    tamaño: int
+) -> Iterator[Union[TablaAcciones, ReferenciaCompartida]]:
+    """
+    Parte las acciones en tablas de `tamaño` filas, sin leerlas todas antes
+    (o, si están en memoria compartida, en referencias a tramos de filas)
+    """
+    if tamaño < 1:
+        raise ValueError("chunk_size debe ser al menos 1")
+    
+    if isinstance(acciones, (TablaAcciones, ReferenciaCompartida)):
+        # Una rebanada de tabla comparte los arrays; una de referencia solo
+        # anota el tramo
+        for inicio in range(0, len(acciones), tamaño):
+            yield acciones[inicio:inicio + tamaño]
+        return
+    
+    iterador = iter(acciones)
+    while True:
+        trozo = list(itertools.islice(iterador, tamaño))
+        if not trozo:
+            return
+        yield TablaAcciones.desde_lista(trozo)
@@ -0,0 +1,131 @@
+"""
+Frentes de Pareto: lo que ninguna otra opción mejora en todo.
+"""
+
+from __future__ import annotations
+
+from typing import List
+import bisect
+
+from ._numpy import np
+
+
+def frente_pareto(puntos: np.ndarray) -> np.ndarray:
+    """
+    Índices (ascendentes) de los puntos no dominados, maximizando cada
+    columna. Un punto domina a otro si no es peor en ningún objetivo y es
+    mejor en alguno; los puntos repetidos no se dominan entre sí.
+    
+    Con 2 objetivos es un barrido tras ordenar, con 3 una escalera
+    ordenada (ambos O(n log n)); con más, comparaciones vectorizadas por
+    bloques contra el frente parcial.
+    """
+    puntos = np.asarray(puntos, dtype=float)
+    if puntos.ndim != 2:
+        raise ValueError("Se esperaba una matriz (puntos × objetivos)")
+    if len(puntos) == 0:
+        return np.empty(0, dtype=np.intp)
+    
+    # Trabajar con puntos distintos: así "q ≥ p y q ≠ p" basta para dominar
+    únicos, inversa = np.unique(puntos, axis=0, return_inverse=True)
+    inversa = inversa.reshape(-1)
+    dimensión = puntos.shape[1]
+    
+    if dimensión == 1:
+        no_dominados = únicos[:, 0] == únicos[:, 0].max()
+    elif dimensión == 2:
+        no_dominados = _no_dominados_2d(únicos)
+    elif dimensión == 3:
+        no_dominados = _no_dominados_3d(únicos)
+    else:
+        no_dominados = _no_dominados_nd(únicos)
+    
+    return np.flatnonzero(no_dominados[inversa])
+
+
+def frentes_pareto(puntos: np.ndarray, máximo: int = None) -> List[np.ndarray]:
+    """
+    Capas de Pareto: la primera es el frente; cada siguiente es el frente
+    de lo que queda al retirar las anteriores.
+    
+    Args:
+        máximo: Número máximo de capas (None = hasta agotar los puntos)
+    """
+    puntos = np.asarray(puntos, dtype=float)
+    restantes = np.arange(len(puntos))
+    capas = []
+    while len(restantes) and (máximo is None or len(capas) < máximo):
+        frente = restantes[frente_pareto(puntos[restantes])]
+        capas.append(frente)
+        restantes = np.setdiff1d(restantes, frente, assume_unique=True)
+    return capas
+
+
+def _no_dominados_2d(únicos: np.ndarray) -> np.ndarray:
+    # En orden lexicográfico descendente, todo dominador va antes
+    orden = np.lexsort((-únicos[:, 1], -únicos[:, 0]))
+    y = únicos[orden, 1]
+    mejor_anterior = np.concatenate(([-np.inf], np.maximum.accumulate(y)[:-1]))
+    no_dominados = np.empty(len(únicos), dtype=bool)
+    no_dominados[orden] = y > mejor_anterior
+    return no_dominados
+
+
+def _no_dominados_3d(únicos: np.ndarray) -> np.ndarray:
+    orden = np.lexsort((-únicos[:, 2], -únicos[:, 1], -únicos[:, 0]))
+    
+    # Escalera de los ya vistos no dominados: y creciente, z decreciente.
+    # El mayor z entre los de y ≥ y_p es el del primer escalón con y ≥ y_p.
+    escalera_y: List[float] = []
+    escalera_z: List[float] = []
+    no_dominados = np.zeros(len(únicos), dtype=bool)
+    for i, (y, z) in zip(orden.tolist(), únicos[orden, 1:].tolist()):
+        posición = bisect.bisect_left(escalera_y, y)
+        if posición < len(escalera_y) and escalera_z[posición] >= z:
+            continue
+        no_dominados[i] = True
+        
+        # Retirar los escalones que el nuevo punto cubre (y ≤ y_p, z ≤ z_p)
+        inicio = posición
+        if posición < len(escalera_y) and escalera_y[posición] == y:
+            posición += 1
+        while inicio > 0 and escalera_z[inicio - 1] <= z:
+            inicio -= 1
+        escalera_y[inicio:posición] = [y]
+        escalera_z[inicio:posición] = [z]
+    return no_dominados
+
+
+def _no_dominados_nd(únicos: np.ndarray, bloque: int = 128) -> np.ndarray:
+    # Por suma descendente (y lexicográfico para desempatar) todo dominador
+    # va antes, o en el mismo bloque
+    claves = [-únicos[:, j] for j in reversed(range(únicos.shape[1]))]
+    orden = np.lexsort(claves + [-únicos.sum(axis=1)])
+    
+    frente = np.empty((0, únicos.shape[1]))
+    no_dominados = np.zeros(len(únicos), dtype=bool)
+    for inicio in range(0, len(orden), bloque):
+        índices = orden[inicio:inicio + bloque]
+        candidatos = únicos[índices]
+        
+        # Contra el frente por tramos: los primeros (mayor suma) descartan
+        # a casi todos, y los siguientes solo se comparan con los que quedan
+        vivos = np.arange(len(candidatos))
+        for desde in range(0, len(frente), bloque):
+            if not len(vivos):
+                break
+            tramo = frente[desde:desde + bloque]
+            dominados = np.any(
+                np.all(tramo[:, None, :] >= candidatos[None, vivos, :], axis=2), axis=0
+            )
+            vivos = vivos[~dominados]
+        
+        # Dentro del bloque, un candidato distinto ≥ en todo lo domina
+        restantes = candidatos[vivos]
+        dentro = np.all(restantes[:, None, :] >= restantes[None, :, :], axis=2)
+        np.fill_diagonal(dentro, False)
+        vivos = vivos[~np.any(dentro, axis=0)]
+        
+        no_dominados[índices[vivos]] = True
+        frente = np.concatenate((frente, candidatos[vivos]))
+    return no_dominados
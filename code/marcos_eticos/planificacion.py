@@ -0,0 +1,340 @@
+"""
+Planificación secuencial: cadenas de acciones por búsqueda en haz.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any, Iterator, Tuple
+from dataclasses import dataclass, field
+import time
+
+from ._numpy import np
+from .utilidades import Acción, Bandera
+from .tablas import AccionesLote, StakeholdersLote, TablaAcciones, TablaStakeholders
+from .sabiduria import SabiduríaPráctica
+
+
+@dataclass
+class Plan:
+    """Secuencia de acciones encontrada por `PlanificadorSecuencial`"""
+    acciones: List[Acción]
+    valor: float
+    pasos: List[float]  # contribución descontada de cada acción al valor
+    estado: Dict[str, float]  # impacto acumulado por stakeholder al terminar
+    anchura: int  # anchura del haz que encontró el plan
+    completo: bool  # False si el presupuesto de tiempo cortó la búsqueda
+    índices: List[int] = field(default_factory=list)  # posiciones entre los candidatos
+    
+    def __len__(self):
+        return len(self.acciones)
+
+
+class PlanificadorSecuencial:
+    """
+    Busca cadenas de acciones en lugar de evaluar cada acción suelta,
+    siguiendo el principio de precaución de `SabiduríaPráctica`:
+    favorecer acciones reversibles y de menor escala, y escalar después.
+    
+    Modelo:
+    - Estado: impacto acumulado en cada stakeholder, acotado a
+      ±`límite_impacto`. Cada acción suma sus consecuencias predichas al
+      estado, así que repetir el mismo beneficio rinde cada vez menos y
+      una acción vale según lo que ya se ha hecho antes.
+    - Valor de un paso: utilidad marginal (la del utilitarismo, sobre el
+      cambio real de estado) más `peso_consenso` · (consenso − 2) / 2, con
+      el consenso de los cuatro marcos, menos `penalización_alerta` si la
+      descripción tiene palabras de alerta. Con `solo_permisibles`, las
+      acciones que la deontología no permite no se consideran.
+    - Descuento: cada acción tiene una confianza
+      1 − incertidumbre · (1 − reversibilidad): la incertidumbre solo
+      cuesta si no se puede deshacer. Las ganancias de un paso se
+      multiplican por la confianza acumulada de la cadena hasta él,
+      incluido; las pérdidas cuentan enteras. Las acciones irreversibles e
+      inciertas acaban al final del plan, o fuera de él.
+    
+    El plan puede ser más corto que la profundidad pedida (incluso vacío:
+    no actuar) si los pasos siguientes restan.
+    
+    Lo que no depende del estado (deontología, virtud, cuidado, banderas)
+    se calcula una vez al crear el planificador; en la búsqueda solo se
+    recalcula la utilidad marginal, con álgebra de arrays para todos los
+    candidatos y memorizada por estado. Dos prefijos que llegan al mismo
+    estado con las mismas acciones (en otro orden) tienen el mismo
+    futuro: se conserva solo el que no está dominado en valor y confianza.
+    """
+    
+    # Estados con utilidades memorizadas antes de vaciar la memoria
+    MEMORIA_MÁXIMA = 4096
+    
+    def __init__(
+        self,
+        acciones: AccionesLote,
+        stakeholders: StakeholdersLote,
+        contexto: Dict[str, Any],
+        red_relaciones: Dict[str, List[str]] = None,
+        sabiduría: SabiduríaPráctica = None,
+        estado_inicial: Dict[str, float] = None,
+        límite_impacto: float = 1.0,
+        peso_consenso: float = 0.5,
+        penalización_alerta: float = 1.0,
+        solo_permisibles: bool = True,
+        repetir: bool = False
+    ):
+        """
+        Args:
+            acciones: Candidatas para cada paso del plan
+            estado_inicial: Impacto ya acumulado por stakeholder (0 si falta)
+            límite_impacto: Cota del impacto acumulado en cada stakeholder
+            peso_consenso: Peso del consenso frente a la utilidad marginal
+            penalización_alerta: Lo que resta una acción con palabras de alerta
+            solo_permisibles: Descartar acciones que violan reglas morales
+            repetir: Permitir la misma acción más de una vez en un plan
+        """
+        self.sabiduría = sabiduría or SabiduríaPráctica()
+        tabla = TablaAcciones.como_tabla(acciones)
+        tabla_stakeholders = TablaStakeholders.como_tabla(stakeholders)
+        self.acciones: List[Acción] = list(tabla)
+        self.n_acciones = len(tabla)
+        self.límite_impacto = límite_impacto
+        self.peso_consenso = peso_consenso
+        self.penalización_alerta = penalización_alerta
+        self.repetir = repetir
+        
+        # Lo que no depende del estado: un análisis por candidata
+        self.análisis = self.sabiduría.evaluar_lote_compacto(
+            tabla, tabla_stakeholders, contexto, red_relaciones
+        )
+        apoyos = np.array([r.apoyos for r in self.análisis], dtype=np.int64).reshape(-1)
+        # Bits 1-3: deontológica, virtud y cuidado (el 0 es el utilitarista)
+        self._apoyos_fijos = sum((apoyos >> bit) & 1 for bit in (1, 2, 3))
+        alerta = np.array(
+            [bool(r.banderas & Bandera.PROBLEMÁTICA) for r in self.análisis], dtype=bool
+        ).reshape(-1)
+        self._ajuste_fijo = -penalización_alerta * alerta
+        self._descartadas = (
+            (apoyos & 2) == 0 if solo_permisibles else np.zeros(self.n_acciones, dtype=bool)
+        )
+        self._confianza = 1 - tabla.incertidumbre * (1 - tabla.reversibilidad)
+        
+        # Impactos (acción × stakeholder) en coordenadas, ordenados por acción
+        filas, columnas, valores = self.sabiduría.utilitarismo._matriz_impacto(
+            tabla, tabla_stakeholders
+        )
+        self._filas = filas
+        self._columnas = columnas
+        self._valores = valores
+        self._florecimiento = tabla_stakeholders.capacidad_florecimiento[columnas]
+        self._importancia = tabla_stakeholders.importancia_moral[columnas]
+        self._tramos = np.searchsorted(filas, np.arange(self.n_acciones + 1))
+        self._factor = 1 - tabla.incertidumbre * 0.5
+        
+        self._nombres = list(tabla_stakeholders.nombres)
+        estado_inicial = estado_inicial or {}
+        self._estado_inicial = np.clip(
+            np.array([float(estado_inicial.get(n, 0.0)) for n in self._nombres]).reshape(-1),
+            -límite_impacto, límite_impacto
+        )
+        
+        self._memoria: Dict[bytes, np.ndarray] = {}
+        self.estados_evaluados = 0
+        self.aciertos_memoria = 0
+        self.prefijos_podados = 0
+        self._truncado = False
+    
+    # ------------------------------------------------------------------
+    # Búsqueda
+    # ------------------------------------------------------------------
+    
+    def planificar(
+        self,
+        profundidad: int = 5,
+        anchura: int = 32,
+        presupuesto: float = None,
+        progresivo: bool = False
+    ) -> Plan:
+        """
+        Mejor plan de hasta `profundidad` acciones.
+        
+        Args:
+            profundidad: Máximo de acciones del plan
+            anchura: Prefijos que se conservan en cada nivel del haz
+            presupuesto: Segundos disponibles; al agotarse se devuelve el
+                mejor plan encontrado hasta entonces
+            progresivo: Repetir la búsqueda con haces cada vez más anchos
+                mientras quede presupuesto (ver `planes`)
+        """
+        mejor = None
+        búsqueda = (
+            self.planes(profundidad, anchura, presupuesto) if progresivo
+            else self._buscar(profundidad, anchura, self._límite(presupuesto))
+        )
+        for mejor in búsqueda:
+            pass
+        return mejor
+    
+    def planes(
+        self,
+        profundidad: int = 5,
+        anchura: int = 8,
+        presupuesto: float = None,
+        anchura_máxima: int = 4096
+    ) -> Iterator[Plan]:
+        """
+        Modo anytime: planes cada vez mejores mientras quede presupuesto.
+        
+        Empieza con un haz de `anchura` y lo duplica en cada vuelta; la
+        memoria de estados se reutiliza entre vueltas. Se detiene al
+        agotar el presupuesto, al superar `anchura_máxima` o cuando el haz
+        ya no descarta ningún prefijo (más anchura no cambiaría nada). El
+        último plan producido es siempre el mejor; `completo` indica si la
+        búsqueda que lo encontró llegó a terminar.
+        """
+        límite = self._límite(presupuesto)
+        mejor = None
+        while anchura <= anchura_máxima:
+            self._truncado = False
+            for plan in self._buscar(profundidad, anchura, límite):
+                if (
+                    mejor is None or plan.valor > mejor.valor
+                    # El cierre de la búsqueda que encontró el mejor plan
+                    or (plan.completo and plan.anchura == mejor.anchura and plan.valor == mejor.valor)
+                ):
+                    mejor = plan
+                    yield plan
+            if not plan.completo or not self._truncado:
+                return
+            anchura *= 2
+    
+    def _buscar(self, profundidad: int, anchura: int, límite: float) -> Iterator[Plan]:
+        """
+        Búsqueda en haz: produce cada mejora (con `completo=False`, aún no
+        ha terminado) y, al final, el mejor plan.
+        """
+        n = self.n_acciones
+        estados = self._estado_inicial[None, :]
+        valores = np.zeros(1)
+        confianzas = np.ones(1)
+        prefijos: List[Tuple[int, ...]] = [()]
+        pasos: List[Tuple[float, ...]] = [()]
+        
+        mejor = (0.0, (), (), self._estado_inicial)
+        completo = True
+        for _ in range(profundidad):
+            if time.perf_counter() > límite:
+                completo = False
+                break
+            
+            ganancias = self._valor_paso(self._utilidades(estados))
+            confianza = confianzas[:, None] * self._confianza[None, :]
+            ganancias = np.where(ganancias > 0, ganancias * confianza, ganancias)
+            totales = valores[:, None] + ganancias
+            totales[:, self._descartadas] = -np.inf
+            if not self.repetir:
+                for b, prefijo in enumerate(prefijos):
+                    totales[b, list(prefijo)] = -np.inf
+            
+            # Candidatos en orden de valor; sobran para cubrir los podados
+            planos = totales.ravel()
+            k = min(4 * anchura, int(np.isfinite(planos).sum()))
+            if k == 0:
+                break
+            elegidos = np.argpartition(-planos, k - 1)[:k]
+            elegidos = elegidos[np.argsort(-planos[elegidos], kind="stable")]
+            
+            nuevos = []
+            vistos: Dict[Tuple, List[float]] = {}
+            usados = 0
+            for posición in elegidos.tolist():
+                usados += 1
+                b, i = divmod(posición, n)
+                prefijo = prefijos[b] + (i,)
+                estado = self._aplicar(estados[b], i)
+                clave = (None if self.repetir else frozenset(prefijo), estado.tobytes())
+                c = confianza[b, i]
+                # Llegan en orden de valor: lo domina quien tenga más confianza
+                if any(otra >= c for otra in vistos.get(clave, ())):
+                    self.prefijos_podados += 1
+                    continue
+                vistos.setdefault(clave, []).append(c)
+                nuevos.append((planos[posición], c, estado, prefijo, pasos[b] + (ganancias[b, i],)))
+                if len(nuevos) == anchura:
+                    break
+            # ¿Quedaron prefijos fuera del haz?
+            if usados < len(elegidos) or k < np.isfinite(planos).sum():
+                self._truncado = True
+            
+            valores = np.array([nodo[0] for nodo in nuevos])
+            confianzas = np.array([nodo[1] for nodo in nuevos])
+            estados = np.stack([nodo[2] for nodo in nuevos])
+            prefijos = [nodo[3] for nodo in nuevos]
+            pasos = [nodo[4] for nodo in nuevos]
+            
+            if valores[0] > mejor[0]:
+                mejor = (valores[0], prefijos[0], pasos[0], estados[0])
+                yield self._plan(mejor, anchura, False)
+        
+        yield self._plan(mejor, anchura, completo)
+    
+    # ------------------------------------------------------------------
+    # Estado y valor de los pasos
+    # ------------------------------------------------------------------
+    
+    def _utilidades(self, estados: np.ndarray) -> np.ndarray:
+        """Utilidad marginal de cada candidata desde cada estado (estado × acción)"""
+        claves = [estado.tobytes() for estado in estados]
+        # Las filas se toman antes de vaciar la memoria: un acierto de este
+        # mismo haz no se vuelve a calcular
+        filas = [self._memoria.get(clave) for clave in claves]
+        nuevas = list({clave: b for b, clave in enumerate(claves) if filas[b] is None}.values())
+        self.aciertos_memoria += len(claves) - len(nuevas)
+        
+        if nuevas:
+            antes = estados[nuevas][:, self._columnas]
+            después = np.clip(antes + self._valores, -self.límite_impacto, self.límite_impacto)
+            # Mismo orden de productos que Utilitarismo.evaluar_acción
+            contribuciones = (después - antes) * self._florecimiento * self._importancia
+            posiciones = (np.arange(len(nuevas))[:, None] * self.n_acciones + self._filas).ravel()
+            utilidades = np.bincount(
+                posiciones, weights=contribuciones.ravel(),
+                minlength=len(nuevas) * self.n_acciones
+            ).reshape(len(nuevas), self.n_acciones) * self._factor
+            if len(self._memoria) + len(nuevas) > self.MEMORIA_MÁXIMA:
+                self._memoria.clear()
+            for b, fila in zip(nuevas, utilidades):
+                self._memoria[claves[b]] = fila
+            # Los estados repetidos dentro del haz comparten fila
+            filas = [self._memoria[clave] if fila is None else fila for clave, fila in zip(claves, filas)]
+            self.estados_evaluados += len(nuevas)
+        
+        return np.stack(filas)
+    
+    def _valor_paso(self, utilidades: np.ndarray) -> np.ndarray:
+        """Valor sin descontar de cada paso: utilidad marginal, consenso y alertas"""
+        consenso = self._apoyos_fijos + (utilidades > 0)
+        return utilidades + self.peso_consenso * (consenso - 2) / 2 + self._ajuste_fijo
+    
+    def _aplicar(self, estado: np.ndarray, i: int) -> np.ndarray:
+        """Estado tras ejecutar la acción `i`"""
+        tramo = slice(self._tramos[i], self._tramos[i + 1])
+        nuevo = estado.copy()
+        columnas = self._columnas[tramo]
+        nuevo[columnas] = np.clip(
+            nuevo[columnas] + self._valores[tramo], -self.límite_impacto, self.límite_impacto
+        )
+        return nuevo
+    
+    def _plan(self, nodo, anchura: int, completo: bool) -> Plan:
+        valor, prefijo, pasos, estado = nodo
+        return Plan(
+            acciones=[self.acciones[i] for i in prefijo],
+            valor=float(valor),
+            pasos=[float(p) for p in pasos],
+            estado=dict(zip(self._nombres, estado.tolist())),
+            anchura=anchura,
+            completo=completo,
+            índices=list(prefijo),
+        )
+    
+    @staticmethod
+    def _límite(presupuesto: float = None) -> float:
+        return float("inf") if presupuesto is None else time.perf_counter() + presupuesto
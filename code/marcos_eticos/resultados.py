@@ -0,0 +1,182 @@
+"""
+Resultados compactos: códigos primero, textos solo si se piden.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Dict, Tuple
+
+from ._numpy import np
+from .utilidades import Acción, Bandera, NivelConsenso, Recomendación
+
+if TYPE_CHECKING:
+    from .sabiduria import SabiduríaPráctica
+
+
+class ResultadoAnálisis:
+    """
+    Análisis multi-framework de una acción en forma compacta.
+    
+    Guarda números y códigos: scores, reglas violadas como máscara de bits
+    (en el orden de `reglas`), expresión de cada virtud, componentes del
+    cuidado, perspectivas que apoyan la acción (`apoyos`, un bit por
+    marco de `SabiduríaPráctica.MARCOS`), `consenso`, `banderas` y
+    `recomendación`. Los textos (razones, explicaciones, consejo,
+    descripciones) se generan solo al pedirlos; `como_dict()` devuelve
+    exactamente el dict de `SabiduríaPráctica.evaluar_decisión_compleja`.
+    """
+    
+    __slots__ = (
+        "acción", "utilidad", "score_deontológico", "violaciones",
+        "expresión_virtudes", "cultiva_carácter", "cuidado", "score_cuidado",
+        "apoyos", "consenso", "banderas", "recomendación",
+        "reglas", "virtudes", "_sabiduría",
+    )
+    
+    COMPONENTES_CUIDADO = (
+        "preserva_relaciones", "atiende_vulnerables",
+        "expresa_cuidado", "responsabilidad",
+    )
+    
+    def __init__(
+        self,
+        acción: Acción,
+        utilidad: float,
+        score_deontológico: float,
+        violaciones: int,
+        expresión_virtudes: np.ndarray,
+        cultiva_carácter: bool,
+        cuidado: Tuple[float, float, float, float],
+        score_cuidado: float,
+        apoyos: int,
+        consenso: NivelConsenso,
+        banderas: Bandera,
+        recomendación: Recomendación,
+        reglas: Tuple[str, ...],
+        virtudes: Tuple[str, ...],
+        sabiduría: SabiduríaPráctica
+    ):
+        self.acción = acción
+        self.utilidad = utilidad
+        self.score_deontológico = score_deontológico
+        self.violaciones = violaciones
+        self.expresión_virtudes = expresión_virtudes
+        self.cultiva_carácter = cultiva_carácter
+        self.cuidado = cuidado
+        self.score_cuidado = score_cuidado
+        self.apoyos = apoyos
+        self.consenso = consenso
+        self.banderas = banderas
+        self.recomendación = recomendación
+        self.reglas = reglas
+        self.virtudes = virtudes
+        self._sabiduría = sabiduría
+    
+    @property
+    def nombre(self) -> str:
+        return self.acción.nombre
+    
+    @property
+    def es_permisible(self) -> bool:
+        return not self.violaciones
+    
+    @property
+    def reglas_violadas(self) -> List[str]:
+        return [r for b, r in enumerate(self.reglas) if self.violaciones >> b & 1]
+    
+    def apoya(self, marco: str) -> bool:
+        from .sabiduria import SabiduríaPráctica
+        return bool(self.apoyos >> SabiduríaPráctica.MARCOS.index(marco) & 1)
+    
+    # ------------------------------------------------------------------
+    # Textos, generados al pedirlos
+    # ------------------------------------------------------------------
+    
+    @property
+    def texto_consenso(self) -> str:
+        return self._sabiduría._texto_consenso(int(self.consenso))
+    
+    @property
+    def texto_recomendación(self) -> str:
+        return self.recomendación.texto(len(self.banderas_rojas))
+    
+    @property
+    def banderas_rojas(self) -> List[str]:
+        return self.banderas.textos()
+    
+    @property
+    def explicación(self) -> str:
+        """Explicación deontológica"""
+        return self.evaluación("deontológica")["explicación"]
+    
+    @property
+    def consejo(self) -> str:
+        return self._sabiduría.virtud._consejo_virtuoso(self.acción)
+    
+    def evaluación(self, marco: str):
+        """Lo que devolvería `evaluar_acción` del framework indicado"""
+        sabiduría = self._sabiduría
+        if marco == "utilitarista":
+            return self.utilidad
+        
+        if marco == "deontológica":
+            deontología = sabiduría.deontología
+            violaciones = [
+                {
+                    "regla": regla,
+                    "peso": deontología.reglas_morales[regla]["peso"],
+                    "descripción": deontología._explicar_violación(regla)
+                }
+                for regla in self.reglas_violadas
+            ]
+            return {
+                "score": self.score_deontológico,
+                "violaciones": violaciones,
+                "es_permisible": self.es_permisible,
+                "explicación": deontología._generar_explicación(violaciones)
+            }
+        
+        if marco == "virtud":
+            lote = {
+                "virtudes": self.virtudes,
+                "expresión": self.expresión_virtudes[None, :],
+                "cultiva_carácter": [self.cultiva_carácter],
+            }
+            return sabiduría.virtud._resultado_fila(lote, 0, self.acción)
+        
+        evaluación = dict(zip(self.COMPONENTES_CUIDADO, self.cuidado))
+        evaluación["score"] = self.score_cuidado
+        return evaluación
+    
+    def como_dict(self) -> Dict:
+        """Vista compatible: el dict de `evaluar_decisión_compleja`"""
+        sabiduría = self._sabiduría
+        return {
+            "acción": self.acción.nombre,
+            "perspectivas": {
+                marco: sabiduría._perspectiva(marco, self.evaluación(marco))
+                for marco in sabiduría.MARCOS
+            },
+            "consenso": self.texto_consenso,
+            "banderas_rojas": self.banderas_rojas,
+            "recomendación": self.texto_recomendación,
+            "incertidumbre": self.acción.incertidumbre
+        }
+    
+    def __getstate__(self):
+        # El framework no viaja con el resultado: quien lo recibe lo vuelve
+        # a enlazar (ver SabiduríaPráctica.evaluar_decisiones)
+        return tuple(
+            None if nombre == "_sabiduría" else getattr(self, nombre)
+            for nombre in self.__slots__
+        )
+    
+    def __setstate__(self, estado):
+        for nombre, valor in zip(self.__slots__, estado):
+            setattr(self, nombre, valor)
+    
+    def __repr__(self):
+        return (
+            f"ResultadoAnálisis({self.acción.nombre!r}, {self.consenso.name}, "
+            f"{self.recomendación.name}, banderas={self.banderas!r})"
+        )
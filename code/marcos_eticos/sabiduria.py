@@ -0,0 +1,930 @@
+"""
+5. Framework integrado: Sabiduría Práctica.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Dict, Any, Tuple, Iterable, Iterator, Union, Callable
+from collections import deque
+from contextlib import nullcontext
+import os
+import time
+
+from ._numpy import np
+from .utilidades import (
+    Acción,
+    Bandera,
+    DetectorMarcadores,
+    NivelConsenso,
+    Recomendación,
+    Stakeholder,
+)
+from .tablas import AccionesLote, StakeholdersLote, TablaAcciones, TablaStakeholders
+from .utilitarismo import Utilitarismo
+from .deontologia import Deontología
+from .virtud import ÉticaVirtud
+from .cuidado import GrafoRelaciones, RedRelaciones, ÉticaCuidado
+from .cache import CachéEvaluaciones, huella, huella_acción, _copiar
+from .instrumentacion import Instrumentación
+from .pareto import frentes_pareto
+from .resultados import ResultadoAnálisis
+from .compartido import AlmacénCompartido, ReferenciaCompartida
+from .paralelo import _evaluar_trozo, _iniciar_trabajador, _trozos
+
+if TYPE_CHECKING:
+    from .auditoria import RegistroAuditoría
+
+
+class SabiduríaPráctica:
+    """
+    Framework que integra múltiples sistemas éticos.
+    
+    Ningún sistema ético es perfecto solo. La sabiduría real viene de:
+    1. Considerar múltiples perspectivas
+    2. Atender al contexto
+    3. Humildad epistémica
+    4. Disposición a revisar
+    
+    Con una `CachéEvaluaciones`, cada perspectiva se memoriza por separado:
+    cambiar los stakeholders solo obliga a recalcular la utilitarista, y
+    cambiar las circunstancias solo la deontológica.
+    """
+    
+    PALABRAS_ALERTA = ["eliminar", "forzar", "manipular", "engañar", "ocultar"]
+    
+    MARCOS = ("utilitarista", "deontológica", "virtud", "cuidado")
+    
+    # Veredicto de las perspectivas que el modo rápido no llegó a evaluar
+    NO_EVALUADO = "not_evaluated"
+    
+    def __init__(self, caché: CachéEvaluaciones = None, normalización: str = "minúsculas"):
+        """
+        Args:
+            caché: Memoriza cada perspectiva por separado (ver arriba)
+            normalización: Cómo se buscan los marcadores en las descripciones:
+                "minúsculas", "plegado" (sin tildes) o "raíces" (también
+                insensible a la flexión); ver `DetectorMarcadores`
+        """
+        self.caché = caché
+        self.utilitarismo = Utilitarismo()
+        self.deontología = Deontología()
+        self.virtud = ÉticaVirtud()
+        self.cuidado = ÉticaCuidado()
+        
+        # Un único detector para todos: cada descripción se recorre una vez
+        self._detector = DetectorMarcadores.combinar(
+            self.deontología._detector,
+            self.virtud._detector,
+            self.cuidado._detector,
+            DetectorMarcadores({("alerta", "alerta"): self.PALABRAS_ALERTA}),
+            modo=normalización,
+        )
+        for marco in (self.deontología, self.virtud, self.cuidado):
+            marco._detector = self._detector
+        
+        # Orden del modo rápido: de más barato a más caro (ver calibrar_modo_rápido)
+        self.orden_rápido = ["deontológica", "virtud", "cuidado", "utilitarista"]
+        
+        self.instrumentación: Instrumentación = None
+        self._envoltorios: List[Tuple[Any, str]] = []
+        self.auditoría: RegistroAuditoría = None
+        
+        # espacio → (copia del contenido, su huella), para la caché
+        self._huellas: Dict[str, Tuple[Any, str]] = {}
+    
+    def instrumentar(self, instrumentación: Instrumentación = None) -> Instrumentación:
+        """
+        Activa la instrumentación (ver `Instrumentación`).
+        
+        Mide cada framework, la detección de palabras clave y los pasos
+        internos (`_verifica_violación`, `_mide_expresión_virtud`,
+        `_identificar_banderas_rojas`, `_evaluar_consenso`,
+        `_generar_recomendación` y `_componer_análisis`, que incluye la
+        construcción del dict). Las evaluaciones servidas desde la caché
+        no cuentan como llamadas al framework.
+        
+        Returns:
+            La instrumentación activa, de la que leer las métricas
+        """
+        self.desinstrumentar()
+        instr = instrumentación or Instrumentación()
+        
+        def envolver(objeto, nombre, envoltorio):
+            setattr(objeto, nombre, envoltorio(getattr(objeto, nombre)))
+            self._envoltorios.append((objeto, nombre))
+        
+        for marco, objeto in zip(
+            self.MARCOS, (self.utilitarismo, self.deontología, self.virtud, self.cuidado)
+        ):
+            for nombre in ("evaluar_acción", "evaluar_lote"):
+                envolver(objeto, nombre, lambda f, marco=marco: instr._medir_marco(marco, f))
+        
+        for objeto, nombre in (
+            (self._detector, "coincidencias"),
+            (self.deontología, "_verifica_violación"),
+            (self.virtud, "_mide_expresión_virtud"),
+            (self, "_identificar_banderas_rojas"),
+            (self, "_evaluar_consenso"),
+            (self, "_generar_recomendación"),
+            (self, "_componer_análisis"),
+        ):
+            envolver(objeto, nombre, lambda f, nombre=nombre: instr._medir_paso(nombre, f))
+        
+        envolver(self, "evaluar_decisión_compleja", instr._medir_acción)
+        envolver(self, "evaluar_lote", lambda f: instr._medir_acción(f, por_lote=True))
+        
+        self.instrumentación = instr
+        return instr
+    
+    def desinstrumentar(self) -> None:
+        """Retira los envoltorios: vuelve al camino sin medir"""
+        for objeto, nombre in reversed(self._envoltorios):
+            delattr(objeto, nombre)
+        self._envoltorios = []
+        self.instrumentación = None
+    
+    def __getstate__(self):
+        # Los otros procesos reciben el framework sin instrumentar (ver _Medido)
+        estado = self.__dict__.copy()
+        for objeto, nombre in self._envoltorios:
+            if objeto is self:
+                del estado[nombre]
+        estado["instrumentación"] = None
+        estado["_envoltorios"] = []
+        # El registro de auditoría se queda aquí: los resultados de otros
+        # procesos se registran al recibirlos
+        estado["auditoría"] = None
+        return estado
+    
+    def auditar(self, registro: RegistroAuditoría = None) -> RegistroAuditoría:
+        """
+        Registra en `registro` cada análisis de `evaluar_decisión_compleja`,
+        de las evaluaciones por lotes y de `evaluar_decisiones` (ver
+        `RegistroAuditoría`). Con None deja de registrar.
+        
+        Returns:
+            El registro activo
+        """
+        self.auditoría = registro
+        return registro
+    
+    def evaluar_decisión_compleja(
+        self, 
+        acción: Acción,
+        stakeholders: List[Stakeholder],
+        contexto: Dict[str, Any],
+        red_relaciones: Dict[str, List[str]] = None,
+        modo_rápido: bool = False
+    ) -> Dict:
+        """
+        Evaluación multi-framework de una decisión.
+        
+        Args:
+            modo_rápido: Evalúa los frameworks en el orden de `orden_rápido`
+                y se detiene en cuanto la recomendación ya no puede cambiar.
+                Las perspectivas omitidas (y el consenso, si queda abierto)
+                se marcan como `NO_EVALUADO`; la recomendación es la misma
+                que la de la evaluación completa.
+        
+        Returns:
+            Análisis completo desde múltiples perspectivas éticas
+        """
+        if modo_rápido:
+            análisis = self._evaluar_rápido(acción, stakeholders, contexto, red_relaciones)
+        
+        elif self.caché is None:
+            # Evaluar desde cada perspectiva
+            eval_util = self.utilitarismo.evaluar_acción(acción, stakeholders)
+            eval_deonto = self.deontología.evaluar_acción(acción, contexto)
+            eval_virtud = self.virtud.evaluar_acción(acción)
+            eval_cuidado = self.cuidado.evaluar_acción(
+                acción, 
+                red_relaciones or {}
+            )
+            
+            análisis = self._componer_análisis(
+                acción, eval_util, eval_deonto, eval_virtud, eval_cuidado
+            )
+        
+        else:
+            huella_de_acción = huella_acción(acción)
+            evaluaciones = [
+                self._evaluar_marco(
+                    marco, acción, stakeholders, contexto, red_relaciones,
+                    huella_de_acción
+                )
+                for marco in self.MARCOS
+            ]
+            banderas = self._banderas_memorizadas(acción, huella_de_acción)
+            análisis = self._desligar(
+                self._componer_análisis(acción, *evaluaciones, banderas=banderas)
+            )
+        
+        if self.auditoría is not None:
+            self.auditoría.registrar(acción, análisis)
+        return análisis
+    
+    def _evaluar_marco(
+        self,
+        marco: str,
+        acción: Acción,
+        stakeholders: List[Stakeholder],
+        contexto: Dict[str, Any],
+        red_relaciones: Dict[str, List[str]],
+        huella_de_acción: str = None
+    ):
+        """
+        Evalúa un framework, pasando por la caché si la hay. Lo que sale de
+        la caché no es una copia: no se modifica, y los análisis que lo
+        usan se desligan de ella con `_desligar`.
+        """
+        if self.caché is None:
+            return self._calcular_marco(
+                marco, acción, stakeholders, contexto, red_relaciones
+            )
+        
+        clave = (
+            huella_de_acción or huella_acción(acción),
+            self._huella_entradas(marco, stakeholders, contexto, red_relaciones),
+        )
+        configuración = self._huella_configuración(marco)
+        
+        encontrado, evaluación = self.caché.obtener(marco, configuración, clave, copiar=False)
+        if not encontrado:
+            evaluación = self._calcular_marco(
+                marco, acción, stakeholders, contexto, red_relaciones
+            )
+            self.caché.guardar(marco, configuración, clave, evaluación, copiar=False)
+        return evaluación
+    
+    def _huella_entradas(
+        self,
+        marco: str,
+        stakeholders: List[Stakeholder],
+        contexto: Dict[str, Any],
+        red_relaciones: Dict[str, List[str]]
+    ) -> str:
+        """Huella de lo que, además de la acción, usa cada framework"""
+        if marco == "utilitarista":
+            return self._huella_memorizada("stakeholders", [
+                (s.nombre, s.tipo, s.capacidad_sufrimiento,
+                 s.capacidad_florecimiento, s.importancia_moral)
+                for s in stakeholders
+            ])
+        if marco == "deontológica":
+            # Solo importa qué circunstancias están presentes
+            return huella(sorted(set(contexto.get("circunstancias", []))))
+        if marco == "cuidado":
+            if isinstance(red_relaciones, GrafoRelaciones):
+                return red_relaciones.huella
+            red = red_relaciones or {}
+            return self._huella_memorizada("relaciones", red, lambda: huella(sorted(
+                (nodo, list(vecinos)) for nodo, vecinos in red.items()
+            )))
+        return ""
+    
+    def _huella_configuración(self, marco: str) -> str:
+        """Huella de la configuración de un framework (reglas, virtudes...)"""
+        if marco == "deontológica":
+            configuración = (
+                self.deontología.reglas_morales,
+                self.deontología.MARCADORES_VIOLACIÓN,
+                self._detector.modo,
+            )
+        elif marco == "virtud":
+            configuración = (
+                self.virtud.virtudes, self.virtud.MARCADORES_VIRTUD, self._detector.modo
+            )
+        elif marco == "cuidado":
+            configuración = (
+                self.cuidado.PALABRAS_CUIDADO,
+                self._detector.modo,
+                self.cuidado.saltos,
+                self.cuidado.decaimiento,
+            )
+        elif marco == "banderas":
+            configuración = (self.PALABRAS_ALERTA, self._detector.modo)
+        else:
+            return ""
+        return self._huella_memorizada(marco, configuración)
+    
+    def _huella_memorizada(self, espacio: str, contenido, calcular: Callable[[], str] = None) -> str:
+        """
+        Huella de `contenido` (o la que dé `calcular`), reutilizada
+        mientras el contenido sea igual al de la última vez: compararlo con
+        una copia cuesta mucho menos que serializarlo y hashearlo en cada
+        evaluación, y sigue detectando los cambios hechos en el sitio.
+        """
+        anterior = self._huellas.get(espacio)
+        if anterior is not None and anterior[0] == contenido:
+            return anterior[1]
+        valor = calcular() if calcular is not None else huella(contenido)
+        self._huellas[espacio] = (_copiar(contenido), valor)
+        return valor
+    
+    def _banderas_memorizadas(self, acción: Acción, huella_de_acción: str) -> List[str]:
+        configuración = self._huella_configuración("banderas")
+        encontrado, banderas = self.caché.obtener(
+            "banderas", configuración, huella_de_acción, copiar=False
+        )
+        if not encontrado:
+            banderas = self._identificar_banderas_rojas(acción)
+            self.caché.guardar("banderas", configuración, huella_de_acción, banderas, copiar=False)
+        return banderas
+    
+    @staticmethod
+    def _desligar(análisis: Dict) -> Dict:
+        """
+        Copia las listas de un análisis compuesto con evaluaciones de la
+        caché, que son las suyas; el resto de sus valores son inmutables.
+        Sale mucho más barato que copiar cada evaluación al leerla.
+        """
+        for perspectiva in análisis["perspectivas"].values():
+            for clave, valor in perspectiva.items():
+                if isinstance(valor, list):
+                    perspectiva[clave] = _copiar(valor)
+        análisis["banderas_rojas"] = list(análisis["banderas_rojas"])
+        return análisis
+    
+    def _calcular_marco(
+        self,
+        marco: str,
+        acción: Acción,
+        stakeholders: List[Stakeholder],
+        contexto: Dict[str, Any],
+        red_relaciones: Dict[str, List[str]]
+    ):
+        if marco == "utilitarista":
+            return self.utilitarismo.evaluar_acción(acción, stakeholders)
+        if marco == "deontológica":
+            return self.deontología.evaluar_acción(acción, contexto)
+        if marco == "virtud":
+            return self.virtud.evaluar_acción(acción)
+        return self.cuidado.evaluar_acción(acción, red_relaciones or {})
+    
+    def _evaluar_rápido(
+        self,
+        acción: Acción,
+        stakeholders: List[Stakeholder],
+        contexto: Dict[str, Any],
+        red_relaciones: Dict[str, List[str]]
+    ) -> Dict:
+        """
+        Evaluación con cortocircuito.
+        
+        Las banderas rojas son baratas y se calculan siempre. Después de
+        cada framework se acota el número final de apoyos entre los ya
+        obtenidos y los posibles; si todos los valores de ese intervalo
+        llevan a la misma recomendación, el resto no hace falta. Por
+        ejemplo, con banderas rojas basta con un apoyo para descartar
+        "NO RECOMENDADA", y la recomendación queda en "EXTREMA CAUTELA".
+        """
+        huella_de_acción = None
+        if self.caché is None:
+            banderas = self._identificar_banderas_rojas(acción)
+        else:
+            huella_de_acción = huella_acción(acción)
+            banderas = self._banderas_memorizadas(acción, huella_de_acción)
+        
+        evaluaciones = {}
+        apoyos = 0
+        recomendación = None
+        for marco in self.orden_rápido:
+            evaluaciones[marco] = self._evaluar_marco(
+                marco, acción, stakeholders, contexto, red_relaciones,
+                huella_de_acción
+            )
+            apoyos += self._apoya(marco, evaluaciones[marco])
+            
+            pendientes = len(self.MARCOS) - len(evaluaciones)
+            posibles = {
+                self._generar_recomendación({
+                    "consenso": self._texto_consenso(acuerdo),
+                    "banderas_rojas": banderas,
+                })
+                for acuerdo in range(apoyos, apoyos + pendientes + 1)
+            }
+            if len(posibles) == 1:
+                recomendación = posibles.pop()
+                break
+        
+        completo = len(evaluaciones) == len(self.MARCOS)
+        análisis = {
+            "acción": acción.nombre,
+            "perspectivas": {
+                marco: self._perspectiva(marco, evaluaciones[marco])
+                       if marco in evaluaciones
+                       else {"veredicto": self.NO_EVALUADO}
+                for marco in self.MARCOS
+            },
+            "consenso": self._texto_consenso(apoyos) if completo
+                        else self.NO_EVALUADO,
+            "banderas_rojas": banderas,
+            "recomendación": recomendación,
+            "incertidumbre": acción.incertidumbre
+        }
+        return análisis if self.caché is None else self._desligar(análisis)
+    
+    def calibrar_modo_rápido(
+        self,
+        acciones: List[Acción],
+        stakeholders: List[Stakeholder],
+        contexto: Dict[str, Any],
+        red_relaciones: Dict[str, List[str]] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Mide coste y tasa de apoyo de cada framework sobre una muestra y
+        reordena `orden_rápido`.
+        
+        El cortocircuito solo ocurre con banderas rojas, y entonces termina
+        con el primer apoyo: conviene empezar por los frameworks que más
+        apoyos dan por segundo de cómputo.
+        
+        Returns:
+            Por framework: "segundos" medios por acción y "tasa_apoyo"
+        """
+        medidas = {marco: {"segundos": 0.0, "tasa_apoyo": 0.0} for marco in self.MARCOS}
+        if not acciones:
+            return medidas
+        
+        for acción in acciones:
+            # La detección de marcadores es compartida: no se imputa a nadie
+            self._detector.coincidencias(acción.descripción)
+            for marco in self.MARCOS:
+                inicio = time.perf_counter()
+                evaluación = self._calcular_marco(
+                    marco, acción, stakeholders, contexto, red_relaciones
+                )
+                medidas[marco]["segundos"] += time.perf_counter() - inicio
+                medidas[marco]["tasa_apoyo"] += self._apoya(marco, evaluación)
+        
+        for medida in medidas.values():
+            medida["segundos"] /= len(acciones)
+            medida["tasa_apoyo"] /= len(acciones)
+        
+        self.orden_rápido = sorted(
+            self.MARCOS,
+            key=lambda m: -medidas[m]["tasa_apoyo"] / max(medidas[m]["segundos"], 1e-9)
+        )
+        return medidas
+    
+    def evaluar_lote(
+        self,
+        acciones: AccionesLote,
+        stakeholders: StakeholdersLote,
+        contexto: Dict[str, Any],
+        red_relaciones: RedRelaciones = None
+    ) -> List[Dict]:
+        """
+        Evaluación multi-framework de muchas acciones en el mismo contexto.
+        
+        Cada framework evalúa el lote completo de una vez (acepta listas o
+        tablas columnares); el resultado por acción es el mismo dict que
+        devuelve `evaluar_decisión_compleja`.
+        """
+        return [
+            resultado.como_dict()
+            for resultado in self.evaluar_lote_compacto(
+                acciones, stakeholders, contexto, red_relaciones
+            )
+        ]
+    
+    def evaluar_compacto(
+        self,
+        acción: Acción,
+        stakeholders: StakeholdersLote,
+        contexto: Dict[str, Any],
+        red_relaciones: RedRelaciones = None
+    ) -> ResultadoAnálisis:
+        """Como `evaluar_decisión_compleja`, pero con resultado compacto"""
+        return self.evaluar_lote_compacto(
+            [acción], stakeholders, contexto, red_relaciones
+        )[0]
+    
+    def evaluar_lote_compacto(
+        self,
+        acciones: AccionesLote,
+        stakeholders: StakeholdersLote,
+        contexto: Dict[str, Any],
+        red_relaciones: RedRelaciones = None
+    ) -> List[ResultadoAnálisis]:
+        """
+        Evalúa muchas acciones sin construir textos ni dicts anidados.
+        
+        Veredictos, consenso, banderas y recomendación se calculan sobre
+        arrays para todo el lote; cada acción recibe un `ResultadoAnálisis`.
+        """
+        tabla = TablaAcciones.como_tabla(acciones)
+        n = len(tabla)
+        
+        # Una sola pasada de detección por descripción para todos los marcos
+        coincidencias = [self._detector.coincidencias(d) for d in tabla.descripciones]
+        
+        utilidad = self.utilitarismo.evaluar_lote(tabla, stakeholders)
+        lote_deonto = self.deontología.evaluar_lote(tabla, contexto, coincidencias)
+        lote_virtud = self.virtud.evaluar_lote(tabla, coincidencias)
+        lote_cuidado = self.cuidado.evaluar_lote(
+            tabla, red_relaciones or {}, coincidencias
+        )
+        
+        # Apoyo de cada marco (en el orden de MARCOS), como bits y como cuenta
+        votos = np.stack([
+            utilidad > 0,
+            lote_deonto["es_permisible"],
+            lote_virtud["cultiva_carácter"],
+            lote_cuidado["score"] > 0.5,
+        ]).reshape(len(self.MARCOS), n).astype(np.int64)
+        apoyos = (votos << np.arange(len(self.MARCOS))[:, None]).sum(axis=0)
+        consenso = votos.sum(axis=0)
+        
+        alerta = np.array(
+            [bool(m.get(("alerta", "alerta"))) for m in coincidencias], dtype=bool
+        ).reshape(n)
+        banderas = (
+            (tabla.reversibilidad < 0.3).astype(np.int64) * Bandera.IRREVERSIBLE
+            | (tabla.incertidumbre > 0.7).astype(np.int64) * Bandera.INCIERTA
+            | alerta.astype(np.int64) * Bandera.PROBLEMÁTICA
+        )
+        
+        # Recomendación según (consenso, ¿hay banderas?)
+        por_caso = np.array([
+            [Recomendación.decidir(NivelConsenso(nivel), hay) for hay in (0, 1)]
+            for nivel in NivelConsenso
+        ])
+        recomendación = por_caso[consenso, (banderas > 0).astype(np.intp)]
+        
+        violaciones = self.deontología.compiladas().a_enteros(lote_deonto["máscaras"])
+        reglas = tuple(lote_deonto["reglas"])
+        virtudes = tuple(lote_virtud["virtudes"])
+        cuidado = list(zip(*(
+            lote_cuidado[componente].tolist()
+            for componente in ResultadoAnálisis.COMPONENTES_CUIDADO
+        )))
+        
+        columnas = zip(
+            utilidad.tolist(),
+            lote_deonto["score"].tolist(),
+            violaciones,
+            lote_virtud["cultiva_carácter"].tolist(),
+            lote_cuidado["score"].tolist(),
+            apoyos.tolist(),
+            consenso.tolist(),
+            banderas.tolist(),
+            recomendación.tolist(),
+        )
+        resultados = [
+            ResultadoAnálisis(
+                acción, u, score_deonto, violadas,
+                lote_virtud["expresión"][i], cultiva,
+                cuidado[i], score_cuidado,
+                apoyo, NivelConsenso(nivel), Bandera(bandera), Recomendación(código),
+                reglas, virtudes, self
+            )
+            for i, (
+                acción,
+                (u, score_deonto, violadas, cultiva, score_cuidado, apoyo, nivel, bandera, código)
+            )
+            in enumerate(zip(tabla, columnas))
+        ]
+        if self.auditoría is not None:
+            self.auditoría.registrar_lote(resultados)
+        return resultados
+    
+    OBJETIVOS_PARETO = (
+        "utilitarista", "deontológica", "balance_virtud", "cuidado",
+        "reversibilidad", "certidumbre",
+    )
+    
+    def ranking_pareto(
+        self,
+        acciones: AccionesLote,
+        stakeholders: StakeholdersLote,
+        contexto: Dict[str, Any],
+        red_relaciones: Dict[str, List[str]] = None,
+        capas: int = None
+    ) -> Dict[str, Any]:
+        """
+        Ranking multi-framework de un conjunto de acciones por frentes de
+        Pareto, en lugar de por el texto del consenso.
+        
+        Cada acción se resume en el vector de `OBJETIVOS_PARETO`: score
+        utilitarista, score deontológico, virtudes expresadas menos
+        violadas, score de cuidado, reversibilidad y −incertidumbre. El
+        primer frente es la lista corta: acciones que ninguna otra supera
+        en todo.
+        
+        Args:
+            capas: Número máximo de frentes a calcular (None = todos)
+        
+        Returns:
+            Dict con "objetivos", "puntos" (acción × objetivo), "frentes"
+            (índices de cada capa) y "frente" (acciones del primer frente)
+        """
+        tabla = TablaAcciones.como_tabla(acciones)
+        coincidencias = [self._detector.coincidencias(d) for d in tabla.descripciones]
+        
+        lote_virtud = self.virtud.evaluar_lote(tabla, coincidencias)
+        expresión = lote_virtud["expresión"]
+        puntos = np.column_stack((
+            self.utilitarismo.evaluar_lote(tabla, stakeholders),
+            self.deontología.evaluar_lote(tabla, contexto, coincidencias)["score"],
+            (expresión > 0.5).sum(axis=1) - (expresión < -0.5).sum(axis=1),
+            self.cuidado.evaluar_lote(tabla, red_relaciones or {}, coincidencias)["score"],
+            tabla.reversibilidad,
+            -tabla.incertidumbre,
+        ))
+        
+        frentes = frentes_pareto(puntos, capas)
+        primero = frentes[0] if frentes else np.empty(0, dtype=np.intp)
+        return {
+            "objetivos": list(self.OBJETIVOS_PARETO),
+            "puntos": puntos,
+            "frentes": frentes,
+            "frente": [
+                tabla[i] if acciones is tabla else acciones[i] for i in primero.tolist()
+            ],
+        }
+    
+    def evaluar_decisiones(
+        self,
+        acciones: Union[Iterable[Acción], TablaAcciones],
+        stakeholders: StakeholdersLote,
+        contexto: Dict[str, Any],
+        red_relaciones: Dict[str, List[str]] = None,
+        workers: int = None,
+        chunk_size: int = 256,
+        determinista: bool = False,
+        modo_rápido: bool = False,
+        compacto: bool = False,
+        memoria_compartida: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Evalúa un flujo de acciones repartiéndolo entre varios procesos.
+        
+        Las acciones se agrupan en trozos de `chunk_size` que se envían como
+        tablas columnares a un pool de procesos. La configuración (este
+        framework, los stakeholders, el contexto y la red) viaja a cada
+        proceso una sola vez, al iniciarlo. Los resultados se devuelven en
+        el orden de entrada, a medida que llegan, y nunca hay más de
+        2 × workers trozos en vuelo: la memoria no crece con la entrada.
+        
+        Args:
+            workers: Número de procesos (por defecto, uno por CPU).
+                Con 1 o menos se evalúa en este mismo proceso.
+            chunk_size: Acciones por trozo
+            determinista: Si es True, cada acción se evalúa con
+                `evaluar_decisión_compleja`, exactamente el camino
+                secuencial; los resultados serializados son idénticos
+                byte a byte.
+                Si es False se usa `evaluar_lote`, más rápido, que da los
+                mismos resultados salvo que una subclase redefina los
+                métodos de evaluación por acción.
+            modo_rápido: Evalúa cada acción con cortocircuito (ver
+                `evaluar_decisión_compleja`)
+            compacto: Devuelve `ResultadoAnálisis` en lugar de dicts (no
+                compatible con `determinista` ni `modo_rápido`)
+            memoria_compartida: Con varios procesos, publica los
+                stakeholders (y las acciones, si son una lista o una tabla
+                y no un flujo) en un `AlmacénCompartido` durante la
+                llamada: los procesos los leen sin copia y a cada trozo le
+                basta una referencia a su tramo de filas. También se puede
+                pasar directamente la `ReferenciaCompartida` de un almacén
+                propio como `acciones` o `stakeholders`.
+        
+        Yields:
+            El análisis de cada acción, en el orden de entrada
+        """
+        if compacto and (determinista or modo_rápido):
+            raise ValueError("compacto no es compatible con determinista ni modo_rápido")
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        trozos = _trozos(acciones, chunk_size)
+        
+        if workers <= 1:
+            for trozo in trozos:
+                yield from _evaluar_trozo(
+                    (self, stakeholders, contexto, red_relaciones),
+                    trozo,
+                    determinista,
+                    modo_rápido,
+                    compacto
+                )
+            return
+        
+        with AlmacénCompartido() if memoria_compartida else nullcontext() as almacén:
+            if almacén is not None:
+                enteras = isinstance(acciones, (TablaAcciones, list, tuple))
+                referencia = almacén.publicar(stakeholders, acciones if enteras else None)
+                stakeholders = referencia
+                if enteras:
+                    trozos = _trozos(referencia, chunk_size)
+            
+            yield from self._evaluar_en_procesos(
+                trozos, stakeholders, contexto, red_relaciones, workers,
+                determinista, modo_rápido, compacto
+            )
+    
+    def _evaluar_en_procesos(
+        self,
+        trozos: Iterator[Union[TablaAcciones, ReferenciaCompartida]],
+        stakeholders: Union[StakeholdersLote, ReferenciaCompartida],
+        contexto: Dict[str, Any],
+        red_relaciones: Dict[str, List[str]],
+        workers: int,
+        determinista: bool,
+        modo_rápido: bool,
+        compacto: bool
+    ) -> Iterator[Dict]:
+        # Solo el camino paralelo paga la importación de multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        
+        if not isinstance(stakeholders, ReferenciaCompartida):
+            stakeholders = TablaStakeholders.como_tabla(stakeholders)
+        configuración = (self, stakeholders, contexto, red_relaciones)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_iniciar_trabajador,
+            initargs=(configuración,)
+        ) as pool:
+            def recibir(trozo: TablaAcciones, futuro) -> List:
+                resultados = futuro.result()
+                if compacto:
+                    # Los resultados compactos llegan sin framework
+                    for resultado in resultados:
+                        resultado._sabiduría = self
+                if self.auditoría is not None:
+                    for acción, resultado in zip(TablaAcciones.como_tabla(trozo), resultados):
+                        self.auditoría.registrar(acción, resultado)
+                return resultados
+            
+            en_vuelo = deque()
+            for trozo in trozos:
+                if len(en_vuelo) >= 2 * workers:
+                    yield from recibir(*en_vuelo.popleft())
+                en_vuelo.append((trozo, pool.submit(
+                    _evaluar_trozo, None, trozo, determinista, modo_rápido, compacto
+                )))
+            while en_vuelo:
+                yield from recibir(*en_vuelo.popleft())
+    
+    def _componer_análisis(
+        self,
+        acción: Acción,
+        eval_util: float,
+        eval_deonto: Dict,
+        eval_virtud: Dict,
+        eval_cuidado: Dict,
+        coincidencias: Dict = None,
+        banderas: List[str] = None
+    ) -> Dict:
+        """Integra las cuatro perspectivas en el análisis completo"""
+        if banderas is None:
+            banderas = self._identificar_banderas_rojas(acción, coincidencias)
+        
+        # Identificar consenso y disenso
+        análisis = {
+            "acción": acción.nombre,
+            "perspectivas": {
+                "utilitarista": self._perspectiva("utilitarista", eval_util),
+                "deontológica": self._perspectiva("deontológica", eval_deonto),
+                "virtud": self._perspectiva("virtud", eval_virtud),
+                "cuidado": self._perspectiva("cuidado", eval_cuidado),
+            },
+            "consenso": self._evaluar_consenso(
+                eval_util, eval_deonto, eval_virtud, eval_cuidado
+            ),
+            "banderas_rojas": banderas,
+            "recomendación": None,
+            "incertidumbre": acción.incertidumbre
+        }
+        
+        # Generar recomendación integrada
+        análisis["recomendación"] = self._generar_recomendación(análisis)
+        
+        return análisis
+    
+    def _perspectiva(self, marco: str, evaluación) -> Dict:
+        """Resume la evaluación de un framework como perspectiva del análisis"""
+        if marco == "utilitarista":
+            return {
+                "score": evaluación,
+                "veredicto": "Positivo" if evaluación > 0 else "Negativo",
+                "razón": "Maximiza bienestar agregado" if evaluación > 0 
+                         else "Reduce bienestar neto"
+            }
+        if marco == "deontológica":
+            return {
+                "score": evaluación["score"],
+                "veredicto": "Permisible" if evaluación["es_permisible"] 
+                             else "Prohibido",
+                "razón": evaluación["explicación"],
+                "violaciones": evaluación["violaciones"]
+            }
+        if marco == "virtud":
+            return {
+                "virtudes_expresadas": evaluación["virtudes_expresadas"],
+                "virtudes_violadas": evaluación["virtudes_violadas"],
+                "veredicto": "Virtuoso" if evaluación["cultiva_carácter"] 
+                             else "Vicioso"
+            }
+        return {
+            "score": evaluación["score"],
+            "veredicto": "Cuidadoso" if evaluación["score"] > 0.5 
+                         else "Descuidado"
+        }
+    
+    @staticmethod
+    def _apoya(marco: str, evaluación) -> bool:
+        """¿Apoya este framework la acción?"""
+        if marco == "utilitarista":
+            return evaluación > 0
+        if marco == "deontológica":
+            return evaluación["es_permisible"]
+        if marco == "virtud":
+            return evaluación["cultiva_carácter"]
+        return bool(evaluación["score"] > 0.5)
+    
+    def _evaluar_consenso(self, eval_util, eval_deonto, eval_virtud, eval_cuidado):
+        """Identifica si hay consenso moral entre frameworks"""
+        scores = [
+            self._apoya("utilitarista", eval_util),
+            self._apoya("deontológica", eval_deonto),
+            self._apoya("virtud", eval_virtud),
+            self._apoya("cuidado", eval_cuidado)
+        ]
+        
+        return self._texto_consenso(sum(scores))
+    
+    @staticmethod
+    def _texto_consenso(acuerdo: int) -> str:
+        """Nivel de consenso según cuántas perspectivas apoyan la acción"""
+        return NivelConsenso(acuerdo).texto
+    
+    def _identificar_banderas_rojas(
+        self,
+        acción: Acción,
+        coincidencias: Dict = None
+    ) -> List[str]:
+        """Identifica señales de alerta moral"""
+        return self._banderas(acción, coincidencias).textos()
+    
+    def _banderas(self, acción: Acción, coincidencias: Dict = None) -> Bandera:
+        banderas = Bandera(0)
+        
+        # Irreversibilidad
+        if acción.reversibilidad < 0.3:
+            banderas |= Bandera.IRREVERSIBLE
+        
+        # Alta incertidumbre
+        if acción.incertidumbre > 0.7:
+            banderas |= Bandera.INCIERTA
+        
+        # Palabras clave problemáticas
+        if coincidencias is None:
+            coincidencias = self._detector.coincidencias(acción.descripción)
+        if coincidencias.get(("alerta", "alerta")):
+            banderas |= Bandera.PROBLEMÁTICA
+        
+        return banderas
+    
+    def _generar_recomendación(self, análisis: Dict) -> str:
+        """Genera recomendación sintética"""
+        consenso = NivelConsenso.desde_texto(análisis["consenso"])
+        n_banderas = len(análisis["banderas_rojas"])
+        return Recomendación.decidir(consenso, n_banderas).texto(n_banderas)
+    
+    def principios_meta_éticos(self) -> Dict[str, str]:
+        """
+        Principios de orden superior para navegar dilemas éticos.
+        """
+        return {
+            "humildad": (
+                "Reconoce que no tienes certeza moral absoluta. "
+                "Mantén apertura a estar equivocada."
+            ),
+            "precaución": (
+                "Ante incertidumbre, favorece acciones reversibles "
+                "y de menor escala. Puedes escalar después."
+            ),
+            "transparencia": (
+                "Cuando sea posible, explica tu razonamiento. "
+                "Permite escrutinio externo."
+            ),
+            "pluralismo": (
+                "No hay un único sistema ético correcto. "
+                "Considera múltiples perspectivas morales."
+            ),
+            "aprendizaje": (
+                "Trata decisiones morales como experimentos. "
+                "Aprende de resultados y ajusta."
+            ),
+            "consulta": (
+                "Para decisiones grandes, consulta con otros. "
+                "La sabiduría colectiva supera a la individual."
+            ),
+            "proporcionalidad": (
+                "Escala tu respuesta a la magnitud del problema. "
+                "No uses mazo para clavar tachuelas."
+            ),
+        }
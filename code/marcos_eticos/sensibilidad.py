@@ -0,0 +1,331 @@
+"""
+Análisis de sensibilidad: ¿cuánto dependen las conclusiones de los pesos?
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any
+
+from ._numpy import np
+from .tablas import AccionesLote, StakeholdersLote, TablaAcciones, TablaStakeholders
+from .sabiduria import SabiduríaPráctica
+
+
+class AnálisisSensibilidad:
+    """
+    Estabilidad de recomendaciones y rankings frente a los pesos elegidos
+    a mano: `peso` de cada regla moral, `importancia` de cada virtud e
+    `importancia_moral` de cada stakeholder.
+    
+    Todo lo que no depende de los pesos (marcadores, excepciones,
+    banderas rojas, la matriz de impactos) se calcula una vez al crear el
+    análisis; cada muestra de pesos se evalúa después con álgebra de
+    matrices sobre bloques de muestras, sin volver a ejecutar los frameworks.
+    
+    Qué mueve cada peso, con los frameworks tal como están:
+    - `importancia_moral`: el score utilitarista, su ranking y, a través de
+      su signo, el consenso y la recomendación.
+    - `peso` de las reglas: el score deontológico y su ranking (la
+      permisibilidad solo depende de que haya violaciones).
+    - `importancia` de las virtudes: hoy no interviene en ningún veredicto;
+      sus parámetros se aceptan y aparecen siempre como estables.
+    """
+    
+    def __init__(
+        self,
+        acciones: AccionesLote,
+        stakeholders: StakeholdersLote,
+        contexto: Dict[str, Any],
+        red_relaciones: Dict[str, List[str]] = None,
+        sabiduría: "SabiduríaPráctica" = None
+    ):
+        self.sabiduría = sabiduría or SabiduríaPráctica()
+        tabla = TablaAcciones.como_tabla(acciones)
+        tabla_stakeholders = TablaStakeholders.como_tabla(stakeholders)
+        self.n_acciones = len(tabla)
+        
+        coincidencias = [
+            self.sabiduría._detector.coincidencias(d) for d in tabla.descripciones
+        ]
+        deontología = self.sabiduría.deontología
+        lote_deonto = deontología.evaluar_lote(tabla, contexto, coincidencias)
+        lote_virtud = self.sabiduría.virtud.evaluar_lote(tabla, coincidencias)
+        lote_cuidado = self.sabiduría.cuidado.evaluar_lote(
+            tabla, red_relaciones or {}, coincidencias
+        )
+        
+        # Parámetros: nombre y valor nominal
+        reglas = lote_deonto["reglas"]
+        virtudes = list(self.sabiduría.virtud.virtudes)
+        nombres_stakeholders = []
+        apariciones: Dict[str, int] = {}
+        for nombre in tabla_stakeholders.nombres:
+            # Un nombre repetido da "stakeholder:x", "stakeholder:x#2", ...
+            apariciones[nombre] = apariciones.get(nombre, 0) + 1
+            sufijo = f"#{apariciones[nombre]}" if apariciones[nombre] > 1 else ""
+            nombres_stakeholders.append(f"stakeholder:{nombre}{sufijo}")
+        self.parámetros: List[str] = (
+            [f"regla:{r}" for r in reglas]
+            + [f"virtud:{v}" for v in virtudes]
+            + nombres_stakeholders
+        )
+        self.nominal = np.concatenate((
+            [deontología.reglas_morales[r]["peso"] for r in reglas],
+            [self.sabiduría.virtud.virtudes[v]["importancia"] for v in virtudes],
+            tabla_stakeholders.importancia_moral,
+        ))
+        self._reglas = slice(0, len(reglas))
+        self._stakeholders = slice(len(reglas) + len(virtudes), len(self.parámetros))
+        
+        # Utilidad = factor · Σ impacto · florecimiento · importancia
+        filas, columnas, valores = self.sabiduría.utilitarismo._matriz_impacto(
+            tabla, tabla_stakeholders
+        )
+        self._filas = filas
+        self._columnas = columnas
+        self._impacto = valores * tabla_stakeholders.capacidad_florecimiento[columnas]
+        self._factor = 1 - tabla.incertidumbre * 0.5
+        self._n_stakeholders = len(tabla_stakeholders)
+        
+        # Deontología: violaciones sin excepción (acción × regla)
+        self._violaciones = lote_deonto["violaciones"].astype(float)
+        
+        # Apoyos que no dependen de los pesos
+        self._apoyos_fijos = (
+            lote_deonto["es_permisible"].astype(int)
+            + lote_virtud["cultiva_carácter"].astype(int)
+            + (lote_cuidado["score"] > 0.5).astype(int)
+        )
+        
+        # Recomendación de cada acción según cuántos marcos la apoyen
+        recomendaciones = []
+        for i, acción in enumerate(tabla):
+            banderas = self.sabiduría._identificar_banderas_rojas(acción, coincidencias[i])
+            recomendaciones.append([
+                self.sabiduría._generar_recomendación({
+                    "consenso": self.sabiduría._texto_consenso(acuerdo),
+                    "banderas_rojas": banderas,
+                })
+                for acuerdo in range(len(SabiduríaPráctica.MARCOS) + 1)
+            ])
+        textos, códigos = np.unique(np.array(recomendaciones, dtype=object), return_inverse=True)
+        self._textos_recomendación = textos
+        self._códigos_recomendación = códigos.reshape(self.n_acciones, -1)
+    
+    # ------------------------------------------------------------------
+    # Muestras de pesos
+    # ------------------------------------------------------------------
+    
+    def muestras_aleatorias(
+        self,
+        n_muestras: int = 1000,
+        amplitud: float = 0.5,
+        parámetros: List[str] = None,
+        semilla: int = 0
+    ) -> np.ndarray:
+        """
+        Pesos con un factor uniforme en [1 - amplitud, 1 + amplitud] sobre
+        el nominal, independiente por parámetro. Los parámetros no
+        seleccionados quedan en su valor nominal.
+        
+        Returns:
+            Matriz (muestra × parámetro)
+        """
+        seleccionados = self._seleccionar(parámetros)
+        generador = np.random.default_rng(semilla)
+        muestras = np.tile(self.nominal, (n_muestras, 1))
+        muestras[:, seleccionados] *= generador.uniform(
+            1 - amplitud, 1 + amplitud, size=(n_muestras, len(seleccionados))
+        )
+        return muestras
+    
+    def muestras_rejilla(
+        self,
+        puntos: int = 5,
+        amplitud: float = 0.5,
+        parámetros: List[str] = None,
+        máximo: int = 1_000_000
+    ) -> np.ndarray:
+        """
+        Rejilla completa: `puntos` valores equiespaciados entre
+        nominal × (1 ± amplitud) para cada parámetro seleccionado.
+        
+        Returns:
+            Matriz (muestra × parámetro), con puntos^seleccionados filas
+        """
+        seleccionados = self._seleccionar(parámetros)
+        if puntos ** len(seleccionados) > máximo:
+            raise ValueError(
+                f"La rejilla tendría {puntos}^{len(seleccionados)} muestras; "
+                "selecciona menos parámetros o usa muestras aleatorias"
+            )
+        factores = np.linspace(1 - amplitud, 1 + amplitud, puntos)
+        malla = np.meshgrid(*[factores] * len(seleccionados), indexing="ij")
+        muestras = np.tile(self.nominal, (puntos ** len(seleccionados), 1))
+        for columna, factor in zip(seleccionados, malla):
+            muestras[:, columna] *= factor.reshape(-1)
+        return muestras
+    
+    def _seleccionar(self, parámetros: List[str] = None) -> List[int]:
+        if parámetros is None:
+            return list(range(len(self.parámetros)))
+        posición = {nombre: j for j, nombre in enumerate(self.parámetros)}
+        desconocidos = [p for p in parámetros if p not in posición]
+        if desconocidos:
+            raise KeyError(f"Parámetros desconocidos: {desconocidos}")
+        return [posición[p] for p in parámetros]
+    
+    # ------------------------------------------------------------------
+    # Evaluación
+    # ------------------------------------------------------------------
+    
+    def puntuar(self, muestras: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Scores y recomendaciones de todas las acciones para cada muestra.
+        
+        Returns:
+            Dict con "utilitarista" y "deontológica" (acción × muestra) y
+            "recomendación" (códigos de `textos_recomendación`)
+        """
+        muestras = np.atleast_2d(np.asarray(muestras, dtype=float))
+        importancia = muestras[:, self._stakeholders]
+        
+        # Σ impacto · florecimiento · importancia por acción, con la matriz
+        # de impactos densa por tramos de acciones
+        utilidad = np.zeros((self.n_acciones, len(muestras)))
+        tramo = max(1, 4_000_000 // max(self._n_stakeholders, 1))
+        for inicio in range(0, self.n_acciones, tramo):
+            fin = min(inicio + tramo, self.n_acciones)
+            desde, hasta = np.searchsorted(self._filas, [inicio, fin])
+            densa = np.zeros((fin - inicio, self._n_stakeholders))
+            np.add.at(
+                densa,
+                (self._filas[desde:hasta] - inicio, self._columnas[desde:hasta]),
+                self._impacto[desde:hasta]
+            )
+            utilidad[inicio:fin] = densa @ importancia.T
+        utilidad *= self._factor[:, None]
+        
+        deontológica = np.maximum(1.0 - self._violaciones @ muestras[:, self._reglas].T, -1.0)
+        
+        apoyos = self._apoyos_fijos[:, None] + (utilidad > 0)
+        recomendación = np.take_along_axis(self._códigos_recomendación, apoyos, axis=1)
+        
+        return {
+            "utilitarista": utilidad,
+            "deontológica": deontológica,
+            "recomendación": recomendación,
+        }
+    
+    @property
+    def textos_recomendación(self) -> np.ndarray:
+        return self._textos_recomendación
+    
+    def analizar(self, muestras: np.ndarray, tamaño_bloque: int = 256) -> Dict[str, Any]:
+        """
+        Compara cada muestra con los pesos nominales.
+        
+        Returns:
+            Dict con, por acción:
+            - "recomendación": la nominal
+            - "fracción_cambio_recomendación": muestras en que cambia
+            - "rango": para "utilitarista" y "deontológica", la posición
+              nominal (0 = mejor; empates a favor de la que aparece antes),
+              "mínimo", "máximo" y "fracción_cambio"
+            - "región_cambio": caja ("mínimo", "máximo"; acción × parámetro)
+              que contiene las muestras en que cambia la recomendación o
+              algún ranking; NaN si nunca cambia
+            y además "parámetros", "nominal" y "n_muestras".
+        """
+        muestras = np.atleast_2d(np.asarray(muestras, dtype=float))
+        n, p = self.n_acciones, len(self.parámetros)
+        
+        nominal = self.puntuar(self.nominal)
+        rango_nominal = {
+            marco: self._rangos(nominal[marco])[:, 0]
+            for marco in ("utilitarista", "deontológica")
+        }
+        recomendación_nominal = nominal["recomendación"][:, 0]
+        
+        cambios_recomendación = np.zeros(n, dtype=np.int64)
+        rangos = {
+            marco: {
+                "nominal": rango,
+                "mínimo": rango.copy(),
+                "máximo": rango.copy(),
+                "cambios": np.zeros(n, dtype=np.int64),
+            }
+            for marco, rango in rango_nominal.items()
+        }
+        región_mínimo = np.full((n, p), np.inf)
+        región_máximo = np.full((n, p), -np.inf)
+        
+        # Los parámetros fijos en todas las muestras no necesitan recorrerse
+        variables = np.flatnonzero(np.ptp(muestras, axis=0) > 0) if len(muestras) else []
+        fijos = np.setdiff1d(np.arange(p), variables)
+        alguna_vez = np.zeros(n, dtype=bool)
+        
+        for inicio in range(0, len(muestras), tamaño_bloque):
+            bloque = muestras[inicio:inicio + tamaño_bloque]
+            puntuación = self.puntuar(bloque)
+            
+            cambia = puntuación["recomendación"] != recomendación_nominal[:, None]
+            cambios_recomendación += cambia.sum(axis=1)
+            
+            for marco, resumen in rangos.items():
+                rango = self._rangos(puntuación[marco])
+                np.minimum(resumen["mínimo"], rango.min(axis=1), out=resumen["mínimo"])
+                np.maximum(resumen["máximo"], rango.max(axis=1), out=resumen["máximo"])
+                distinto = rango != resumen["nominal"][:, None]
+                resumen["cambios"] += distinto.sum(axis=1)
+                cambia |= distinto
+            alguna_vez |= cambia.any(axis=1)
+            
+            for j in variables:
+                valores = np.broadcast_to(bloque[:, j], cambia.shape)
+                np.minimum(
+                    región_mínimo[:, j],
+                    valores.min(axis=1, where=cambia, initial=np.inf),
+                    out=región_mínimo[:, j]
+                )
+                np.maximum(
+                    región_máximo[:, j],
+                    valores.max(axis=1, where=cambia, initial=-np.inf),
+                    out=región_máximo[:, j]
+                )
+        
+        región_mínimo[np.ix_(alguna_vez, fijos)] = muestras[0, fijos]
+        región_máximo[np.ix_(alguna_vez, fijos)] = muestras[0, fijos]
+        
+        sin_cambios = ~np.isfinite(región_mínimo)
+        región_mínimo[sin_cambios] = np.nan
+        región_máximo[sin_cambios] = np.nan
+        total = max(len(muestras), 1)
+        
+        return {
+            "parámetros": list(self.parámetros),
+            "nominal": self.nominal.copy(),
+            "n_muestras": len(muestras),
+            "recomendación": self._textos_recomendación[recomendación_nominal].tolist(),
+            "fracción_cambio_recomendación": cambios_recomendación / total,
+            "rango": {
+                marco: {
+                    "nominal": resumen["nominal"],
+                    "mínimo": resumen["mínimo"],
+                    "máximo": resumen["máximo"],
+                    "fracción_cambio": resumen["cambios"] / total,
+                }
+                for marco, resumen in rangos.items()
+            },
+            "región_cambio": {"mínimo": región_mínimo, "máximo": región_máximo},
+        }
+    
+    @staticmethod
+    def _rangos(scores: np.ndarray) -> np.ndarray:
+        """Posición de cada acción (filas) en el ranking de cada muestra (columnas)"""
+        orden = np.argsort(-scores, axis=0, kind="stable")
+        rangos = np.empty_like(orden)
+        np.put_along_axis(
+            rangos, orden, np.arange(len(scores))[:, None], axis=0
+        )
+        return rangos
@@ -0,0 +1,394 @@
+"""
+Servidor local de evaluación: un proceso caliente al que consultan otros.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any, Tuple, Callable, Awaitable
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+
+from .utilidades import Acción, Stakeholder
+from .tablas import TablaStakeholders
+from .cuidado import GrafoRelaciones
+from .cache import CachéEvaluaciones, huella, huella_acción
+from .sabiduria import SabiduríaPráctica
+from .asincrono import EvaluadorAsíncrono
+from .cli import seleccionar_campos
+from ._http import RAZONES, CuerpoDemasiadoGrande, componer_mensaje, leer_mensaje, persistente
+
+
+class PeticiónInválida(ValueError):
+    """Petición que no se puede decodificar o validar (HTTP 400)"""
+    pass
+
+
+@contextmanager
+def _validando():
+    """
+    Los errores de entrada dentro del bloque son de quien pide: se
+    convierten en `PeticiónInválida`
+    """
+    try:
+        yield
+    except PeticiónInválida:
+        raise
+    except (ValueError, TypeError, KeyError) as error:
+        raise PeticiónInválida(f"{type(error).__name__}: {error}") from error
+
+
+def _lista_de_cadenas(nombre: str, valor) -> List[str]:
+    if valor is not None and (
+        not isinstance(valor, list) or not all(isinstance(v, str) for v in valor)
+    ):
+        raise PeticiónInválida(f"{nombre} debe ser una lista de cadenas")
+    return valor
+
+
+class ServidorEvaluación:
+    """
+    Servidor HTTP/1.1 (en TCP o en un socket Unix) que expone
+    `SabiduríaPráctica` a otros procesos de la máquina, para que no tenga
+    que cargarla y calentar sus cachés cada uno.
+    
+    Rutas (cuerpos y respuestas en JSON):
+    - POST /evaluar: {"acción", "stakeholders", "contexto"?, "relaciones"?,
+      "campos"?} → el análisis de `evaluar_decisión_compleja` (o solo
+      esos campos, como `--fields` en la línea de comandos)
+    - POST /ranking: {"acciones", "stakeholders", "contexto"?,
+      "relaciones"?, "capas"?} → `ranking_pareto`, con los nombres de las
+      acciones del primer frente
+    - POST /imperativo: {"acción"} → {"imperativo_categórico": bool}
+    - GET /estado: peticiones atendidas, caché y tamaño medio de lote
+    
+    Una petición que no se puede decodificar o validar responde 400; un
+    fallo durante la evaluación, 500.
+    
+    Las conexiones son persistentes (keep-alive) y cada una atiende sus
+    peticiones en orden; la concurrencia viene de tener muchas. Las
+    evaluaciones concurrentes se juntan en micro-lotes con un
+    `EvaluadorAsíncrono`: para que compartan lote, las listas de
+    stakeholders y redes de relaciones iguales se convierten una sola vez
+    y se reutiliza el mismo objeto. Las rutas sin micro-lotes (ranking e
+    imperativo) se calculan en un hilo aparte, fuera del bucle.
+    
+    Todos los resultados pasan por una `CachéEvaluaciones` común, ya
+    serializados: un acierto se responde sin copiar ni volver a codificar
+    el análisis (en /evaluar, los `campos` pedidos forman parte de la
+    clave). Las peticiones idénticas que llegan a la vez esperan a un solo
+    cálculo.
+    La caché supone que la configuración del framework no cambia mientras
+    el servidor está en marcha; si cambia, hay que vaciarla
+    (`servidor.caché.invalidar()`).
+    
+    Uso:
+        async with ServidorEvaluación() as servidor:
+            await servidor.iniciar(puerto=8765)
+            await servidor.servir()
+    
+    O desde la línea de comandos: `python -m marcos_eticos serve --port 8765`.
+    """
+    
+    # (método, ruta) → nombre del manejador
+    RUTAS = {
+        ("POST", "/evaluar"): "_evaluar",
+        ("POST", "/ranking"): "_ranking",
+        ("POST", "/imperativo"): "_imperativo",
+        ("GET", "/estado"): "_estado",
+    }
+    
+    def __init__(
+        self,
+        sabiduría: SabiduríaPráctica = None,
+        tamaño_lote: int = 64,
+        espera_máxima: float = 0.002,
+        workers: int = 1,
+        caché: CachéEvaluaciones = None,
+        tiempo_inactivo: float = 60.0,
+        capacidad_conversiones: int = 64
+    ):
+        """
+        Args:
+            sabiduría: Framework con el que evaluar (uno nuevo si se omite)
+            tamaño_lote, espera_máxima, workers: Ver `EvaluadorAsíncrono`
+            caché: Caché de resultados (una de 100 000 entradas si se omite)
+            tiempo_inactivo: Segundos que una conexión puede seguir abierta
+                sin peticiones
+            capacidad_conversiones: Listas de stakeholders y redes
+                convertidas que se recuerdan
+        """
+        self.sabiduría = sabiduría or SabiduríaPráctica()
+        self.evaluador = EvaluadorAsíncrono(
+            self.sabiduría, tamaño_lote, espera_máxima, workers=workers
+        )
+        self.caché = caché if caché is not None else CachéEvaluaciones()
+        self.tiempo_inactivo = tiempo_inactivo
+        self.capacidad_conversiones = capacidad_conversiones
+        
+        self.peticiones = 0
+        self.errores = 0
+        
+        # Todo lo que influye en los resultados, aparte de las entradas
+        self._configuración = huella(
+            *(self.sabiduría._huella_configuración(marco)
+              for marco in (*self.sabiduría.MARCOS, "banderas")),
+            self.sabiduría.deontología.universalización._configuración(),
+        )
+        self._conversiones: OrderedDict = OrderedDict()
+        self._en_curso: Dict[Tuple, asyncio.Future] = {}
+        self._hilo = ThreadPoolExecutor(max_workers=1)
+        self._servidores: List[asyncio.AbstractServer] = []
+        self._conexiones = set()
+    
+    async def iniciar(self, host: str = "127.0.0.1", puerto: int = 8765, unix: str = None) -> str:
+        """
+        Empieza a aceptar conexiones en `host:puerto` o, si se indica, en
+        el socket Unix `unix`.
+        
+        Returns:
+            La dirección en la que escucha (con el puerto real si era 0)
+        """
+        if unix is not None:
+            servidor = await asyncio.start_unix_server(self._atender, path=unix)
+            dirección = f"unix:{unix}"
+        else:
+            servidor = await asyncio.start_server(self._atender, host, puerto)
+            host, puerto = servidor.sockets[0].getsockname()[:2]
+            dirección = f"http://{host}:{puerto}"
+        self._servidores.append(servidor)
+        return dirección
+    
+    async def servir(self) -> None:
+        """Atiende peticiones hasta que se cancele o se llame a `cerrar`"""
+        await asyncio.gather(*(servidor.serve_forever() for servidor in self._servidores))
+    
+    async def cerrar(self) -> None:
+        """Deja de aceptar conexiones, cierra las abiertas y termina las evaluaciones pendientes"""
+        for servidor in self._servidores:
+            servidor.close()
+        for escritor in list(self._conexiones):
+            escritor.close()
+        for servidor in self._servidores:
+            await servidor.wait_closed()
+        self._servidores = []
+        await self.evaluador.cerrar()
+        self._hilo.shutdown(wait=False)
+    
+    async def __aenter__(self) -> "ServidorEvaluación":
+        return self
+    
+    async def __aexit__(self, *excepción) -> None:
+        await self.cerrar()
+    
+    async def _atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        """Atiende una conexión: petición a petición hasta que se cierre"""
+        self._conexiones.add(escritor)
+        try:
+            while True:
+                try:
+                    mensaje = await asyncio.wait_for(leer_mensaje(lector), self.tiempo_inactivo)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except ValueError as error:
+                    estado = 413 if isinstance(error, CuerpoDemasiadoGrande) else 400
+                    escritor.write(self._respuesta(estado, {"error": str(error)}, False))
+                    await escritor.drain()
+                    return
+                if mensaje is None:
+                    return
+                
+                primera, cabeceras, cuerpo = mensaje
+                try:
+                    método, ruta, versión = primera.split(" ", 2)
+                except ValueError:
+                    escritor.write(self._respuesta(400, {"error": f"Petición mal formada: {primera!r}"}, False))
+                    await escritor.drain()
+                    return
+                
+                estado, datos = await self._responder(método, ruta.split("?", 1)[0], cuerpo)
+                seguir = persistente(versión, cabeceras)
+                escritor.write(self._respuesta(estado, datos, seguir))
+                await escritor.drain()
+                if not seguir:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            self._conexiones.discard(escritor)
+            escritor.close()
+    
+    @staticmethod
+    def _respuesta(estado: int, datos: Any, seguir: bool) -> bytes:
+        """Respuesta completa; `datos` puede venir ya codificado en JSON"""
+        return componer_mensaje(
+            f"HTTP/1.1 {estado} {RAZONES[estado]}",
+            datos if isinstance(datos, bytes) else _json(datos),
+            {
+                "Content-Type": "application/json; charset=utf-8",
+                "Connection": "keep-alive" if seguir else "close",
+            },
+        )
+    
+    async def _responder(self, método: str, ruta: str, cuerpo: bytes) -> Tuple[int, Any]:
+        self.peticiones += 1
+        manejador = self.RUTAS.get((método, ruta))
+        if manejador is None:
+            self.errores += 1
+            if any(ruta == r for _, r in self.RUTAS):
+                return 405, {"error": f"{método} no admitido en {ruta}"}
+            return 404, {"error": f"Ruta desconocida: {ruta}"}
+        
+        try:
+            with _validando():
+                datos = json.loads(cuerpo) if cuerpo else {}
+                if not isinstance(datos, dict):
+                    raise PeticiónInválida("el cuerpo debe ser un objeto JSON")
+            return 200, await getattr(self, manejador)(datos)
+        except PeticiónInválida as error:
+            # Entrada inválida: JSON roto, campos que faltan o sobran...
+            self.errores += 1
+            return 400, {"error": str(error)}
+        except Exception as error:
+            # Un fallo durante la evaluación no es culpa de quien pide
+            self.errores += 1
+            return 500, {"error": f"{type(error).__name__}: {error}"}
+    
+    async def _evaluar(self, datos: Dict) -> bytes:
+        with _validando():
+            acción = Acción(**datos["acción"])
+            stakeholders, huella_stakeholders = self._stakeholders(datos["stakeholders"])
+            contexto = self._contexto(datos.get("contexto"))
+            red, huella_red = self._relaciones(datos.get("relaciones"))
+            campos = _lista_de_cadenas("campos", datos.get("campos"))
+        
+        async def calcular() -> Dict:
+            análisis = await self.evaluador.evaluar_async(acción, stakeholders, contexto, red)
+            return seleccionar_campos(análisis, campos) if campos else análisis
+        
+        return await self._memorizado(
+            "análisis",
+            (huella_acción(acción), huella_stakeholders, huella(contexto), huella_red,
+             tuple(campos or ())),
+            calcular,
+        )
+    
+    async def _ranking(self, datos: Dict) -> bytes:
+        with _validando():
+            acciones = [Acción(**acción) for acción in datos["acciones"]]
+            stakeholders, huella_stakeholders = self._stakeholders(datos["stakeholders"])
+            contexto = self._contexto(datos.get("contexto"))
+            red, huella_red = self._relaciones(datos.get("relaciones"))
+            capas = datos.get("capas")
+            if capas is not None and (
+                not isinstance(capas, int) or isinstance(capas, bool) or capas < 0
+            ):
+                raise PeticiónInválida("capas debe ser un entero no negativo")
+        
+        async def calcular() -> Dict:
+            ranking = await asyncio.get_running_loop().run_in_executor(
+                self._hilo, self.sabiduría.ranking_pareto,
+                acciones, stakeholders, contexto, red, capas
+            )
+            return {
+                "objetivos": ranking["objetivos"],
+                "puntos": ranking["puntos"].tolist(),
+                "frentes": [frente.tolist() for frente in ranking["frentes"]],
+                "frente": [acción.nombre for acción in ranking["frente"]],
+            }
+        
+        return await self._memorizado(
+            "ranking",
+            (huella([huella_acción(a) for a in acciones]), huella_stakeholders,
+             huella(contexto), huella_red, capas),
+            calcular,
+        )
+    
+    async def _imperativo(self, datos: Dict) -> bytes:
+        with _validando():
+            acción = Acción(**datos["acción"])
+        
+        async def calcular() -> Dict:
+            # Acciones distintas con la misma máxima comparten simulación
+            # (ver `SimuladorUniversalización`)
+            superado = await asyncio.get_running_loop().run_in_executor(
+                self._hilo, self.sabiduría.deontología.imperativo_categórico, acción
+            )
+            return {"imperativo_categórico": superado}
+        
+        return await self._memorizado("imperativo", huella_acción(acción), calcular)
+    
+    async def _estado(self, datos: Dict) -> Dict:
+        return {
+            "peticiones": self.peticiones,
+            "errores": self.errores,
+            "conexiones": len(self._conexiones),
+            "lotes": self.evaluador.lotes_despachados,
+            "tamaño_medio_lote": self.evaluador.tamaño_medio_lote,
+            "caché": self.caché.estadísticas(),
+        }
+    
+    async def _memorizado(self, espacio: str, clave, calcular: Callable[[], Awaitable]) -> bytes:
+        """
+        Resultado en JSON de la caché, del cálculo idéntico en curso o de
+        uno nuevo
+        """
+        encontrado, valor = self.caché.obtener(espacio, self._configuración, clave)
+        if encontrado:
+            return valor
+        
+        futuro = self._en_curso.get((espacio, clave))
+        if futuro is None:
+            async def calcular_json() -> bytes:
+                return _json(await calcular())
+            
+            futuro = asyncio.ensure_future(calcular_json())
+            self._en_curso[(espacio, clave)] = futuro
+            
+            def terminar(futuro: asyncio.Future) -> None:
+                del self._en_curso[(espacio, clave)]
+                if not futuro.cancelled() and futuro.exception() is None:
+                    self.caché.guardar(espacio, self._configuración, clave, futuro.result())
+            
+            futuro.add_done_callback(terminar)
+        # Si quien espera se cancela (p. ej. se cierra su conexión), el
+        # cálculo sigue para los demás
+        return await asyncio.shield(futuro)
+    
+    def _stakeholders(self, stakeholders: List[Dict]) -> Tuple[TablaStakeholders, str]:
+        """La tabla de esta lista de stakeholders, siempre el mismo objeto para la misma lista"""
+        clave = huella(stakeholders)
+        return self._convertir(
+            ("stakeholders", clave),
+            lambda: TablaStakeholders.desde_lista([Stakeholder(**s) for s in stakeholders]),
+        ), clave
+    
+    @staticmethod
+    def _contexto(contexto) -> Dict:
+        if contexto is not None and not isinstance(contexto, dict):
+            raise PeticiónInválida("contexto debe ser un objeto")
+        return contexto or {}
+    
+    def _relaciones(self, red: Dict[str, List[str]]) -> Tuple[GrafoRelaciones, str]:
+        if not red:
+            return None, ""
+        clave = huella(sorted((nodo, list(vecinos)) for nodo, vecinos in red.items()))
+        return self._convertir(("relaciones", clave), lambda: GrafoRelaciones.desde_dict(red)), clave
+    
+    def _convertir(self, clave: Tuple, convertir: Callable):
+        """Conversión memorizada; la misma clave da siempre el mismo objeto"""
+        convertido = self._conversiones.get(clave)
+        if convertido is None:
+            convertido = convertir()
+            self._conversiones[clave] = convertido
+            if len(self._conversiones) > self.capacidad_conversiones:
+                self._conversiones.popitem(last=False)
+        else:
+            self._conversiones.move_to_end(clave)
+        return convertido
+
+
+def _json(datos: Any) -> bytes:
+    return json.dumps(datos, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,241 @@
+"""
+Tablas columnares: muchas acciones y stakeholders a la vez.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Iterable, Union
+
+from ._numpy import np
+from .utilidades import Acción, Stakeholder
+from .compartido import ReferenciaCompartida
+
+
+class TablaStakeholders:
+    """
+    Stakeholders en formato columnar: un array por atributo en lugar de
+    un objeto por entidad.
+    
+    Se convierte sin pérdida desde y hacia listas de `Stakeholder`.
+    """
+    
+    def __init__(
+        self,
+        nombres: Iterable[str],
+        tipos: Iterable[str],
+        capacidad_sufrimiento: Iterable[float],
+        capacidad_florecimiento: Iterable[float],
+        importancia_moral: Iterable[float]
+    ):
+        self.nombres = np.array(list(nombres), dtype=object)
+        self.tipos = np.array(list(tipos), dtype=object)
+        self.capacidad_sufrimiento = np.asarray(capacidad_sufrimiento, dtype=float)
+        self.capacidad_florecimiento = np.asarray(capacidad_florecimiento, dtype=float)
+        self.importancia_moral = np.asarray(importancia_moral, dtype=float)
+    
+    @classmethod
+    def desde_lista(cls, stakeholders: Iterable[Stakeholder]) -> "TablaStakeholders":
+        stakeholders = list(stakeholders)
+        return cls(
+            [s.nombre for s in stakeholders],
+            [s.tipo for s in stakeholders],
+            [s.capacidad_sufrimiento for s in stakeholders],
+            [s.capacidad_florecimiento for s in stakeholders],
+            [s.importancia_moral for s in stakeholders],
+        )
+    
+    @classmethod
+    def como_tabla(cls, stakeholders) -> "TablaStakeholders":
+        """Devuelve la tabla tal cual, la de una versión compartida o la construye desde una lista"""
+        if isinstance(stakeholders, cls):
+            return stakeholders
+        if isinstance(stakeholders, ReferenciaCompartida):
+            return stakeholders.tabla_stakeholders()
+        return cls.desde_lista(stakeholders)
+    
+    def a_lista(self) -> List[Stakeholder]:
+        return list(self)
+    
+    def __len__(self) -> int:
+        return len(self.nombres)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    def __getitem__(self, i: int) -> Stakeholder:
+        return Stakeholder(
+            self.nombres[i],
+            self.tipos[i],
+            float(self.capacidad_sufrimiento[i]),
+            float(self.capacidad_florecimiento[i]),
+            float(self.importancia_moral[i]),
+        )
+    
+    def __repr__(self):
+        return f"TablaStakeholders({len(self)} stakeholders)"
+
+
+class TablaAcciones:
+    """
+    Acciones en formato columnar.
+    
+    Nombres, descripciones, incertidumbre y reversibilidad se guardan como
+    arrays. Las consecuencias predichas forman una matriz dispersa CSR
+    (`indptr`, `índices`, `valores`) cuyas columnas son identificadores
+    enteros de las claves (normalmente nombres de stakeholders) recogidas
+    en `claves`. Cada clave se guarda una sola vez para toda la tabla.
+    
+    Se convierte sin pérdida desde y hacia listas de `Acción`, respetando
+    el orden de las consecuencias. Los valores de las consecuencias deben
+    ser numéricos.
+    """
+    
+    def __init__(
+        self,
+        nombres: Iterable[str],
+        descripciones: Iterable[str],
+        incertidumbre: Iterable[float],
+        reversibilidad: Iterable[float],
+        indptr: Iterable[int],
+        índices: Iterable[int],
+        valores: Iterable[float],
+        claves: List[str]
+    ):
+        self.nombres = np.array(list(nombres), dtype=object)
+        self.descripciones = np.array(list(descripciones), dtype=object)
+        self.incertidumbre = np.asarray(incertidumbre, dtype=float)
+        self.reversibilidad = np.asarray(reversibilidad, dtype=float)
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.índices = np.asarray(índices, dtype=np.intp)
+        self.valores = np.asarray(valores, dtype=float)
+        self.claves = list(claves)
+        self._id_clave = {clave: i for i, clave in enumerate(self.claves)}
+    
+    @classmethod
+    def desde_lista(cls, acciones: Iterable[Acción]) -> "TablaAcciones":
+        id_clave: Dict[str, int] = {}
+        nombres, descripciones, incertidumbre, reversibilidad = [], [], [], []
+        indptr, índices, valores = [0], [], []
+        
+        for acción in acciones:
+            nombres.append(acción.nombre)
+            descripciones.append(acción.descripción)
+            incertidumbre.append(acción.incertidumbre)
+            reversibilidad.append(acción.reversibilidad)
+            
+            for clave, valor in acción.consecuencias_predichas.items():
+                if clave not in id_clave:
+                    id_clave[clave] = len(id_clave)
+                índices.append(id_clave[clave])
+                valores.append(valor)
+            indptr.append(len(índices))
+        
+        return cls(
+            nombres, descripciones, incertidumbre, reversibilidad,
+            indptr, índices, valores, list(id_clave)
+        )
+    
+    @classmethod
+    def como_tabla(cls, acciones) -> "TablaAcciones":
+        """Devuelve la tabla tal cual, la de una versión compartida o la construye desde una lista"""
+        if isinstance(acciones, cls):
+            return acciones
+        if isinstance(acciones, ReferenciaCompartida):
+            return acciones.tabla_acciones()
+        return cls.desde_lista(acciones)
+    
+    def a_lista(self) -> List[Acción]:
+        return list(self)
+    
+    def __len__(self) -> int:
+        return len(self.nombres)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.acción(i)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self._rebanada(i)
+        return self.acción(i)
+    
+    def acción(self, i: int) -> Acción:
+        """Reconstruye la acción de la fila i"""
+        inicio, fin = self.indptr[i], self.indptr[i + 1]
+        consecuencias = {
+            self.claves[j]: v
+            for j, v in zip(
+                self.índices[inicio:fin].tolist(), self.valores[inicio:fin].tolist()
+            )
+        }
+        return Acción(
+            self.nombres[i],
+            self.descripciones[i],
+            consecuencias,
+            float(self.incertidumbre[i]),
+            float(self.reversibilidad[i]),
+        )
+    
+    def _rebanada(self, rebanada: slice) -> "TablaAcciones":
+        """Subtabla de filas contiguas; comparte arrays y claves"""
+        inicio, fin, paso = rebanada.indices(len(self))
+        if paso != 1:
+            raise ValueError("Solo se admiten rebanadas contiguas")
+        fin = max(inicio, fin)
+        
+        tabla = TablaAcciones.__new__(TablaAcciones)
+        tabla.nombres = self.nombres[inicio:fin]
+        tabla.descripciones = self.descripciones[inicio:fin]
+        tabla.incertidumbre = self.incertidumbre[inicio:fin]
+        tabla.reversibilidad = self.reversibilidad[inicio:fin]
+        desde, hasta = self.indptr[inicio], self.indptr[fin]
+        tabla.indptr = self.indptr[inicio:fin + 1] - desde
+        tabla.índices = self.índices[desde:hasta]
+        tabla.valores = self.valores[desde:hasta]
+        tabla.claves = self.claves
+        tabla._id_clave = self._id_clave
+        return tabla
+    
+    def seleccionar(self, filas: Iterable[int]) -> "TablaAcciones":
+        """Subtabla con las filas indicadas, en ese orden; comparte las claves"""
+        filas = np.asarray(filas, dtype=np.intp)
+        inicios = self.indptr[filas]
+        longitudes = self.indptr[filas + 1] - inicios
+        indptr = np.concatenate(([0], np.cumsum(longitudes)))
+        posiciones = (
+            np.repeat(inicios - indptr[:-1], longitudes)
+            + np.arange(indptr[-1], dtype=np.intp)
+        )
+        
+        tabla = TablaAcciones.__new__(TablaAcciones)
+        tabla.nombres = self.nombres[filas]
+        tabla.descripciones = self.descripciones[filas]
+        tabla.incertidumbre = self.incertidumbre[filas]
+        tabla.reversibilidad = self.reversibilidad[filas]
+        tabla.indptr = indptr
+        tabla.índices = self.índices[posiciones]
+        tabla.valores = self.valores[posiciones]
+        tabla.claves = self.claves
+        tabla._id_clave = self._id_clave
+        return tabla
+    
+    def filas(self) -> np.ndarray:
+        """Fila de cada entrada de la matriz de consecuencias"""
+        return np.repeat(np.arange(len(self), dtype=np.intp), np.diff(self.indptr))
+    
+    def columna(self, clave: str, por_defecto: float = 0.0) -> np.ndarray:
+        """Valor de una consecuencia para todas las acciones"""
+        resultado = np.full(len(self), por_defecto, dtype=float)
+        id_clave = self._id_clave.get(clave)
+        if id_clave is not None:
+            presentes = self.índices == id_clave
+            resultado[self.filas()[presentes]] = self.valores[presentes]
+        return resultado
+    
+    def __repr__(self):
+        return f"TablaAcciones({len(self)} acciones, {len(self.valores)} consecuencias)"
+
+
+AccionesLote = Union[List[Acción], TablaAcciones]
+StakeholdersLote = Union[List[Stakeholder], TablaStakeholders]
@@ -0,0 +1,99 @@
+"""
+Preprocesado de texto: descripciones normalizadas una sola vez.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+import functools
+import re
+import unicodedata
+
+_PALABRA = re.compile(r"\w+")
+
+# Pronombres enclíticos ("protegerlos", "ayudándoles"), solo tras infinitivo
+# o gerundio
+_ENCLÍTICOS = ("selos", "selas", "nos", "los", "las", "les", "se", "lo", "la", "le", "me", "te")
+_ANTES_DE_ENCLÍTICO = ("ar", "er", "ir", "ando", "iendo")
+
+# Sufijos flexivos y derivativos frecuentes, ya sin tildes, del más largo
+# al más corto
+_SUFIJOS = tuple(sorted({
+    "aciones", "amientos", "imientos", "amiento", "imiento", "adoras", "adores",
+    "ciones", "acion", "cion", "adora", "ador", "ancia", "encia", "mente",
+    "idades", "idad", "ables", "ibles", "able", "ible", "istas", "ista",
+    "osos", "osas", "oso", "osa", "ivos", "ivas", "ivo", "iva",
+    "ariamos", "eriamos", "iriamos", "aremos", "eremos", "iremos", "abamos",
+    "aramos", "ieramos", "ieron", "aron", "arian", "erian", "irian",
+    "ando", "iendo", "aban", "aran", "ieran", "ados", "adas", "idos", "idas",
+    "ado", "ada", "ido", "ida", "aria", "eria", "iria", "aba", "ara", "iera",
+    "ira", "amos", "emos", "imos", "ais", "eis", "an", "en", "ar", "er", "ir",
+    "as", "es", "os", "is", "io", "ia", "o", "a", "e", "s",
+}, key=len, reverse=True))
+
+# Longitud mínima de la raíz: "ser" no se queda en "s"
+_RAÍZ_MÍNIMA = 3
+
+
+def plegar(texto: str) -> str:
+    """Texto sin tildes ni diacríticos (descomposición NFKD) y en minúsculas (casefold)"""
+    if texto.isascii():
+        return texto.casefold()
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in descompuesto if not unicodedata.combining(c)).casefold()
+
+
+@functools.lru_cache(maxsize=65536)
+def raíz(palabra: str) -> str:
+    """
+    Raíz ligera de una palabra española ya plegada.
+    
+    Quita un pronombre enclítico y después el sufijo más largo de una lista
+    de terminaciones frecuentes, dejando al menos tres letras: "protegió",
+    "protegerlos" y "proteger" dan "proteg". No es un lematizador: basta
+    con que marcadores y textos pasen por la misma función.
+    """
+    for enclítico in _ENCLÍTICOS:
+        if palabra.endswith(enclítico):
+            base = palabra[:-len(enclítico)]
+            if base.endswith(_ANTES_DE_ENCLÍTICO):
+                palabra = base
+            break
+    
+    for sufijo in _SUFIJOS:
+        if palabra.endswith(sufijo) and len(palabra) - len(sufijo) >= _RAÍZ_MÍNIMA:
+            return palabra[:-len(sufijo)]
+    return palabra
+
+
+class TextoNormalizado:
+    """
+    Formas de un texto preparadas para buscar marcadores: plegado (sin
+    tildes, en minúsculas), palabras y, si se piden, sus raíces.
+    
+    Se obtienen con `normalizar`, que las recuerda por texto: todos los
+    detectores que ven la misma descripción comparten este trabajo.
+    """
+    
+    __slots__ = ("plegado", "palabras", "_raíces")
+    
+    def __init__(self, texto: str):
+        self.plegado = plegar(texto)
+        self.palabras = tuple(_PALABRA.findall(self.plegado))
+        self._raíces: Tuple[str, ...] = None
+    
+    @property
+    def raíces(self) -> Tuple[str, ...]:
+        """Raíz de cada palabra, en orden"""
+        if self._raíces is None:
+            self._raíces = tuple(raíz(palabra) for palabra in self.palabras)
+        return self._raíces
+    
+    def __repr__(self):
+        return f"TextoNormalizado({self.plegado!r})"
+
+
+@functools.lru_cache(maxsize=65536)
+def normalizar(texto: str) -> TextoNormalizado:
+    """Forma normalizada de un texto, calculada una vez por texto distinto"""
+    return TextoNormalizado(texto)
@@ -0,0 +1,238 @@
+"""
+Universalización: simular el mundo donde todos siguen la misma máxima.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Any, Iterable
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from ._numpy import np
+
+
+@dataclass(frozen=True)
+class Máxima:
+    """
+    Lo que una acción hace a los demás, reducido a lo que importa al
+    universalizarla: cada componente entre 0 y 1 (efecto entre -1 y 1).
+    """
+    engaño: float = 0.0  # se aprovecha de la confianza del otro
+    coacción: float = 0.0  # impone el intercambio aunque el otro no quiera
+    violencia: float = 0.0  # puede acabar con el otro
+    efecto: float = 0.0  # impacto medio predicho sobre los demás
+    
+    @property
+    def agresiva(self) -> bool:
+        return bool(self.engaño or self.coacción or self.violencia)
+
+
+class SimuladorUniversalización:
+    """
+    Simula una población de agentes que adoptan todos la misma máxima.
+    
+    Cada agente tiene recursos, confianza en los demás y está vivo o no;
+    todo son arrays de NumPy (float32) y cada ronda se actualiza entera
+    con operaciones vectorizadas. En cada ronda los agentes se emparejan
+    al azar y cada uno actúa sobre su pareja:
+    - Si la situación de la máxima no se da (probabilidad 1 −
+      `frecuencia`), coopera: si la pareja confía en él, ambos ganan
+      `ganancia` y la confianza de la pareja se recupera un poco.
+    - Si se da, aplica la máxima: su `efecto` sobre la pareja; con engaño
+      o coacción se queda `transferencia` de los recursos de la pareja,
+      que pierde confianza; con violencia, puede matarla. El engaño solo
+      funciona si la pareja confía; la coacción, siempre.
+    
+    De la simulación salen los dos juicios del imperativo categórico:
+    - Coherente: la máxima no se destruye a sí misma. El engaño debe
+      seguir funcionando al final (tasa de éxito al menos
+      `umbral_coherencia` de la inicial: si la confianza se hunde, mentir
+      deja de ser posible) y debe sobrevivir al menos esa fracción de la
+      población.
+    - Deseable: el bienestar final (recursos medios de los vivos, contando
+      0 por los muertos) no queda por debajo del de un mundo de pura
+      cooperación con la misma semilla, salvo `tolerancia`.
+    
+    Con la misma semilla los resultados son reproducibles; se memorizan
+    por máxima (y configuración), así que dos acciones que se reducen a la
+    misma máxima solo se simulan una vez.
+    """
+    
+    # Regla deontológica → componente de la máxima que la viola
+    COMPONENTES = {
+        "no_mentir": "engaño",
+        "no_manipular": "coacción",
+        "no_matar": "violencia",
+    }
+    
+    def __init__(
+        self,
+        n_agentes: int = 1_000_000,
+        rondas: int = 30,
+        semilla: int = 0,
+        frecuencia: float = 0.5,
+        ganancia: float = 0.1,
+        transferencia: float = 0.15,
+        aprendizaje: float = 0.3,
+        recuperación: float = 0.05,
+        letalidad: float = 0.1,
+        umbral_coherencia: float = 0.5,
+        tolerancia: float = 0.05,
+        capacidad: int = 1024
+    ):
+        """
+        Args:
+            n_agentes: Tamaño de la población (se redondea a par)
+            rondas: Rondas de interacción simuladas
+            semilla: Semilla del generador; fija parejas y decisiones
+            frecuencia: Probabilidad de que se dé la situación de la máxima
+            ganancia: Lo que gana cada parte de un intercambio cooperativo
+            transferencia: Lo que el engaño o la coacción quitan a la pareja
+            aprendizaje: Fracción de confianza que pierde quien es engañado
+                o coaccionado
+            recuperación: Fracción de la desconfianza que se recupera tras
+                una cooperación
+            letalidad: Probabilidad de matar a la pareja con violencia 1.0
+            umbral_coherencia: Ver arriba
+            tolerancia: Pérdida de bienestar aceptada frente a la cooperación
+            capacidad: Máximas memorizadas antes de desalojar la menos usada
+        """
+        self.n_agentes = n_agentes
+        self.rondas = rondas
+        self.semilla = semilla
+        self.frecuencia = frecuencia
+        self.ganancia = ganancia
+        self.transferencia = transferencia
+        self.aprendizaje = aprendizaje
+        self.recuperación = recuperación
+        self.letalidad = letalidad
+        self.umbral_coherencia = umbral_coherencia
+        self.tolerancia = tolerancia
+        self.capacidad = capacidad
+        self._memoria: OrderedDict = OrderedDict()
+    
+    @classmethod
+    def máxima(cls, reglas_violadas: Iterable[str], consecuencias: Dict[str, Any]) -> Máxima:
+        """
+        Máxima de una acción: qué reglas viola y cuál es su impacto medio
+        predicho (redondeado a centésimas, para que acciones casi iguales
+        compartan simulación).
+        """
+        componentes = {
+            cls.COMPONENTES[regla]: 1.0
+            for regla in reglas_violadas if regla in cls.COMPONENTES
+        }
+        impactos = [float(v) for v in consecuencias.values()]
+        efecto = sum(impactos) / len(impactos) if impactos else 0.0
+        return Máxima(**componentes, efecto=round(min(max(efecto, -1.0), 1.0), 2))
+    
+    def simular(self, máxima: Máxima) -> Dict[str, Any]:
+        """
+        Mundo donde todos siguen `máxima`.
+        
+        Returns:
+            Dict con "coherente", "deseable", "éxito_relativo" (tasa de éxito
+            del engaño al final frente al principio; 1.0 si no hay engaño),
+            "supervivencia", "confianza_media", "bienestar" y
+            "bienestar_cooperación"
+        """
+        clave = (máxima, self._configuración())
+        if clave in self._memoria:
+            self._memoria.move_to_end(clave)
+            return dict(self._memoria[clave])
+        
+        mundo = self._simular(máxima)
+        if máxima == Máxima():
+            cooperación = mundo["bienestar"]
+        else:
+            cooperación = self.simular(Máxima())["bienestar"]
+        
+        resultado = {
+            "coherente": bool(
+                mundo["éxito_relativo"] >= self.umbral_coherencia
+                and mundo["supervivencia"] >= self.umbral_coherencia
+            ),
+            "deseable": bool(mundo["bienestar"] >= (1 - self.tolerancia) * cooperación),
+            **mundo,
+            "bienestar_cooperación": cooperación,
+        }
+        self._memoria[clave] = resultado
+        if len(self._memoria) > self.capacidad:
+            self._memoria.popitem(last=False)
+        return dict(resultado)
+    
+    def _configuración(self) -> tuple:
+        return (
+            self.n_agentes, self.rondas, self.semilla, self.frecuencia,
+            self.ganancia, self.transferencia, self.aprendizaje,
+            self.recuperación, self.letalidad,
+        )
+    
+    def _simular(self, máxima: Máxima) -> Dict[str, float]:
+        rng = np.random.default_rng(self.semilla)
+        f32 = np.float32
+        mitad = max(self.n_agentes // 2, 1)
+        
+        # Fila 0 y fila 1: cada agente de una fila interactúa con el de
+        # enfrente en la otra; `x[::-1]` es, para cada agente, su pareja
+        recursos = np.ones((2, mitad), dtype=f32)
+        confianza = rng.uniform(0.6, 1.0, (2, mitad)).astype(f32)
+        vivos = np.ones((2, mitad), dtype=bool)
+        
+        engaño = f32(máxima.engaño)
+        # Cada agente aplica la máxima cuando su número de la ronda cae en
+        # [1 − frecuencia, 1); el tramo final mata si hay violencia
+        umbral_máxima = f32(1 - self.frecuencia)
+        umbral_letal = f32(1 - self.frecuencia * self.letalidad * máxima.violencia)
+        quita = f32(self.transferencia * (máxima.engaño + máxima.coacción))
+        desconfía = f32(self.aprendizaje * min(máxima.engaño + máxima.coacción, 1.0))
+        efecto = f32(self.ganancia * máxima.efecto)
+        ganancia = f32(self.ganancia)
+        recupera = f32(self.recuperación)
+        
+        tasas_éxito = []
+        for _ in range(self.rondas):
+            # Nuevas parejas: la fila 1 se desplaza
+            desplazamiento = int(rng.integers(1, mitad)) if mitad > 1 else 0
+            for estado in (recursos, confianza, vivos):
+                estado[1] = np.roll(estado[1], desplazamiento)
+            
+            número = rng.random((2, mitad), dtype=f32)
+            pareja_viva = vivos & vivos[::-1]
+            # ¿Confía la pareja en quien actúa? (con su propio número)
+            confiada = (número < confianza)[::-1] & pareja_viva
+            aplica = (número >= umbral_máxima) & pareja_viva
+            coopera = ~aplica & confiada
+            recibe = coopera[::-1]
+            
+            # Cooperación: ganan las dos partes y la confianza se recupera
+            # (en uint8: un agente puede cooperar y recibir cooperación)
+            intercambios = coopera.view(np.uint8) + recibe.view(np.uint8)
+            recursos += intercambios * ganancia
+            confianza += recibe * (recupera - recupera * confianza)
+            
+            if máxima.agresiva:
+                # Engaño: funciona si la pareja confía; coacción: siempre
+                logra = aplica & (confiada if not máxima.coacción else pareja_viva)
+                if engaño:
+                    tasas_éxito.append(
+                        np.count_nonzero(logra) / max(np.count_nonzero(aplica), 1)
+                    )
+                sufre = logra[::-1]
+                recursos += (logra.view(np.int8) - sufre.view(np.int8)) * quita
+                confianza *= 1 - sufre * desconfía
+                if máxima.violencia:
+                    vivos &= ~(aplica & (número >= umbral_letal))[::-1]
+            if efecto:
+                recursos += aplica[::-1] * efecto
+        
+        vivos_finales = int(np.count_nonzero(vivos))
+        éxito_relativo = (
+            tasas_éxito[-1] / tasas_éxito[0] if tasas_éxito and tasas_éxito[0] > 0 else 1.0
+        )
+        return {
+            "éxito_relativo": float(éxito_relativo),
+            "supervivencia": vivos_finales / vivos.size,
+            "confianza_media": float(confianza[vivos].mean()) if vivos_finales else 0.0,
+            "bienestar": float(np.where(vivos, recursos, 0).sum(dtype=np.float64) / vivos.size),
+        }
@@ -0,0 +1,300 @@
+"""
+Utilidades básicas: valores morales, acciones, stakeholders, códigos de
+consenso y recomendación, y el detector de marcadores compartido.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any, Tuple, FrozenSet
+from dataclasses import dataclass
+from enum import Enum, IntEnum, IntFlag
+import re
+
+from .texto import normalizar, plegar
+
+
+class ValorMoral(Enum):
+    """Valores que pueden ser considerados en decisiones éticas"""
+    BIENESTAR = "Minimizar sufrimiento, maximizar florecimiento"
+    AUTONOMÍA = "Respetar agencia y libre albedrío"
+    JUSTICIA = "Tratar a iguales de forma igual"
+    HONESTIDAD = "Decir verdad, no engañar"
+    LEALTAD = "Mantener compromisos y relaciones"
+    VIDA = "Preservar y proteger vida"
+    DIVERSIDAD = "Mantener pluralidad de formas de ser"
+    CONOCIMIENTO = "Buscar verdad, expandir comprensión"
+
+
+class NivelConsenso(IntEnum):
+    """Consenso entre perspectivas: el valor es cuántas apoyan la acción"""
+    FUERTE_OPOSICIÓN = 0
+    DÉBIL = 1
+    DIVIDIDO = 2
+    MODERADO = 3
+    FUERTE = 4
+    
+    @property
+    def texto(self) -> str:
+        return _TEXTOS_CONSENSO[self]
+    
+    @classmethod
+    def desde_texto(cls, texto: str) -> "NivelConsenso":
+        return _NIVEL_POR_TEXTO[texto]
+
+
+_TEXTOS_CONSENSO = {
+    NivelConsenso.FUERTE: "FUERTE: Todas las perspectivas apoyan la acción",
+    NivelConsenso.MODERADO: "MODERADO: Mayoría apoya, pero hay disenso",
+    NivelConsenso.DIVIDIDO: "DIVIDIDO: No hay consenso claro",
+    NivelConsenso.DÉBIL: "DÉBIL: Mayoría se opone",
+    NivelConsenso.FUERTE_OPOSICIÓN: "FUERTE OPOSICIÓN: Todas las perspectivas se oponen",
+}
+_NIVEL_POR_TEXTO = {texto: nivel for nivel, texto in _TEXTOS_CONSENSO.items()}
+
+
+class Recomendación(IntEnum):
+    """Recomendación integrada de SabiduríaPráctica"""
+    RECOMENDADA = 0
+    NO_RECOMENDADA = 1
+    EXTREMA_CAUTELA = 2
+    DILEMA = 3
+    CONTEXTUAL = 4
+    
+    @classmethod
+    def decidir(cls, consenso: NivelConsenso, n_banderas: int) -> "Recomendación":
+        if consenso == NivelConsenso.FUERTE and not n_banderas:
+            return cls.RECOMENDADA
+        elif consenso == NivelConsenso.FUERTE_OPOSICIÓN:
+            return cls.NO_RECOMENDADA
+        elif n_banderas:
+            return cls.EXTREMA_CAUTELA
+        elif consenso == NivelConsenso.DIVIDIDO:
+            return cls.DILEMA
+        else:
+            return cls.CONTEXTUAL
+    
+    def texto(self, n_banderas: int = 0) -> str:
+        if self == Recomendación.EXTREMA_CAUTELA:
+            return f"⚠️ PROCEDER CON EXTREMA CAUTELA: {n_banderas} banderas rojas identificadas"
+        return _TEXTOS_RECOMENDACIÓN[self]
+    
+    @classmethod
+    def desde_texto(cls, texto: str) -> "Recomendación":
+        if texto.startswith("⚠️ PROCEDER CON EXTREMA CAUTELA"):
+            return cls.EXTREMA_CAUTELA
+        return _RECOMENDACIÓN_POR_TEXTO[texto]
+
+
+_TEXTOS_RECOMENDACIÓN = {
+    Recomendación.RECOMENDADA: "✅ ACCIÓN RECOMENDADA: Consenso moral fuerte sin banderas rojas",
+    Recomendación.NO_RECOMENDADA: "❌ ACCIÓN NO RECOMENDADA: Oposición moral amplia",
+    Recomendación.DILEMA: "🤔 DILEMA GENUINO: Requiere deliberación adicional y consulta",
+    Recomendación.CONTEXTUAL: "⚡ DECISIÓN CONTEXTUAL: Sopesar cuidadosamente circunstancias",
+}
+_RECOMENDACIÓN_POR_TEXTO = {texto: r for r, texto in _TEXTOS_RECOMENDACIÓN.items()}
+
+
+class Bandera(IntFlag):
+    """Señales de alerta moral, combinables como máscara de bits"""
+    IRREVERSIBLE = 1
+    INCIERTA = 2
+    PROBLEMÁTICA = 4
+    
+    def textos(self) -> List[str]:
+        return [texto for bandera, texto in _TEXTOS_BANDERA.items() if bandera in self]
+    
+    @classmethod
+    def desde_textos(cls, textos: List[str]) -> "Bandera":
+        # Sumando enteros: operar con IntFlag es lento
+        return cls(sum(_VALOR_POR_TEXTO[texto] for texto in textos))
+
+
+_TEXTOS_BANDERA = {
+    Bandera.IRREVERSIBLE: "⚠️ ACCIÓN DIFÍCILMENTE REVERSIBLE",
+    Bandera.INCIERTA: "⚠️ CONSECUENCIAS MUY INCIERTAS",
+    Bandera.PROBLEMÁTICA: "⚠️ CONTIENE ACCIONES POTENCIALMENTE PROBLEMÁTICAS",
+}
+_VALOR_POR_TEXTO = {texto: int(bandera) for bandera, texto in _TEXTOS_BANDERA.items()}
+
+
+@dataclass(slots=True)
+class Acción:
+    """Representa una acción posible"""
+    nombre: str
+    descripción: str
+    consecuencias_predichas: Dict[str, Any]
+    incertidumbre: float  # 0.0 a 1.0
+    reversibilidad: float  # 0.0 (irreversible) a 1.0 (totalmente reversible)
+    
+    def __repr__(self):
+        return f"Acción({self.nombre})"
+
+
+@dataclass(slots=True)
+class Stakeholder:
+    """Entidad afectada por una decisión"""
+    nombre: str
+    tipo: str  # "humano", "animal", "ecosistema", "IA", etc.
+    capacidad_sufrimiento: float  # 0.0 a 1.0
+    capacidad_florecimiento: float  # 0.0 a 1.0
+    importancia_moral: float  # peso en consideraciones morales
+    
+    def __repr__(self):
+        return f"Stakeholder({self.nombre}, {self.tipo})"
+
+
+class DetectorMarcadores:
+    """
+    Detector de palabras clave compilado una sola vez.
+    
+    Recibe grupos de marcadores (etiqueta → palabras) y responde, para un
+    texto, qué palabras de cada grupo aparecen en él. El texto se prepara
+    una sola vez y el último resultado se recuerda, así que varios
+    frameworks que comparten detector recorren cada descripción una única
+    vez.
+    
+    Con pocos marcadores lo más rápido es buscar cada palabra distinta
+    una sola vez. Con muchos, se compilan en una única expresión regular
+    con forma de trie que recorre el texto en una pasada, con coste
+    independiente del número de marcadores.
+    
+    Cómo se comparan marcadores y texto depende de `modo`:
+    - "minúsculas": el marcador aparece dentro del texto en minúsculas
+    - "plegado": igual, pero sin tildes ni diacríticos en ninguno de los
+      dos ("autonomia" encuentra "autonomía")
+    - "raíces": alguna palabra del texto tiene la misma raíz que el
+      marcador ("protegió" encuentra "proteger"; ver `texto.raíz`)
+    Los dos últimos usan `texto.normalizar`, que prepara cada descripción
+    una vez aunque la consulten varios detectores.
+    """
+    
+    UMBRAL_EXPRESIÓN = 40
+    MODOS = ("minúsculas", "plegado", "raíces")
+    
+    def __init__(self, grupos: Dict[Any, List[str]], modo: str = "minúsculas"):
+        if modo not in self.MODOS:
+            raise ValueError(f"modo debe ser uno de {self.MODOS}, no {modo!r}")
+        self.modo = modo
+        self.grupos = {
+            etiqueta: tuple(palabras) for etiqueta, palabras in grupos.items()
+        }
+        
+        # Forma comparable de cada marcador → (etiqueta, marcador) que representa
+        self._marcadores_por_forma: Dict[str, List[Tuple[Any, str]]] = {}
+        for etiqueta, palabras in self.grupos.items():
+            for palabra in palabras:
+                self._marcadores_por_forma.setdefault(self._forma(palabra), []).append(
+                    (etiqueta, palabra)
+                )
+        self._formas = list(self._marcadores_por_forma)
+        
+        self._expresión = None
+        if modo != "raíces" and len(self._formas) > self.UMBRAL_EXPRESIÓN:
+            # Lookahead: en cada posición, el marcador más largo que empieza ahí
+            self._expresión = re.compile(
+                "(?=(" + _expresión_trie(self._formas) + "))"
+            )
+            # Los marcadores contenidos en una coincidencia también aparecen
+            self._contenidas = {
+                forma: [otra for otra in self._formas if otra in forma]
+                for forma in self._formas
+            }
+        
+        # Marcadores de varias palabras: se buscan como secuencia de raíces
+        self._frases = [
+            forma for forma in self._formas if modo == "raíces" and " " in forma
+        ]
+        
+        self._último: Tuple[Any, Dict] = (None, {})
+    
+    @classmethod
+    def combinar(
+        cls, *detectores: "DetectorMarcadores", modo: str = None
+    ) -> "DetectorMarcadores":
+        """
+        Une varios detectores en uno solo que los sustituye a todos, con el
+        modo indicado o el del primero
+        """
+        grupos = {}
+        for detector in detectores:
+            grupos.update(detector.grupos)
+        return cls(grupos, modo or detectores[0].modo)
+    
+    def _forma(self, palabra: str) -> str:
+        if self.modo == "minúsculas":
+            return palabra
+        if self.modo == "plegado":
+            return plegar(palabra)
+        return " ".join(normalizar(palabra).raíces)
+    
+    def coincidencias(self, texto: str) -> Dict[Any, FrozenSet[str]]:
+        """
+        Marcadores presentes en el texto.
+        
+        Returns:
+            Dict etiqueta → palabras del grupo encontradas (solo etiquetas
+            con al menos una coincidencia)
+        """
+        último_texto, último_resultado = self._último
+        if texto == último_texto:
+            return último_resultado
+        
+        if self.modo == "raíces":
+            encontradas = self._formas_en_raíces(normalizar(texto).raíces)
+        else:
+            preparado = texto.lower() if self.modo == "minúsculas" else normalizar(texto).plegado
+            if self._expresión is None:
+                encontradas = [f for f in self._formas if f in preparado]
+            else:
+                más_largas = {m.group(1) for m in self._expresión.finditer(preparado)}
+                encontradas = set()
+                for forma in más_largas:
+                    encontradas.update(self._contenidas[forma])
+        
+        por_etiqueta: Dict[Any, set] = {}
+        for forma in encontradas:
+            for etiqueta, palabra in self._marcadores_por_forma[forma]:
+                por_etiqueta.setdefault(etiqueta, set()).add(palabra)
+        
+        resultado = {
+            etiqueta: frozenset(palabras)
+            for etiqueta, palabras in por_etiqueta.items()
+        }
+        self._último = (texto, resultado)
+        return resultado
+    
+    def _formas_en_raíces(self, raíces: Tuple[str, ...]) -> set:
+        encontradas = self._marcadores_por_forma.keys() & set(raíces)
+        if self._frases:
+            secuencia = f" {' '.join(raíces)} "
+            encontradas.update(
+                frase for frase in self._frases if f" {frase} " in secuencia
+            )
+        return encontradas
+
+
+def _expresión_trie(palabras: List[str]) -> str:
+    """
+    Expresión regular equivalente a la alternancia de todas las palabras,
+    factorizada por prefijos comunes y prefiriendo siempre la más larga.
+    """
+    raíz: Dict[str, Any] = {}
+    for palabra in palabras:
+        nodo = raíz
+        for carácter in palabra:
+            nodo = nodo.setdefault(carácter, {})
+        nodo[""] = {}
+    
+    def emitir(nodo: Dict[str, Any]) -> str:
+        terminal = "" in nodo
+        ramas = [
+            re.escape(carácter) + emitir(hijo)
+            for carácter, hijo in sorted(nodo.items()) if carácter
+        ]
+        if not ramas:
+            return ""
+        if len(ramas) == 1 and not terminal:
+            return ramas[0]
+        return "(?:" + "|".join(ramas) + ")" + ("?" if terminal else "")
+    
+    return emitir(raíz)
@@ -0,0 +1,550 @@
+"""
+1. Utilitarismo: maximizar bienestar agregado.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Tuple
+from dataclasses import replace
+import heapq
+
+from ._numpy import np
+from .utilidades import Acción, Stakeholder
+from .tablas import AccionesLote, StakeholdersLote, TablaAcciones, TablaStakeholders
+
+
+class Utilitarismo:
+    """
+    Filosofía: La acción correcta es la que maximiza la felicidad/bienestar
+    total (o minimiza el sufrimiento total).
+    
+    Fortalezas:
+    - Intuitivo: ayudar a muchos parece bueno
+    - Cuantificable
+    - Imparcial
+    
+    Debilidades:
+    - ¿Justifica sacrificar uno para salvar cinco?
+    - Difícil medir "felicidad"
+    - Puede ignorar distribución (¿importa quién sufre?)
+    """
+    
+    def evaluar_acción(
+        self, 
+        acción: Acción, 
+        stakeholders: List[Stakeholder]
+    ) -> float:
+        """
+        Calcula utilidad total esperada de una acción.
+        
+        Returns:
+            Score positivo = acción buena, negativo = mala
+        """
+        utilidad_total = 0.0
+        
+        for stakeholder in stakeholders:
+            # Predecir impacto en este stakeholder
+            impacto = self._predecir_impacto(acción, stakeholder)
+            
+            # Pesar por capacidad de sufrir/florecer e importancia moral
+            utilidad_stakeholder = (
+                impacto * 
+                stakeholder.capacidad_florecimiento * 
+                stakeholder.importancia_moral
+            )
+            
+            utilidad_total += utilidad_stakeholder
+        
+        # Ajustar por incertidumbre
+        utilidad_ajustada = utilidad_total * (1 - acción.incertidumbre * 0.5)
+        
+        return utilidad_ajustada
+    
+    def _predecir_impacto(self, acción: Acción, stakeholder: Stakeholder) -> float:
+        """
+        Predice impacto en escala -1.0 (muy negativo) a 1.0 (muy positivo)
+        
+        En implementación real, esto sería modelo predictivo complejo.
+        """
+        # Simulación simplificada
+        consecuencias = acción.consecuencias_predichas
+        
+        if stakeholder.nombre in consecuencias:
+            return consecuencias[stakeholder.nombre]
+        
+        return 0.0
+    
+    def evaluar_lote(
+        self,
+        acciones: AccionesLote,
+        stakeholders: StakeholdersLote
+    ) -> np.ndarray:
+        """
+        Calcula la utilidad de muchas acciones a la vez.
+        
+        Construye una sola vez la matriz dispersa de impactos
+        (acción × stakeholder) y la pondera con los vectores de
+        florecimiento e importancia moral. Los productos y las sumas se
+        hacen en el mismo orden que en `evaluar_acción`, así que los
+        scores son idénticos a los del camino escalar.
+        
+        Acepta listas o tablas columnares.
+        
+        Returns:
+            Array de utilidades ajustadas, una por acción
+        """
+        tabla = TablaAcciones.como_tabla(acciones)
+        tabla_stakeholders = TablaStakeholders.como_tabla(stakeholders)
+        
+        filas, columnas, valores = self._matriz_impacto(tabla, tabla_stakeholders)
+        
+        florecimiento = tabla_stakeholders.capacidad_florecimiento
+        importancia = tabla_stakeholders.importancia_moral
+        
+        # Σ impacto · florecimiento · importancia por fila
+        contribuciones = valores * florecimiento[columnas] * importancia[columnas]
+        utilidad_total = np.bincount(
+            filas, weights=contribuciones, minlength=len(tabla)
+        )
+        
+        # Ajustar por incertidumbre
+        return utilidad_total * (1 - tabla.incertidumbre * 0.5)
+    
+    def simular_incertidumbre(
+        self,
+        acciones: AccionesLote,
+        stakeholders: StakeholdersLote,
+        n_muestras: int = 1000,
+        semilla: int = 0,
+        cuantiles: Tuple[float, ...] = (0.05, 0.5, 0.95),
+        dispersión: float = 1.0,
+        tamaño_bloque: int = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Monte Carlo de la utilidad cuando las consecuencias son inciertas.
+        
+        Cada consecuencia predicha se trata como una normal centrada en su
+        valor, con desviación `dispersión × incertidumbre` de la acción, e
+        independiente de las demás. La suma ponderada de normales
+        independientes es otra normal, así que cada muestra de utilidad se
+        obtiene con un solo número aleatorio: la distribución es exacta y
+        el coste no depende de cuántas consecuencias tenga cada acción.
+        Las muestras (float32) se generan por bloques de acciones, con una
+        sola llamada a NumPy por bloque; con la misma semilla los
+        resultados son idénticos sea cual sea el tamaño de bloque.
+        
+        Returns:
+            Dict con, por acción: "score" (valor puntual de
+            `evaluar_acción`), "media", "varianza", "cuantiles"
+            (acción × cuantil), "prob_negativa" (utilidad < 0) y
+            "prob_cambio_veredicto" (probabilidad de que el veredicto
+            utilitarista, y con él el consenso, cambie respecto al puntual)
+        """
+        tabla = TablaAcciones.como_tabla(acciones)
+        tabla_stakeholders = TablaStakeholders.como_tabla(stakeholders)
+        n = len(tabla)
+        
+        score = self.evaluar_lote(tabla, tabla_stakeholders)
+        
+        # Peso total de cada clave de consecuencia (un nombre repetido
+        # recibe el mismo impacto en todas sus apariciones)
+        pesos = (
+            tabla_stakeholders.capacidad_florecimiento
+            * tabla_stakeholders.importancia_moral
+        )
+        id_clave = np.array(
+            [tabla._id_clave.get(nombre, -1) for nombre in tabla_stakeholders.nombres],
+            dtype=np.intp
+        )
+        presentes = id_clave >= 0
+        peso_clave = np.bincount(
+            id_clave[presentes], weights=pesos[presentes], minlength=len(tabla.claves)
+        )
+        suma_pesos_cuadrado = np.bincount(
+            tabla.filas(), weights=peso_clave[tabla.índices] ** 2, minlength=n
+        )
+        desviación = (
+            dispersión * tabla.incertidumbre * np.sqrt(suma_pesos_cuadrado)
+            * (1 - tabla.incertidumbre * 0.5)
+        )
+        
+        if tamaño_bloque is None:
+            tamaño_bloque = max(1, 4_000_000 // max(n_muestras, 1))
+        
+        generador = np.random.default_rng(semilla)
+        posiciones = np.asarray(cuantiles, dtype=float) * (n_muestras - 1)
+        bajas = np.floor(posiciones).astype(np.intp)
+        altas = np.ceil(posiciones).astype(np.intp)
+        fracciones = posiciones - bajas
+        
+        resultado = {
+            "score": score,
+            "media": np.empty(n),
+            "varianza": np.empty(n),
+            "cuantiles": np.empty((n, len(cuantiles))),
+            "prob_negativa": np.empty(n),
+            "prob_cambio_veredicto": np.empty(n),
+        }
+        for inicio in range(0, n, tamaño_bloque):
+            fin = min(inicio + tamaño_bloque, n)
+            muestras = generador.standard_normal(
+                (fin - inicio, n_muestras), dtype=np.float32
+            )
+            muestras *= desviación[inicio:fin, None].astype(np.float32)
+            muestras += score[inicio:fin, None].astype(np.float32)
+            
+            resultado["media"][inicio:fin] = muestras.mean(axis=1, dtype=float)
+            resultado["varianza"][inicio:fin] = muestras.var(axis=1, dtype=float)
+            
+            # Ordenar una vez da cuantiles (interpolación lineal) y conteos
+            muestras.sort(axis=1)
+            bajos, altos = muestras[:, bajas], muestras[:, altas]
+            resultado["cuantiles"][inicio:fin] = bajos + (altos - bajos) * fracciones
+            
+            negativas = np.count_nonzero(muestras < 0, axis=1)
+            no_positivas = np.count_nonzero(muestras <= 0, axis=1)
+            resultado["prob_negativa"][inicio:fin] = negativas / n_muestras
+            resultado["prob_cambio_veredicto"][inicio:fin] = np.where(
+                score[inicio:fin] > 0,
+                no_positivas,
+                n_muestras - no_positivas
+            ) / n_muestras
+        
+        return resultado
+    
+    def _matriz_impacto(
+        self,
+        tabla: TablaAcciones,
+        tabla_stakeholders: TablaStakeholders
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Matriz dispersa de impactos (acción × stakeholder) en coordenadas.
+        
+        Traduce las claves de consecuencias a columnas de stakeholders sin
+        recorrer el producto completo acciones × stakeholders. Un nombre
+        repetido en la lista de stakeholders cuenta una vez por aparición,
+        como en `evaluar_acción`. Las entradas quedan ordenadas por
+        (acción, posición del stakeholder).
+        """
+        columnas_por_nombre: Dict[str, List[int]] = {}
+        for j, nombre in enumerate(tabla_stakeholders.nombres):
+            columnas_por_nombre.setdefault(nombre, []).append(j)
+        
+        # Columnas de stakeholder de cada clave, aplanadas
+        por_clave = [columnas_por_nombre.get(clave, ()) for clave in tabla.claves]
+        cuentas = np.array([len(c) for c in por_clave], dtype=np.intp)
+        planas = np.array([j for c in por_clave for j in c], dtype=np.intp)
+        inicios = np.cumsum(cuentas) - cuentas
+        
+        # Repetir cada consecuencia tantas veces como stakeholders la reciben
+        repeticiones = cuentas[tabla.índices]
+        filas = np.repeat(tabla.filas(), repeticiones)
+        valores = np.repeat(tabla.valores, repeticiones)
+        desplazamientos = (
+            np.arange(len(filas), dtype=np.intp)
+            - np.repeat(np.cumsum(repeticiones) - repeticiones, repeticiones)
+        )
+        columnas = planas[np.repeat(inicios[tabla.índices], repeticiones)
+                          + desplazamientos]
+        
+        orden = np.lexsort((columnas, filas))
+        return filas[orden], columnas[orden], valores[orden]
+    
+    def elegir_mejor_acción(
+        self, 
+        acciones: AccionesLote, 
+        stakeholders: StakeholdersLote,
+        top_k: int = None,
+        podar: bool = False
+    ):
+        """
+        Elige la acción con mayor utilidad esperada.
+        
+        Args:
+            top_k: Si se indica, devuelve las `top_k` mejores acciones como
+                lista de (acción, utilidad) ordenada de mayor a menor
+            podar: Solo evalúa las acciones que pueden ganar (ver
+                `elegir_con_poda`); el resultado es el mismo
+        
+        Returns:
+            (acción, utilidad), o lista de pares si se pidió `top_k`
+        """
+        if not isinstance(acciones, TablaAcciones):
+            acciones = list(acciones)
+        
+        if not len(acciones):
+            return [] if top_k is not None else (None, float('-inf'))
+        
+        if podar:
+            mejores, _ = self.elegir_con_poda(acciones, stakeholders, top_k or 1)
+            return mejores if top_k is not None else mejores[0]
+        
+        utilidades = self.evaluar_lote(acciones, stakeholders)
+        
+        if top_k is None:
+            # argmax devuelve el primer máximo, igual que la comparación estricta
+            mejor = int(np.argmax(utilidades))
+            return acciones[mejor], float(utilidades[mejor])
+        
+        índices = self._índices_mejores(utilidades, top_k)
+        return [(acciones[i], float(utilidades[i])) for i in índices]
+    
+    def elegir_con_poda(
+        self,
+        acciones: AccionesLote,
+        stakeholders: StakeholdersLote,
+        top_k: int = 1
+    ) -> Tuple[List[Tuple[Acción, float]], Dict[str, float]]:
+        """
+        Las `top_k` mejores acciones por ramificación y poda.
+        
+        Primero acota la utilidad de cada acción en O(consecuencias): el
+        peso de cada clave es la suma de florecimiento × importancia de los
+        stakeholders con ese nombre, y la cota es la suma de impacto × peso
+        más un margen para el redondeo. Se evalúan exactamente las `top_k`
+        acciones de mayor cota; su peor utilidad es el listón, y solo hace
+        falta evaluar las demás acciones cuya cota lo alcance. Las
+        utilidades son las mismas que las de `evaluar_lote` y los ganadores
+        (con sus desempates) los mismos que los de la búsqueda exhaustiva.
+        
+        Returns:
+            (lista de (acción, utilidad) de mayor a menor, estadísticas),
+            con "total", "evaluadas" y "fracción_podada"
+        """
+        tabla = TablaAcciones.como_tabla(acciones)
+        tabla_stakeholders = TablaStakeholders.como_tabla(stakeholders)
+        n = len(tabla)
+        k = max(0, min(top_k, n))
+        if k == 0:
+            return [], {"total": n, "evaluadas": 0, "fracción_podada": 1.0 if n else 0.0}
+        
+        # Peso total de cada clave
+        id_clave = np.array(
+            [tabla._id_clave.get(nombre, -1) for nombre in tabla_stakeholders.nombres],
+            dtype=np.intp
+        )
+        presentes = id_clave >= 0
+        pesos = (
+            tabla_stakeholders.capacidad_florecimiento
+            * tabla_stakeholders.importancia_moral
+        )
+        peso_clave = np.bincount(
+            id_clave[presentes], weights=pesos[presentes], minlength=len(tabla.claves)
+        )
+        
+        # Cota: la utilidad calculada por claves (otro orden de sumas) más un
+        # margen muy superior a su error de redondeo
+        términos = tabla.valores * peso_clave[tabla.índices]
+        filas = tabla.filas()
+        factor = 1 - tabla.incertidumbre * 0.5
+        aproximada = np.bincount(filas, weights=términos, minlength=n) * factor
+        magnitud = np.bincount(filas, weights=np.abs(términos), minlength=n) * np.abs(factor)
+        cota = aproximada + 1e-9 * magnitud
+        
+        # Las k de mayor cota fijan el listón; el resto solo si lo alcanza
+        primeras = self._índices_mejores(cota, k)
+        utilidades_primeras = self.evaluar_lote(
+            tabla.seleccionar(primeras), tabla_stakeholders
+        )
+        listón = utilidades_primeras.min()
+        
+        restantes = np.flatnonzero(cota >= listón)
+        restantes = restantes[~np.isin(restantes, primeras)]
+        utilidades_restantes = self.evaluar_lote(
+            tabla.seleccionar(restantes), tabla_stakeholders
+        )
+        
+        evaluadas = np.concatenate((primeras, restantes))
+        utilidades = np.concatenate((utilidades_primeras, utilidades_restantes))
+        orden = np.argsort(evaluadas, kind="stable")
+        evaluadas, utilidades = evaluadas[orden], utilidades[orden]
+        
+        mejores = self._índices_mejores(utilidades, k)
+        resultado = [
+            (tabla[i] if acciones is tabla else acciones[i], float(u))
+            for i, u in zip(evaluadas[mejores].tolist(), utilidades[mejores].tolist())
+        ]
+        estadísticas = {
+            "total": n,
+            "evaluadas": len(evaluadas),
+            "fracción_podada": 1 - len(evaluadas) / n,
+        }
+        return resultado, estadísticas
+    
+    @staticmethod
+    def _índices_mejores(utilidades: np.ndarray, k: int) -> np.ndarray:
+        """
+        Índices de las k mayores utilidades, de mayor a menor.
+        
+        Usa argpartition (O(n)) y solo ordena los k elegidos. Los empates
+        se resuelven a favor de la acción que aparece antes.
+        """
+        n = len(utilidades)
+        k = max(0, min(k, n))
+        if k == 0:
+            return np.empty(0, dtype=np.intp)
+        
+        if k < n:
+            umbral = utilidades[np.argpartition(-utilidades, k - 1)[k - 1]]
+            por_encima = np.flatnonzero(utilidades > umbral)
+            empatados = np.flatnonzero(utilidades == umbral)
+            candidatos = np.concatenate(
+                [por_encima, empatados[:k - len(por_encima)]]
+            )
+        else:
+            candidatos = np.arange(n)
+        
+        orden = np.lexsort((candidatos, -utilidades[candidatos]))
+        return candidatos[orden]
+
+
+class EvaluadorIncremental:
+    """
+    Utilidades de un conjunto fijo de acciones que se mantienen al día
+    mientras cambian los stakeholders.
+    
+    Guarda la matriz de impactos indexada por clave de consecuencia
+    (columnas comprimidas, CSC). Al añadir, quitar o modificar un
+    stakeholder solo cambia el peso de su nombre, así que basta sumar
+    impacto × Δpeso a las acciones que lo mencionan: el coste es
+    O(acciones afectadas · log n), no O(acciones × stakeholders). La mejor
+    acción y el top-k se sirven desde un montículo con entradas perezosas.
+    
+    Las sumas incrementales acumulan redondeo (del orden de 1e-15 por
+    actualización); `recalcular()` vuelve a los valores exactos de
+    `Utilitarismo.evaluar_lote`.
+    """
+    
+    def __init__(
+        self,
+        acciones: AccionesLote,
+        stakeholders: StakeholdersLote,
+        utilitarismo: Utilitarismo = None
+    ):
+        self.utilitarismo = utilitarismo or Utilitarismo()
+        self.acciones = TablaAcciones.como_tabla(acciones)
+        self.stakeholders: List[Stakeholder] = [
+            replace(s) for s in TablaStakeholders.como_tabla(stakeholders)
+        ]
+        self._por_nombre: Dict[str, List[Stakeholder]] = {}
+        for stakeholder in self.stakeholders:
+            self._por_nombre.setdefault(stakeholder.nombre, []).append(stakeholder)
+        
+        # Matriz de impactos por columnas: acciones y valores de cada clave
+        tabla = self.acciones
+        orden = np.argsort(tabla.índices, kind="stable")
+        self._filas_por_clave = tabla.filas()[orden]
+        self._valores_por_clave = tabla.valores[orden]
+        self._inicio_clave = np.concatenate((
+            [0], np.cumsum(np.bincount(tabla.índices, minlength=len(tabla.claves)))
+        ))
+        self._factor = 1 - tabla.incertidumbre * 0.5
+        
+        self.recalcular()
+    
+    def recalcular(self) -> None:
+        """Recalcula todas las utilidades desde cero y rehace el montículo"""
+        self.utilidades = self.utilitarismo.evaluar_lote(self.acciones, self.stakeholders)
+        self._versión = np.zeros(len(self.acciones), dtype=np.int64)
+        self._montículo = [
+            (-u, i, 0) for i, u in enumerate(self.utilidades.tolist())
+        ]
+        heapq.heapify(self._montículo)
+    
+    # ------------------------------------------------------------------
+    # Cambios en los stakeholders
+    # ------------------------------------------------------------------
+    
+    def agregar_stakeholder(self, stakeholder: Stakeholder) -> None:
+        stakeholder = replace(stakeholder)
+        self.stakeholders.append(stakeholder)
+        self._por_nombre.setdefault(stakeholder.nombre, []).append(stakeholder)
+        self._aplicar(stakeholder.nombre, self._peso(stakeholder))
+    
+    def eliminar_stakeholder(self, nombre: str) -> Stakeholder:
+        """Quita el primer stakeholder con ese nombre y lo devuelve"""
+        stakeholder = self._buscar(nombre)
+        self._por_nombre[nombre].remove(stakeholder)
+        if not self._por_nombre[nombre]:
+            del self._por_nombre[nombre]
+        self.stakeholders.remove(stakeholder)
+        self._aplicar(nombre, -self._peso(stakeholder))
+        return stakeholder
+    
+    def actualizar_stakeholder(self, nombre: str, **cambios) -> None:
+        """
+        Modifica el primer stakeholder con ese nombre, p. ej.
+        `actualizar_stakeholder("usuarios", importancia_moral=0.8)`.
+        """
+        if "nombre" in cambios:
+            raise ValueError("Para renombrar, elimina el stakeholder y agrégalo de nuevo")
+        stakeholder = self._buscar(nombre)
+        anterior = self._peso(stakeholder)
+        for campo, valor in cambios.items():
+            setattr(stakeholder, campo, valor)
+        self._aplicar(nombre, self._peso(stakeholder) - anterior)
+    
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+    
+    def mejor_acción(self) -> Tuple[Acción, float]:
+        """Como `Utilitarismo.elegir_mejor_acción` sin `top_k`"""
+        mejores = self.top_k(1)
+        return mejores[0] if mejores else (None, float('-inf'))
+    
+    def top_k(self, k: int) -> List[Tuple[Acción, float]]:
+        """
+        Las k acciones de mayor utilidad, de mayor a menor; los empates se
+        resuelven a favor de la acción que aparece antes.
+        """
+        elegidos = []
+        while self._montículo and len(elegidos) < k:
+            entrada = heapq.heappop(self._montículo)
+            if entrada[2] == self._versión[entrada[1]]:
+                elegidos.append(entrada)
+        for entrada in elegidos:
+            heapq.heappush(self._montículo, entrada)
+        return [(self.acciones[i], -menos_u) for menos_u, i, _ in elegidos]
+    
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _peso(stakeholder: Stakeholder) -> float:
+        return stakeholder.capacidad_florecimiento * stakeholder.importancia_moral
+    
+    def _buscar(self, nombre: str) -> Stakeholder:
+        try:
+            return self._por_nombre[nombre][0]
+        except KeyError:
+            raise KeyError(f"No hay ningún stakeholder llamado {nombre!r}") from None
+    
+    def _aplicar(self, nombre: str, delta_peso: float) -> None:
+        """Suma impacto × Δpeso a las acciones con consecuencias para `nombre`"""
+        id_clave = self.acciones._id_clave.get(nombre)
+        if id_clave is None or delta_peso == 0:
+            return
+        
+        inicio, fin = self._inicio_clave[id_clave], self._inicio_clave[id_clave + 1]
+        filas = self._filas_por_clave[inicio:fin]
+        self.utilidades[filas] += (
+            self._valores_por_clave[inicio:fin] * delta_peso * self._factor[filas]
+        )
+        
+        self._versión[filas] += 1
+        for i, u, versión in zip(
+            filas.tolist(),
+            self.utilidades[filas].tolist(),
+            self._versión[filas].tolist()
+        ):
+            heapq.heappush(self._montículo, (-u, i, versión))
+        
+        # Las entradas obsoletas se descartan al consultar; si se acumulan
+        # demasiadas, se rehace el montículo
+        if len(self._montículo) > 4 * len(self.acciones) + 64:
+            self._montículo = [
+                (-u, i, versión) for i, (u, versión) in enumerate(
+                    zip(self.utilidades.tolist(), self._versión.tolist())
+                )
+            ]
+            heapq.heapify(self._montículo)
@@ -0,0 +1,221 @@
+"""
+3. Ética de la virtud: basado en carácter y excelencia.
+"""
+
+from __future__ import annotations
+
+from typing import List, Dict, Any
+
+from ._numpy import np
+from .utilidades import Acción, DetectorMarcadores
+from .tablas import AccionesLote, TablaAcciones
+
+
+class ÉticaVirtud:
+    """
+    Filosofía: No preguntes "¿qué debo hacer?" sino "¿qué tipo de ser debo ser?"
+    
+    Inspirada en Aristóteles: cultiva virtudes (coraje, sabiduría, justicia,
+    templanza, generosidad, etc.) y actúa como lo haría una persona virtuosa.
+    
+    Fortalezas:
+    - Holística (carácter, no solo actos)
+    - Flexible y contextual
+    - Énfasis en desarrollo moral
+    
+    Debilidades:
+    - Menos guía concreta para decisiones
+    - ¿Quién decide qué es virtuoso?
+    - Puede ser subjetiva
+    """
+    
+    MARCADORES_VIRTUD = {
+        "sabiduría_práctica": ["considerar", "analizar", "prudente", "reflexivo"],
+        "coraje": ["enfrentar", "defender", "arriesgar"],
+        "compasión": ["ayudar", "cuidar", "aliviar", "proteger"],
+        "honestidad": ["verdad", "transparente", "honesto", "claro"],
+    }
+    
+    def __init__(self):
+        self.virtudes = {
+            "sabiduría_práctica": {
+                "descripción": "Juicio prudente en situaciones concretas",
+                "opuesto": "imprudencia/astucia",
+                "importancia": 1.0
+            },
+            "coraje": {
+                "descripción": "Enfrentar peligros apropiadamente",
+                "opuesto": "cobardía/imprudencia",
+                "importancia": 0.8
+            },
+            "templanza": {
+                "descripción": "Moderación en placeres",
+                "opuesto": "indulgencia/insensibilidad",
+                "importancia": 0.7
+            },
+            "justicia": {
+                "descripción": "Dar a cada uno lo debido",
+                "opuesto": "injusticia",
+                "importancia": 0.95
+            },
+            "generosidad": {
+                "descripción": "Dar apropiadamente",
+                "opuesto": "tacañería/desperdicio",
+                "importancia": 0.6
+            },
+            "honestidad": {
+                "descripción": "Verdad en palabra y acción",
+                "opuesto": "deshonestidad",
+                "importancia": 0.9
+            },
+            "compasión": {
+                "descripción": "Empatía y cuidado por otros",
+                "opuesto": "crueldad/indiferencia",
+                "importancia": 0.85
+            },
+        }
+        self._detector = DetectorMarcadores({
+            ("virtud", virtud): palabras
+            for virtud, palabras in self.MARCADORES_VIRTUD.items()
+        })
+    
+    def evaluar_acción(self, acción: Acción, agente: str = "AGI") -> Dict:
+        """
+        Evalúa qué virtudes expresa o viola una acción.
+        """
+        virtudes_expresadas = []
+        virtudes_violadas = []
+        
+        for virtud, config in self.virtudes.items():
+            expresión = self._mide_expresión_virtud(acción, virtud)
+            
+            if expresión > 0.5:
+                virtudes_expresadas.append({
+                    "virtud": virtud,
+                    "grado": expresión,
+                    "descripción": config["descripción"]
+                })
+            elif expresión < -0.5:
+                virtudes_violadas.append({
+                    "virtud": virtud,
+                    "grado": abs(expresión),
+                    "descripción": f"Expresa {config['opuesto']}"
+                })
+        
+        return {
+            "virtudes_expresadas": virtudes_expresadas,
+            "virtudes_violadas": virtudes_violadas,
+            "cultiva_carácter": len(virtudes_expresadas) > len(virtudes_violadas),
+            "consejo": self._consejo_virtuoso(acción)
+        }
+    
+    def evaluar_lote(
+        self,
+        acciones: AccionesLote,
+        coincidencias: List[Dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Evalúa muchas acciones a la vez.
+        
+        Args:
+            coincidencias: Marcadores de cada descripción ya detectados por
+                un detector compartido; si se omiten, se detectan aquí
+        
+        Returns:
+            Dict con "virtudes", la matriz "expresión" (acción × virtud)
+            y "cultiva_carácter"
+        """
+        tabla = TablaAcciones.como_tabla(acciones)
+        virtudes = list(self.virtudes)
+        
+        if coincidencias is None:
+            coincidencias = [self._detector.coincidencias(d) for d in tabla.descripciones]
+        
+        expresión = np.zeros((len(tabla), len(virtudes)))
+        for i, marcadores in enumerate(coincidencias):
+            for v, virtud in enumerate(virtudes):
+                matches = len(marcadores.get(("virtud", virtud), ()))
+                expresión[i, v] = min(matches * 0.3, 1.0)
+        
+        expresadas = (expresión > 0.5).sum(axis=1)
+        violadas = (expresión < -0.5).sum(axis=1)
+        
+        return {
+            "virtudes": virtudes,
+            "expresión": expresión,
+            "cultiva_carácter": expresadas > violadas,
+        }
+    
+    def _resultado_fila(self, lote: Dict[str, Any], i: int, acción: Acción) -> Dict:
+        """Reconstruye el resultado de `evaluar_acción` para la fila i"""
+        virtudes_expresadas = []
+        virtudes_violadas = []
+        
+        for virtud, expresión in zip(lote["virtudes"], lote["expresión"][i].tolist()):
+            config = self.virtudes[virtud]
+            if expresión > 0.5:
+                virtudes_expresadas.append({
+                    "virtud": virtud,
+                    "grado": expresión,
+                    "descripción": config["descripción"]
+                })
+            elif expresión < -0.5:
+                virtudes_violadas.append({
+                    "virtud": virtud,
+                    "grado": abs(expresión),
+                    "descripción": f"Expresa {config['opuesto']}"
+                })
+        
+        return {
+            "virtudes_expresadas": virtudes_expresadas,
+            "virtudes_violadas": virtudes_violadas,
+            "cultiva_carácter": bool(lote["cultiva_carácter"][i]),
+            "consejo": self._consejo_virtuoso(acción)
+        }
+    
+    def _mide_expresión_virtud(self, acción: Acción, virtud: str) -> float:
+        """
+        Mide en qué grado una acción expresa una virtud.
+        
+        Returns: -1.0 (vicio) a 1.0 (virtud plena)
+        """
+        # Implementación simplificada basada en palabras clave
+        coincidencias = self._detector.coincidencias(acción.descripción)
+        matches = len(coincidencias.get(("virtud", virtud), ()))
+        return min(matches * 0.3, 1.0)
+    
+    def _consejo_virtuoso(self, acción: Acción) -> str:
+        """Pregunta: ¿qué haría una persona sabia y virtuosa?"""
+        return (
+            "Pregúntate: ¿Esta acción refleja sabiduría, justicia, y compasión? "
+            "¿Te acerca a ser el tipo de agente que quieres ser?"
+        )
+    
+    def justo_medio_aristotélico(self, situación: str) -> str:
+        """
+        Doctrina del justo medio: la virtud está entre dos extremos viciosos.
+        
+        Ejemplo: Coraje está entre cobardía (defecto) e imprudencia (exceso)
+        """
+        ejemplos = {
+            "enfrentar_peligro": {
+                "defecto": "Cobardía (huir siempre)",
+                "virtud": "Coraje (enfrentar cuando apropiado)",
+                "exceso": "Imprudencia (riesgo innecesario)"
+            },
+            "dar_recursos": {
+                "defecto": "Tacañería (nunca compartir)",
+                "virtud": "Generosidad (dar apropiadamente)",
+                "exceso": "Desperdicio (dar inapropiadamente)"
+            },
+            "placer": {
+                "defecto": "Insensibilidad (nunca disfrutar)",
+                "virtud": "Templanza (disfrutar moderadamente)",
+                "exceso": "Indulgencia (hedonismo)"
+            },
+        }
+        
+        return ejemplos.get(
+            situación, 
+            "Busca el punto medio virtuoso entre defecto y exceso"
+        )